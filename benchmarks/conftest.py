@@ -0,0 +1,78 @@
+"""
+Options and site data of the pytest-benchmark suites in this directory.
+
+The suites run on the files ``benchmarks.synthetic_data`` writes for one site,
+generated into ``--site-dir`` when it does not hold a site yet. Timings are
+only comparable between runs on the same machine, data range and pandas
+version, which every saved run records in its machine info.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_data import enphase_daily_file, generate_site, parse_span, solar_data_file
+from src.config.enphase_constants import enphase_15min_file
+from src.config.modeling_constants import hourly_features_file
+from src.config.openweather_weather_constants import openweather_data_file
+from src.modeling.feature_pipeline import build_hourly_features, build_merged_hourly_data
+from src.utils.pandas_options import enable_copy_on_write
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+default_site_dir = os.path.join(project_root, "data", "synthetic", "bench")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("site data")
+    group.addoption("--site-dir", default=default_site_dir, help="Site directory, generated when missing")
+    group.addoption("--site-span", default="1Y", help="Span of generated data, from 1M to 10Y")
+
+
+def pytest_configure(config):
+    # As in every entry point that runs the analytics code
+    enable_copy_on_write()
+    try:
+        parse_span(config.getoption("--site-span"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+
+def site_files(site_dir):
+    return {
+        "studer": os.path.join(site_dir, "studer"),
+        "enphase_15min": os.path.join(site_dir, "enphase", enphase_15min_file),
+        "enphase_daily": os.path.join(site_dir, "enphase", enphase_daily_file),
+        "solar": os.path.join(site_dir, "solar", solar_data_file),
+        "weather": os.path.join(site_dir, "weather", openweather_data_file),
+        "hourly_features": os.path.join(site_dir, "processed", hourly_features_file),
+    }
+
+
+def data_range(files):
+    """First and last day of the site's Studer files"""
+    if not os.path.isdir(files["studer"]):
+        return []
+    days = sorted(name[:8] for name in os.listdir(files["studer"]) if name.lower().endswith(".csv"))
+    return [days[0], days[-1]] if days else []
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info["pandas"] = pd.__version__
+    machine_info["numpy"] = np.__version__
+    machine_info["data_range"] = data_range(site_files(config.getoption("--site-dir")))
+
+
+@pytest.fixture(scope="session")
+def site(request):
+    """Paths of the site's files, generating the site and its hourly features unless they exist"""
+    site_dir = request.config.getoption("--site-dir")
+    files = site_files(site_dir)
+    if not os.path.isdir(files["studer"]):
+        start = pd.Timestamp("2023-01-01")
+        generate_site(site_dir, start, start + parse_span(request.config.getoption("--site-span")), seed=42)
+    if not os.path.exists(files["hourly_features"]):
+        merged = build_merged_hourly_data(files["studer"], files["enphase_15min"], files["weather"])
+        os.makedirs(os.path.dirname(files["hourly_features"]), exist_ok=True)
+        build_hourly_features(merged).to_csv(files["hourly_features"])
+    return files
@@ -0,0 +1,306 @@
+"""
+Load test of the Streamlit app with concurrent scripted sessions.
+
+Starts ``--sessions`` sessions of ``src/visualization/home.py`` with Streamlit's
+``AppTest``, each in its own thread, and has every session walk through the
+selected pages: open the page, pick random date ranges, switch sections and
+metrics. All sessions share the process's ``st.cache_data`` /
+``st.cache_resource`` caches and the background worker pool, as sessions of
+one server do. Every rerun's latency is recorded; when a rerun leaves a
+background job running (a progress bar), the session keeps rerunning every
+``poll_interval_seconds``, as the progress fragment would, and the time until
+the results are shown is recorded as the step's settle time.
+
+A sampler thread records the RSS of the process and of its worker processes
+while the test runs. The report lists latency percentiles per page and step,
+errors, and memory; ``--output`` saves it as JSON and ``--compare`` prints the
+change of each p95 against a saved report, so caching and precompute changes
+can be measured under the same load.
+
+AppTest runs the page scripts in this process, so the sessions contend for the
+GIL as the script threads of one Streamlit server do; it does not include
+websocket or browser rendering time.
+
+Usage:
+    python -m benchmarks.dashboard_load_test --sessions 8 --iterations 3
+    python -m benchmarks.dashboard_load_test --sessions 4 --page "Grid Metric Dashboard" --output results/load.json
+    python -m benchmarks.dashboard_load_test --sessions 8 --compare results/load.json
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import threading
+import time
+import traceback
+
+import numpy as np
+import pandas as pd
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+
+from src.utils.background_jobs import poll_interval_seconds
+from src.utils.memory_accounting import child_processes, process_rss
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+home_script = os.path.join(project_root, "src", "visualization", "home.py")
+
+load_test_pages = [
+    "Grid Metric Dashboard",
+    "Enphase Dashboard",
+    "Weather Dashboard - Open Weather",
+    "Forecast Dashboard",
+]
+latency_percentiles = [50, 90, 95, 99]
+memory_sample_seconds = 0.25
+max_settle_seconds = 300
+
+
+class MemorySampler(threading.Thread):
+    """Samples the RSS of this process and of its children until stopped"""
+
+    def __init__(self, interval=memory_sample_seconds):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        start = time.perf_counter()
+        while not self._stop_event.is_set():
+            children = [process_rss(pid) for pid in child_processes()]
+            self.samples.append(
+                {
+                    "seconds": time.perf_counter() - start,
+                    "rss_bytes": process_rss(),
+                    "children_rss_bytes": sum(rss for rss in children if rss),
+                }
+            )
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def summary(self):
+        if not self.samples:
+            return {}
+        rss = [sample["rss_bytes"] or 0 for sample in self.samples]
+        total = [sample["rss_bytes"] + sample["children_rss_bytes"] for sample in self.samples if sample["rss_bytes"]]
+        return {
+            "start_mb": rss[0] / 1e6,
+            "end_mb": rss[-1] / 1e6,
+            "peak_mb": max(rss) / 1e6,
+            "mean_mb": sum(rss) / len(rss) / 1e6,
+            "peak_with_workers_mb": max(total) / 1e6 if total else None,
+        }
+
+
+class LoadTestSession:
+    """One scripted browser session; appends a record per rerun to ``records``"""
+
+    def __init__(self, number, pages, iterations, seed, timeout):
+        self.number = number
+        self.pages = pages
+        self.iterations = iterations
+        self.rng = random.Random(seed * 1000 + number)
+        self.timeout = timeout
+        self.records = []
+        self.date_bounds = {}
+
+    def rerun(self, app, page, step):
+        """Rerun ``app`` and, while a background job is in progress, poll until it finishes"""
+        start = time.perf_counter()
+        app.run(timeout=self.timeout)
+        latency = time.perf_counter() - start
+        polls = 0
+        while app.get("progress") and time.perf_counter() - start < max_settle_seconds:
+            time.sleep(poll_interval_seconds)
+            app.run(timeout=self.timeout)
+            polls += 1
+        self.records.append(
+            {
+                "session": self.number,
+                "page": page,
+                "step": step,
+                "latency": latency,
+                "settle": time.perf_counter() - start,
+                "polls": polls,
+                "errors": [str(exception.value)[:200] for exception in app.exception]
+                + [error.value[:200] for error in app.error],
+            }
+        )
+
+    def random_date_range(self, page):
+        first, last = self.date_bounds[page]
+        days = (last - first).days
+        start = first + datetime.timedelta(days=self.rng.randint(0, max(days - 1, 0)))
+        end = start + datetime.timedelta(days=self.rng.randint(0, max((last - start).days, 0)))
+        return start, end
+
+    def page_steps(self, app, page):
+        """(step name, widget action) pairs of one visit of ``page``, after it is open"""
+        steps = []
+        if len(app.date_input) >= 2:
+            if page not in self.date_bounds:
+                self.date_bounds[page] = (app.date_input[0].value, app.date_input[1].value)
+
+            def change_date_range():
+                start, end = self.random_date_range(page)
+                app.date_input[0].set_value(start)
+                app.date_input[1].set_value(end)
+
+            steps.append(("change date range", change_date_range))
+        if len(app.radio):
+            section = app.radio[0]
+            steps.append(("switch section", lambda: section.set_value(self.rng.choice(section.options))))
+        metric_selects = [select for select in app.main.selectbox if select.label.startswith("Select")]
+        if metric_selects:
+            select = metric_selects[0]
+            steps.append(("change metric", lambda: select.set_value(self.rng.choice(select.options))))
+        return steps
+
+    def run(self):
+        app = AppTest.from_file(home_script, default_timeout=self.timeout)
+        self.rerun(app, "Home", "open")
+        for _ in range(self.iterations):
+            for page in self.rng.sample(self.pages, len(self.pages)):
+                app.sidebar.selectbox[0].set_value(page)
+                self.rerun(app, page, "open")
+                # Widgets are looked up again after each rerun, as they are re-created
+                for step in [name for name, _ in self.page_steps(app, page)]:
+                    action = dict(self.page_steps(app, page)).get(step)
+                    if action is None:
+                        continue
+                    action()
+                    self.rerun(app, page, step)
+
+
+def latency_table(records, column):
+    """Percentiles of ``column`` in seconds per page and step, plus an overall row"""
+    data = pd.DataFrame(records)
+    groups = [("all", "all", data)] + [(page, step, rows) for (page, step), rows in data.groupby(["page", "step"])]
+    rows = []
+    for page, step, group in groups:
+        values = group[column].to_numpy()
+        row = {"page": page, "step": step, "reruns": len(values)}
+        for percentile in latency_percentiles:
+            row[f"p{percentile}"] = float(np.percentile(values, percentile))
+        row["max"] = float(values.max())
+        row["errors"] = int(group["errors"].map(len).gt(0).sum())
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def run_load_test(sessions, pages, iterations, seed=42, timeout=300, ramp_seconds=0.0):
+    """Run the sessions concurrently; returns (records, memory summary, wall seconds)"""
+    load_sessions = [LoadTestSession(number, pages, iterations, seed, timeout) for number in range(sessions)]
+    failures = []
+
+    def run_session(session):
+        try:
+            session.run()
+        except Exception as e:
+            failures.append(f"session {session.number}: {e!r}\n{traceback.format_exc(limit=-3)}")
+
+    sampler = MemorySampler()
+    sampler.start()
+    start = time.perf_counter()
+    threads = []
+    for session in load_sessions:
+        thread = threading.Thread(target=run_session, args=(session,), name=f"load-session-{session.number}")
+        thread.start()
+        threads.append(thread)
+        if ramp_seconds:
+            time.sleep(ramp_seconds / sessions)
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - start
+    sampler.stop()
+
+    for failure in failures:
+        print(f"Failed {failure}")
+    records = [record for session in load_sessions for record in session.records]
+    return records, sampler.summary(), wall_seconds
+
+
+def compare_with_baseline(table, baseline):
+    baseline_rows = {(row["page"], row["step"]): row for row in baseline["settle"]}
+    print(f"\nSettle p95 compared with the baseline of {baseline.get('generated_at')} ({baseline.get('sessions')} sessions):")
+    print(f"{'page':<36}{'step':<20}{'p95 s':>9}{'baseline':>10}{'change':>10}")
+    for row in table.to_dict("records"):
+        previous = baseline_rows.get((row["page"], row["step"]))
+        if previous is None:
+            print(f"{row['page']:<36}{row['step']:<20}{row['p95']:>9.2f}{'new':>10}")
+            continue
+        change = row["p95"] / previous["p95"] - 1 if previous["p95"] else float("nan")
+        print(f"{row['page']:<36}{row['step']:<20}{row['p95']:>9.2f}{previous['p95']:>10.2f}{change:>+10.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=2, help="Visits of every page per session")
+    parser.add_argument("--page", action="append", choices=load_test_pages, help="Only visit these pages")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=300, help="Seconds a single rerun may take")
+    parser.add_argument("--ramp-seconds", type=float, default=0.0, help="Spread the session starts over this time")
+    parser.add_argument("--output", help="Save the report as JSON")
+    parser.add_argument("--compare", help="Report of an earlier run to compare with")
+    args = parser.parse_args()
+
+    # Page scripts run with the caller's cwd on sys.path, as under `streamlit run`
+    os.chdir(project_root)
+    # AppTest sessions run without a server, which Streamlit warns about on every thread
+    set_log_level("error")
+
+    records, memory, wall_seconds = run_load_test(
+        args.sessions, args.page or load_test_pages, args.iterations, args.seed, args.timeout, args.ramp_seconds
+    )
+    if not records:
+        raise SystemExit("No rerun completed")
+
+    latency = latency_table(records, "latency")
+    settle = latency_table(records, "settle")
+    print(f"{args.sessions} sessions, {len(records)} reruns in {wall_seconds:.1f} s")
+    print("\nRerun latency (s):")
+    print(latency.to_string(index=False, float_format="{:.2f}".format))
+    print("\nTime until results are shown (s):")
+    print(settle.to_string(index=False, float_format="{:.2f}".format))
+    if memory:
+        print(
+            f"\nMemory: {memory['start_mb']:.0f} MB at start, {memory['peak_mb']:.0f} MB peak, "
+            f"{memory['end_mb']:.0f} MB at end, {memory['peak_with_workers_mb']:.0f} MB peak with worker processes"
+        )
+    errors = sorted({error for record in records for error in record["errors"]})
+    for error in errors[:10]:
+        print(f"Error: {error}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "generated_at": pd.Timestamp.now().isoformat(),
+                    "sessions": args.sessions,
+                    "iterations": args.iterations,
+                    "pages": args.page or load_test_pages,
+                    "wall_seconds": wall_seconds,
+                    "memory": memory,
+                    "latency": latency.to_dict("records"),
+                    "settle": settle.to_dict("records"),
+                    "reruns": records,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        compare_with_baseline(settle, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Compare the categorical weather and time-of-day encoders in
+``src.utils.feature_engineering`` against the previous row-wise implementations
+on a wide synthetic feature matrix.
+
+Usage:
+    python -m benchmarks.feature_encoders_benchmark --rows 100000 --columns 300
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.utils.feature_engineering import (
+    add_time_of_day_features,
+    add_weather_severity_feature,
+    add_weather_intensity_feature,
+)
+from src.utils.pandas_options import enable_copy_on_write
+
+
+def legacy_add_time_of_day_features(df, time_col):
+    df["time_of_day"] = pd.cut(
+        df["hour"],
+        bins=[0, 6, 12, 18, 24],
+        labels=["night", "morning", "afternoon", "evening"],
+        include_lowest=True,
+    )
+
+    df = pd.get_dummies(df, columns=["time_of_day"], dtype=int)
+    return df
+
+
+def legacy_add_weather_severity_feature(df, col):
+    weather_severity = {
+        "Clear": 0,
+        "Clouds": 1,
+        "Mist": 2,
+        "Fog": 3,
+        "Haze": 3,
+        "Drizzle": 4,
+        "Rain": 5,
+        "Thunderstorm": 6,
+    }
+
+    df["weather_severity"] = df[col].map(weather_severity).fillna(0)
+    return df
+
+
+def legacy_add_weather_intensity_feature(df, col):
+    def extract_weather_intensity(description):
+        if "light" in description.lower():
+            return 0.5
+        elif "heavy" in description.lower():
+            return 1.5
+        else:
+            return 1.0
+
+    df["weather_intensity"] = df[col].apply(extract_weather_intensity)
+
+    return df
+
+
+def make_feature_matrix(rows, columns, seed=42):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-01", periods=rows, freq="h")
+    df = pd.DataFrame(
+        rng.normal(size=(rows, columns)),
+        index=index,
+        columns=[f"feature_{i}" for i in range(columns)],
+    )
+    df["hour"] = index.hour
+    df["weather_main"] = rng.choice(
+        ["Clear", "Clouds", "Mist", "Haze", "Rain", "Thunderstorm", "Smoke"], rows
+    )
+    df["weather_description"] = rng.choice(
+        ["clear sky", "few clouds", "light rain", "heavy intensity rain", "haze", "mist"],
+        rows,
+    )
+    return df
+
+
+def measure(func, df, *args):
+    """Run ``func`` on a fresh copy of ``df``; return (result, seconds, peak bytes)."""
+    df = df.copy()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(df, *args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=300)
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    df = make_feature_matrix(args.rows, args.columns)
+    cases = [
+        ("time_of_day", legacy_add_time_of_day_features, add_time_of_day_features, "hour"),
+        ("weather_severity", legacy_add_weather_severity_feature, add_weather_severity_feature, "weather_main"),
+        ("weather_intensity", legacy_add_weather_intensity_feature, add_weather_intensity_feature, "weather_description"),
+    ]
+
+    print(f"Feature matrix: {args.rows} rows x {df.shape[1]} columns")
+    print(f"{'encoder':<20}{'legacy s':>10}{'new s':>10}{'legacy MiB':>12}{'new MiB':>10}")
+    for name, legacy, current, col in cases:
+        expected, legacy_time, legacy_peak = measure(legacy, df, col)
+        result, new_time, new_peak = measure(current, df, col)
+        pd.testing.assert_frame_equal(
+            expected, result, check_dtype=False, check_like=False
+        )
+        print(
+            f"{name:<20}{legacy_time:>10.3f}{new_time:>10.3f}"
+            f"{legacy_peak / 2**20:>12.1f}{new_peak / 2**20:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
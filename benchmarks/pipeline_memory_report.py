@@ -0,0 +1,102 @@
+"""
+Per-stage memory report of the ingestion-to-features pipeline and of the
+dashboards' date filtering.
+
+Runs ``build_merged_hourly_data`` and ``build_hourly_features`` under a
+``MemoryAccountant``, then the date-range filters the grid and Enphase
+dashboards apply to their loaded data, and prints every stage's output size,
+the part of it that was copied, the RSS change and whether the stage is among
+the largest copies. ``--output`` saves the report as JSON; ``--baseline``
+compares the run against a report saved by an earlier release and, with
+``--check``, fails when the pipeline copies more than ``--max-growth`` more.
+
+Usage:
+    python -m benchmarks.pipeline_memory_report --output results/pipeline_memory.json
+    python -m benchmarks.pipeline_memory_report --baseline results/pipeline_memory.json --check
+"""
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+
+from src.config.enphase_constants import enphase_15min_file
+from src.modeling.feature_pipeline import (
+    build_hourly_features,
+    build_merged_hourly_data,
+    default_studer_data_dir,
+)
+from src.utils.data_reader import read_enphase_15min_data_file, read_filtered_studer_data_directory
+from src.utils.memory_accounting import MemoryAccountant
+from src.utils.pandas_options import enable_copy_on_write
+
+
+def account_dashboard_filters(accountant, studer_data_dir):
+    """The full-range selection each dashboard makes on its shared frame"""
+    studer_data = read_filtered_studer_data_directory(studer_data_dir)
+    start_date = studer_data.index.min().normalize()
+    end_date = studer_data.index.max().normalize() + pd.Timedelta(hours=23, minutes=59, seconds=59)
+    mask = (studer_data.index >= start_date) & (studer_data.index <= end_date)
+    accountant.record("grid dashboard .loc[mask]", studer_data.loc[mask], [studer_data])
+
+    enphase_data = read_enphase_15min_data_file(enphase_15min_file)
+    start_date, end_date = enphase_data.index.min().date(), enphase_data.index.max().date()
+    accountant.record("enphase dashboard .loc[start:end]", enphase_data.loc[start_date:end_date], [enphase_data])
+
+
+def compare_with_baseline(records, baseline):
+    baseline_stages = {record["stage"]: record for record in baseline["stages"]}
+    print(f"\nCompared with the baseline of {baseline.get('generated_at')} (pandas {baseline.get('pandas')}):")
+    print(f"{'stage':<40}{'copied MB':>12}{'baseline':>12}{'change':>12}")
+    for record in records:
+        previous = baseline_stages.get(record["stage"])
+        if previous is None:
+            print(f"{record['stage']:<40}{record['copied_bytes'] / 1e6:>12.3f}{'new':>12}")
+            continue
+        change = (record["copied_bytes"] - previous["copied_bytes"]) / 1e6
+        print(
+            f"{record['stage']:<40}{record['copied_bytes'] / 1e6:>12.3f}"
+            f"{previous['copied_bytes'] / 1e6:>12.3f}{change:>+12.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--studer-data-dir", default=default_studer_data_dir)
+    parser.add_argument("--output", help="Save the report as JSON")
+    parser.add_argument("--baseline", help="Report of an earlier run to compare with")
+    parser.add_argument("--check", action="store_true", help="Fail when copies grew beyond --max-growth")
+    parser.add_argument("--max-growth", type=float, default=0.1, help="Allowed relative growth of copied bytes")
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    accountant = MemoryAccountant("feature_pipeline")
+    merged = build_merged_hourly_data(args.studer_data_dir, accountant=accountant)
+    features = build_hourly_features(merged, accountant=accountant)
+    del merged
+    account_dashboard_filters(accountant, args.studer_data_dir)
+
+    print(accountant.report().to_string(index=False, float_format="{:.3f}".format))
+    print(f"\nLargest copies: {', '.join(accountant.flagged_stages()) or 'none'}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(accountant.to_json(rows=len(features), studer_data_dir=args.studer_data_dir))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        compare_with_baseline(accountant.records, baseline)
+        copied = sum(record["copied_bytes"] for record in accountant.records if record["input_bytes"])
+        baseline_copied = sum(record["copied_bytes"] for record in baseline["stages"] if record.get("input_bytes"))
+        if args.check:
+            if baseline_copied and copied > baseline_copied * (1 + args.max_growth):
+                print(f"Memory check failed: {copied / 1e6:.1f} MB copied vs {baseline_copied / 1e6:.1f} MB")
+                sys.exit(1)
+            print("Memory check passed")
+
+
+if __name__ == "__main__":
+    main()
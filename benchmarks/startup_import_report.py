@@ -0,0 +1,111 @@
+"""
+Cold-start import report for the Streamlit app.
+
+Imports the home page and each dashboard module in a fresh interpreter with
+``python -X importtime`` and prints the wall-clock import time, the heavy
+packages that got loaded and the slowest top-level packages. Importing
+``src.visualization.home`` renders the Home page in Streamlit's bare mode,
+which is what a new session does before any dashboard is selected.
+
+With ``--check`` the report doubles as the cold-start regression check: it
+exits non-zero when the home page loads one of ``heavy_packages`` or takes
+longer than ``--max-seconds`` to import.
+
+Usage:
+    python -m benchmarks.startup_import_report --top 8
+    python -m benchmarks.startup_import_report --check --max-seconds 2
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+home_module = "src.visualization.home"
+dashboard_modules = [
+    "src.visualization.enphase_dashboard",
+    "src.visualization.grid_metrics_dashboard",
+    "src.visualization.weather_dashboard_open_weather",
+    "src.visualization.forecast_dashboard",
+]
+
+# Dependencies only dashboards need; the home page must not load them
+heavy_packages = ["statsmodels", "scipy", "matplotlib", "sklearn", "xgboost", "seaborn"]
+
+_probe = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split(".")[0] for name in sys.modules}})
+print(json.dumps({{"seconds": elapsed, "packages": loaded}}))
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Cumulative import time in seconds of each top-level package.
+
+    ``-X importtime`` lines look like
+    ``import time: self [us] | cumulative | <indent>package``; the outermost
+    import of a package carries the largest cumulative time.
+    """
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        totals[package] = max(totals.get(package, 0.0), int(cumulative) / 1e6)
+    return totals
+
+
+def profile_import(module):
+    """Import ``module`` in a fresh interpreter; return (seconds, loaded packages, per-package times)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _probe.format(module=module)],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report["seconds"], report["packages"], parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top", type=int, default=8, help="Slowest packages to list per module")
+    parser.add_argument("--check", action="store_true", help="Fail on a cold-start regression")
+    parser.add_argument("--max-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    failures = []
+    for module in [home_module] + dashboard_modules:
+        seconds, packages, package_times = profile_import(module)
+        heavy = [name for name in heavy_packages if name in packages]
+        print(f"{module}: {seconds:.2f} s, heavy packages: {', '.join(heavy) or 'none'}")
+        # The project package itself spans the whole import; list its dependencies
+        package_times.pop(module.split(".")[0], None)
+        slowest = sorted(package_times.items(), key=lambda item: item[1], reverse=True)
+        for package, package_seconds in slowest[: args.top]:
+            print(f"    {package:<24}{package_seconds:>8.3f} s")
+
+        if module == home_module:
+            if heavy:
+                failures.append(f"home page imports {', '.join(heavy)}")
+            if seconds > args.max_seconds:
+                failures.append(f"home page import took {seconds:.2f} s > {args.max_seconds} s")
+
+    if args.check:
+        if failures:
+            print("Cold-start check failed: " + "; ".join(failures))
+            sys.exit(1)
+        print("Cold-start check passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+Generate realistic synthetic Studer, Enphase and OpenWeather files for one or
+more sites, spanning one month to ten years.
+
+Each site gets the layout the readers expect under ``data/sample``:
+
+    <output>/<site>/studer/YYYYMMDD.csv    three header lines, then one row per
+                                            minute with the ``studer_names``
+                                            columns and two trailing empty fields
+    <output>/<site>/enphase/<enphase_15min_file> and <enphase_daily_file>
+    <output>/<site>/weather/<openweather_data_file>
+    <output>/<site>/solar/<solar_data_file>
+
+The series follow daily and yearly cycles: solar production and grid export
+peak at noon and in summer, the battery charges during the day, the grid has
+load shedding blocks (voltage and status drop to 0), occasional under-voltage
+and off-frequency minutes, and the weather moves through a few condition
+regimes. Every site has its own deterministic random stream, so the same
+arguments always produce the same files.
+
+Usage:
+    python -m benchmarks.synthetic_data --output data/synthetic --span 1Y --sites 3
+    python -m benchmarks.synthetic_data --output data/synthetic --span 10Y --start 2015-01-01
+"""
+import argparse
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.config.enphase_constants import enphase_15min_file
+from src.config.openweather_weather_constants import openweather_data_file
+from src.config.studer_constants import studer_names
+
+studer_header = "Studer Xtender log\nSynthetic data\nOne row per minute\n"
+solar_data_file = "solar_data.csv"
+# Daily export read by read_filtered_enphase_data_file, with day-first dates
+enphase_daily_file = "enphase_daily.csv"
+
+# Kelvin, as in the OpenWeather exports
+mean_temperature = 290.0
+weather_regimes = [
+    # main, descriptions, icon, weather ids, cloud cover, solar factor
+    ("Clear", ["clear sky"], "01d", [800], (0, 10), 1.0),
+    ("Clouds", ["few clouds", "scattered clouds", "broken clouds", "overcast clouds"], "03d", [801, 802, 803, 804], (20, 100), 0.6),
+    ("Rain", ["light rain", "moderate rain", "heavy intensity rain"], "10d", [500, 501, 502], (60, 100), 0.3),
+    ("Mist", ["mist"], "50d", [701], (30, 80), 0.5),
+    ("Thunderstorm", ["thunderstorm with light rain", "heavy thunderstorm"], "11d", [200, 211], (80, 100), 0.2),
+]
+regime_probabilities = [0.45, 0.3, 0.15, 0.07, 0.03]
+
+
+def parse_span(span):
+    """
+    Offset of a span such as "1M", "18M", "1Y" or "10Y".
+
+    Parameters:
+    - span: number of months (M) or years (Y)
+
+    Returns:
+    - pd.DateOffset between one month and ten years
+    """
+    match = re.fullmatch(r"(\d+)([MY])", span.strip().upper())
+    if match is None:
+        raise ValueError(f"Invalid span {span!r}, expected e.g. '6M' or '2Y'")
+    count, unit = int(match.group(1)), match.group(2)
+    months = count * 12 if unit == "Y" else count
+    if not 1 <= months <= 120:
+        raise ValueError(f"Span {span!r} is outside one month to ten years")
+    return pd.DateOffset(months=months)
+
+
+def site_names(count):
+    return [f"site_{number:02d}" for number in range(1, count + 1)]
+
+
+def _site_rng(seed, site_number):
+    return np.random.default_rng([seed, site_number])
+
+
+def _solar_profile(index):
+    """0-1 clear-sky production of each timestamp, peaking at noon and in summer"""
+    hours = index.hour + index.minute / 60
+    daylight = np.clip(np.sin(np.pi * (hours - 6) / 12), 0, None)
+    season = 0.75 + 0.25 * np.cos(2 * np.pi * (index.dayofyear - 172) / 365.25)
+    return np.asarray(daylight * season)
+
+
+def _hourly_weather_regimes(hours, rng):
+    """Regime number of each hour, held for a few hours to a couple of days"""
+    regimes = np.empty(hours, dtype=int)
+    position = 0
+    while position < hours:
+        length = int(rng.integers(3, 49))
+        regimes[position:position + length] = rng.choice(len(weather_regimes), p=regime_probabilities)
+        position += length
+    return regimes
+
+
+def _load_shedding_mask(index, rng, blocks_per_day=1.5):
+    """Minutes inside load shedding blocks of 1 to 4 hours"""
+    minutes = len(index)
+    mask = np.zeros(minutes, dtype=bool)
+    days = max(1, minutes // 1440)
+    starts = rng.integers(0, minutes, int(rng.poisson(blocks_per_day * days)))
+    lengths = rng.integers(60, 241, len(starts))
+    for start, length in zip(starts, lengths):
+        mask[start:start + length] = True
+    return mask
+
+
+def generate_weather_data(start, end, rng):
+    """Hourly OpenWeather rows with ``dt`` in unix seconds"""
+    index = pd.date_range(start, end, freq="h", inclusive="left")
+    hours = len(index)
+    regimes = _hourly_weather_regimes(hours, rng)
+    day_cycle = np.sin(2 * np.pi * (index.hour - 9) / 24)
+    season = np.cos(2 * np.pi * (index.dayofyear - 200) / 365.25)
+
+    temp = mean_temperature + 8 * season + 5 * day_cycle + rng.normal(0, 1.5, hours)
+    humidity = np.clip(70 - 20 * day_cycle + 15 * (regimes == 2) + rng.normal(0, 8, hours), 10, 100)
+    cloud_low = np.array([weather_regimes[regime][4][0] for regime in regimes])
+    cloud_high = np.array([weather_regimes[regime][4][1] for regime in regimes])
+
+    data = pd.DataFrame(
+        {
+            "dt": (index - pd.Timestamp("1970-01-01")) // pd.Timedelta(seconds=1),
+            "dt_iso": index.strftime("%Y-%m-%d %H:%M:%S +0000 UTC"),
+            "timezone": 7200,
+            "city_name": "Synthetic",
+            "temp": temp.round(2),
+            "visibility": np.where(np.isin(regimes, [2, 3]), rng.uniform(500, 6000, hours), 10000).round(0),
+            "dew_point": (temp - (100 - humidity) / 5).round(2),
+            "feels_like": (temp - rng.uniform(0, 2, hours)).round(2),
+            "temp_min": (temp - rng.uniform(0, 2, hours)).round(2),
+            "temp_max": (temp + rng.uniform(0, 2, hours)).round(2),
+            "pressure": rng.normal(1013, 6, hours).round(0),
+            "humidity": humidity.round(0),
+            "wind_speed": rng.gamma(2.0, 1.8, hours).round(2),
+            "wind_deg": rng.integers(0, 360, hours),
+            "clouds_all": rng.uniform(cloud_low, cloud_high).round(0),
+        }
+    )
+    descriptions = [weather_regimes[regime][1] for regime in range(len(weather_regimes))]
+    data["weather_id"] = [
+        weather_regimes[regime][3][rng.integers(len(weather_regimes[regime][3]))] for regime in regimes
+    ]
+    data["weather_main"] = [weather_regimes[regime][0] for regime in regimes]
+    data["weather_description"] = [
+        descriptions[regime][rng.integers(len(descriptions[regime]))] for regime in regimes
+    ]
+    data["weather_icon"] = [weather_regimes[regime][2] for regime in regimes]
+
+    # Gaps, as in the exports
+    for column in ["temp", "visibility", "dew_point", "humidity", "clouds_all"]:
+        data.loc[rng.choice(hours, hours // 200, replace=False), column] = np.nan
+    return data, regimes
+
+
+def generate_enphase_data(start, end, weather_regimes_by_hour, rng, peak_wh=900.0):
+    """15-minute Enphase energy rows with ``Date/Time`` as %m/%d/%Y %H:%M"""
+    index = pd.date_range(start, end, freq="15min", inclusive="left")
+    intervals = len(index)
+    solar_factor = np.array([regime[5] for regime in weather_regimes])[np.repeat(weather_regimes_by_hour, 4)[:intervals]]
+    produced = peak_wh * _solar_profile(index) * solar_factor * rng.uniform(0.85, 1.0, intervals)
+
+    hours = index.hour
+    consumed = 120 + 180 * ((hours >= 6) & (hours < 9)) + 260 * ((hours >= 18) & (hours < 23))
+    consumed = consumed + rng.gamma(2.0, 40.0, intervals)
+    net = produced - consumed
+
+    return pd.DataFrame(
+        {
+            "Date/Time": index.strftime("%m/%d/%Y %H:%M"),
+            "Energy Produced (Wh)": produced.round(0),
+            "Energy Consumed (Wh)": consumed.round(0),
+            "Exported to Grid (Wh)": np.clip(net, 0, None).round(0),
+            "Imported from Grid (Wh)": np.clip(-net, 0, None).round(0),
+        }
+    )
+
+
+def generate_studer_data(start, end, rng):
+    """Minute Studer rows with every ``studer_names`` column, ``Timestamp`` as DD.MM.YYYY HH:MM"""
+    index = pd.date_range(start, end, freq="min", inclusive="left")
+    minutes = len(index)
+    solar = _solar_profile(index)
+    shedding = _load_shedding_mask(index, rng)
+    grid_on = ~shedding
+
+    columns = {"Timestamp": index.strftime("%d.%m.%Y %H:%M")}
+    for phase in ["L1", "L2", "L3"]:
+        voltage = rng.normal(230, 4, minutes)
+        low = rng.random(minutes) < 0.01
+        voltage[low] = rng.uniform(170, 190, low.sum())
+        high = rng.random(minutes) < 0.005
+        voltage[high] = rng.uniform(240, 255, high.sum())
+        frequency = rng.normal(50, 0.08, minutes)
+        off = rng.random(minutes) < 0.002
+        frequency[off] = rng.choice([48.5, 51.8], off.sum())
+        columns[f"Battery Voltage - {phase}"] = (51 + 3 * solar + rng.normal(0, 0.2, minutes)).round(2)
+        columns[f"Grid Input Voltage - {phase}"] = np.where(grid_on, voltage, 0).round(1)
+        columns[f"Grid Input Current - {phase}"] = np.where(grid_on, rng.gamma(2.0, 2.0, minutes), 0).round(2)
+        columns[f"Apparent Power Output - {phase}"] = rng.gamma(2.0, 0.4, minutes).round(3)
+        columns[f"Apparent Power Output w/ External - {phase}"] = (
+            columns[f"Apparent Power Output - {phase}"] + 2 * solar
+        ).round(3)
+        columns[f"Studer Output Frequency - {phase}"] = rng.normal(50, 0.02, minutes).round(2)
+        columns[f"Grid Input Frequency - {phase}"] = np.where(grid_on, frequency, 0).round(2)
+        columns[f"XT-Phase - {phase}"] = ["L1", "L2", "L3"].index(phase) + 1
+        columns[f"XT-Mode - {phase}"] = np.where(grid_on, 3, 1)
+        columns[f"Studer Grid Status - {phase}"] = grid_on.astype(int)
+        columns[f"XT-RME - {phase}"] = 0
+        columns[f"XT-AUX1 - {phase}"] = 0
+        columns[f"XT-AUX2 - {phase}"] = 0
+
+    for number, phase in enumerate(["L1-1", "L2-2", "L3-3"]):
+        columns[f"Battery Voltage - {phase}"] = columns[f"Battery Voltage - {['L1', 'L2', 'L3'][number]}"]
+        columns[f"Battery Current - {phase}"] = (30 * solar - 8 + rng.normal(0, 2, minutes)).round(1)
+        net = rng.gamma(2.0, 0.3, minutes) - 2.5 * solar * rng.uniform(0.6, 1.0, minutes)
+        columns[f"Studer Grid Net Export/Import - {phase}"] = np.where(grid_on, net, 0).round(3)
+        columns[f"Power Output - {phase}"] = columns[f"Apparent Power Output - {['L1', 'L2', 'L3'][number]}"]
+        columns[f"Studer Temperature - {phase}"] = (32 + 8 * solar + rng.normal(0, 1, minutes)).round(1)
+
+    # State of charge peaks in the afternoon, bottoms out before sunrise and drops during load shedding
+    hours = np.asarray(index.hour + index.minute / 60)
+    day_level = np.repeat(rng.normal(0, 8, minutes // 1440 + 1), 1440)[:minutes]
+    soc = 62 + 28 * np.sin(2 * np.pi * (hours - 9) / 24) + day_level - 30 * shedding + rng.normal(0, 1, minutes)
+
+    columns["Battery Voltage"] = columns["Battery Voltage - L1"]
+    columns["Battery Current"] = columns["Battery Current - L1-1"]
+    columns["Battery State of Charge"] = np.clip(soc, 3, 100).round(1)
+    columns["Battery Internal Temperature"] = (25 + 5 * solar + rng.normal(0, 0.5, minutes)).round(1)
+    columns["Solar Power"] = (6.0 * solar * rng.uniform(0.7, 1.0, minutes)).round(3)
+    columns["Dev XT-DBG1"] = 0
+    columns["Dev BSP-locE"] = 0
+    columns["Dev Sys MSG"] = 0
+    columns["Dev Sys SCOM Err"] = 0
+
+    return pd.DataFrame(columns)[studer_names]
+
+
+def write_studer_files(data, directory):
+    """One ``YYYYMMDD.csv`` per day; returns the number of files"""
+    os.makedirs(directory, exist_ok=True)
+    days = data["Timestamp"].str[:10]
+    # Two trailing empty fields per row, as the logger writes them
+    data = data.assign(_empty_1="", _empty_2="")
+    files = 0
+    for day, rows in data.groupby(days, sort=False):
+        file_name = f"{day[6:10]}{day[3:5]}{day[0:2]}.csv"
+        with open(os.path.join(directory, file_name), "w", newline="") as f:
+            f.write(studer_header)
+            rows.to_csv(f, header=False, index=False)
+        files += 1
+    return files
+
+
+def generate_site(site_directory, start, end, seed=42, site_number=1):
+    """
+    Write the Studer, Enphase, weather and solar files of one site.
+
+    Parameters:
+    - site_directory: directory receiving the studer/, enphase/, weather/ and solar/ folders
+    - start, end: first timestamp and the (excluded) end of the span
+    - seed, site_number: select the site's random stream
+
+    Returns:
+    - dict with the row or file count of each source
+    """
+    rng = _site_rng(seed, site_number)
+    weather, regimes = generate_weather_data(start, end, rng)
+    enphase = generate_enphase_data(start, end, regimes, rng)
+
+    for source in ["enphase", "weather", "solar"]:
+        os.makedirs(os.path.join(site_directory, source), exist_ok=True)
+    weather.to_csv(os.path.join(site_directory, "weather", openweather_data_file), index=False)
+    enphase.to_csv(os.path.join(site_directory, "enphase", enphase_15min_file), index=False)
+    enphase_daily = enphase.groupby(enphase["Date/Time"].str[:10], sort=False).sum(numeric_only=True).reset_index()
+    enphase_daily["Date/Time"] = pd.to_datetime(enphase_daily["Date/Time"], format="%m/%d/%Y").dt.strftime("%d/%m/%Y")
+    enphase_daily.to_csv(os.path.join(site_directory, "enphase", enphase_daily_file), index=False)
+    solar = pd.DataFrame(
+        {
+            "Timestamp": pd.to_datetime(enphase["Date/Time"], format="%m/%d/%Y %H:%M").dt.strftime("%d.%m.%Y %H:%M"),
+            "Solar Power (W)": (enphase["Energy Produced (Wh)"] * 4).round(0),
+        }
+    )
+    solar.to_csv(os.path.join(site_directory, "solar", solar_data_file), sep=";", index=False)
+
+    # A month of minutes at a time keeps the memory flat over ten-year spans
+    studer_files = 0
+    for chunk_start in pd.date_range(start, end, freq="MS", inclusive="left").union([pd.Timestamp(start)]):
+        chunk_end = min(chunk_start + pd.offsets.MonthBegin(1), pd.Timestamp(end))
+        studer = generate_studer_data(chunk_start, chunk_end, rng)
+        studer_files += write_studer_files(studer, os.path.join(site_directory, "studer"))
+
+    return {
+        "studer_files": studer_files,
+        "enphase_rows": len(enphase),
+        "weather_rows": len(weather),
+    }
+
+
+def generate_sites(output_dir, span="1Y", sites=1, start="2023-01-01", seed=42):
+    """Generate ``sites`` sites under ``output_dir``; returns {site name: site directory}"""
+    start = pd.Timestamp(start).normalize()
+    end = start + parse_span(span) if isinstance(span, str) else start + span
+    site_directories = {}
+    for site_number, site in enumerate(site_names(sites), start=1):
+        site_directory = os.path.join(output_dir, site)
+        generate_site(site_directory, start, end, seed=seed, site_number=site_number)
+        site_directories[site] = site_directory
+    return site_directories
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", required=True, help="Directory receiving one folder per site")
+    parser.add_argument("--span", default="1Y", help="Length of the data, from 1M to 10Y")
+    parser.add_argument("--sites", type=int, default=1)
+    parser.add_argument("--start", default="2023-01-01")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    try:
+        span = parse_span(args.span)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = pd.Timestamp(args.start).normalize()
+    end = start + span
+    for site_number, site in enumerate(site_names(args.sites), start=1):
+        started = time.perf_counter()
+        counts = generate_site(os.path.join(args.output, site), start, end, seed=args.seed, site_number=site_number)
+        print(
+            f"{site}: {counts['studer_files']} Studer days, {counts['enphase_rows']} Enphase rows, "
+            f"{counts['weather_rows']} weather rows from {start.date()} to {end.date()} "
+            f"in {time.perf_counter() - started:.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
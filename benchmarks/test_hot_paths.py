@@ -0,0 +1,163 @@
+"""
+pytest-benchmark suite of the data hot paths on synthetic site data.
+
+Times every ``data_reader`` function, both resamplers, all
+``grid_metrics_helpers`` and ``pq_metrics_helpers`` functions and the feature
+functions, grouped as reader, resample, grid, pq and features (test names
+start with their group, so ``-k grid`` selects one group). Every case
+calls the function on the same inputs, which the functions do not modify (see
+``tests/test_copy_on_write.py``).
+
+The default ``pytest`` run only collects ``tests``; run this file explicitly.
+``--benchmark-save`` stores a run under ``.benchmarks`` and
+``--benchmark-compare`` with ``--benchmark-compare-fail`` fails when a case
+got slower than the saved baseline.
+
+Usage:
+    python -m pytest benchmarks/test_hot_paths.py --site-span 1Y --benchmark-save=hot_paths
+    python -m pytest benchmarks/test_hot_paths.py --benchmark-compare --benchmark-compare-fail=median:20%
+    python -m pytest benchmarks/test_hot_paths.py -k grid --benchmark-min-rounds=10
+"""
+import pytest
+
+from src.config.modeling_constants import feature_lag_columns, hourly_lags, hourly_windows
+from src.modeling.feature_pipeline import build_merged_hourly_data
+from src.utils import data_reader, grid_metrics_helpers, pq_metrics_helpers
+from src.utils.data_processing import resample_numeric_categorical_data, resample_numeric_data
+from src.utils.feature_engineering import (
+    add_net_export_import_grid_feature,
+    add_time_features,
+    add_time_of_day_features,
+    add_weather_intensity_feature,
+    add_weather_severity_feature,
+    create_cyclical_features,
+    create_lag_and_rolling_features_for_columns,
+)
+
+voltage_columns = ["Grid Input Voltage - L1", "Grid Input Voltage - L2", "Grid Input Voltage - L3"]
+
+# Reader -> site file it reads
+reader_files = {
+    "read_raw_studer_data_directory": "studer",
+    "read_filtered_studer_data_directory": "studer",
+    "read_raw_enphase_data_file": "enphase_daily",
+    "read_filtered_enphase_data_file": "enphase_daily",
+    "read_enphase_15min_data_file": "enphase_15min",
+    "read_solar_data_file": "solar",
+    "read_raw_weather_open_weather_data_file": "weather",
+    "read_filtered_weather_open_weather_data_file": "weather",
+    "read_hourly_features_data_file": "hourly_features",
+}
+
+# Every grid KPI helper but calculate_stats takes the filtered Studer frame alone
+grid_helpers = sorted(
+    name for name in dir(grid_metrics_helpers) if name.startswith("calculate_") and name != "calculate_stats"
+)
+
+
+@pytest.fixture(scope="session")
+def studer_data(site):
+    return data_reader.read_filtered_studer_data_directory(site["studer"])
+
+
+@pytest.fixture(scope="session")
+def enphase_data(site):
+    return data_reader.read_enphase_15min_data_file(site["enphase_15min"])
+
+
+@pytest.fixture(scope="session")
+def weather_data(site):
+    return data_reader.read_filtered_weather_open_weather_data_file(site["weather"])
+
+
+@pytest.fixture(scope="session")
+def hourly_data(site):
+    merged = build_merged_hourly_data(site["studer"], site["enphase_15min"], site["weather"])
+    return add_net_export_import_grid_feature(merged)
+
+
+@pytest.fixture(scope="session")
+def timed_hourly(hourly_data):
+    return add_time_features(hourly_data.reset_index(), "timestamp").set_index("timestamp")
+
+
+@pytest.mark.benchmark(group="reader")
+@pytest.mark.parametrize("reader", list(reader_files))
+def test_reader(benchmark, site, reader):
+    benchmark(getattr(data_reader, reader), site[reader_files[reader]])
+
+
+@pytest.mark.benchmark(group="resample")
+@pytest.mark.parametrize(
+    "resample, frame, freq",
+    [
+        (resample_numeric_data, "studer_data", "1h"),
+        (resample_numeric_data, "enphase_data", "1h"),
+        (resample_numeric_categorical_data, "studer_data", "1h"),
+        (resample_numeric_categorical_data, "weather_data", "1D"),
+    ],
+    ids=[
+        "resample_numeric_data[studer]",
+        "resample_numeric_data[enphase]",
+        "resample_numeric_categorical_data[studer]",
+        "resample_numeric_categorical_data[weather]",
+    ],
+)
+def test_resample(benchmark, request, resample, frame, freq):
+    benchmark(resample, request.getfixturevalue(frame), freq)
+
+
+@pytest.mark.benchmark(group="grid")
+def test_grid_calculate_stats(benchmark, studer_data):
+    benchmark(grid_metrics_helpers.calculate_stats, studer_data, voltage_columns)
+
+
+@pytest.mark.benchmark(group="grid")
+@pytest.mark.parametrize("helper", grid_helpers)
+def test_grid_helper(benchmark, studer_data, helper):
+    benchmark(getattr(grid_metrics_helpers, helper), studer_data)
+
+
+@pytest.mark.benchmark(group="pq")
+def test_pq_power_frequency_variation(benchmark, studer_data):
+    benchmark(pq_metrics_helpers.calculate_power_frequency_variation, studer_data, "Grid Input Frequency - L1")
+
+
+@pytest.mark.benchmark(group="pq")
+def test_pq_long_duration_voltage_variation(benchmark, studer_data):
+    benchmark(pq_metrics_helpers.calculate_long_duration_voltage_variation, studer_data, "Grid Input Voltage - L1")
+
+
+@pytest.mark.benchmark(group="features")
+def test_features_lag_and_rolling(benchmark, hourly_data):
+    benchmark(create_lag_and_rolling_features_for_columns, hourly_data, feature_lag_columns, hourly_lags, hourly_windows)
+
+
+@pytest.mark.benchmark(group="features")
+def test_features_cyclical(benchmark, timed_hourly):
+    benchmark(create_cyclical_features, timed_hourly, "hour", 24)
+
+
+@pytest.mark.benchmark(group="features")
+def test_features_time(benchmark, hourly_data):
+    benchmark(add_time_features, hourly_data.reset_index(), "timestamp")
+
+
+@pytest.mark.benchmark(group="features")
+def test_features_time_of_day(benchmark, timed_hourly):
+    benchmark(add_time_of_day_features, timed_hourly, "hour")
+
+
+@pytest.mark.benchmark(group="features")
+def test_features_weather_severity(benchmark, hourly_data):
+    benchmark(add_weather_severity_feature, hourly_data, "weather_main")
+
+
+@pytest.mark.benchmark(group="features")
+def test_features_weather_intensity(benchmark, hourly_data):
+    benchmark(add_weather_intensity_feature, hourly_data, "weather_description")
+
+
+@pytest.mark.benchmark(group="features")
+def test_features_net_export_import_grid(benchmark, hourly_data):
+    benchmark(add_net_export_import_grid_feature, hourly_data)
@@ -0,0 +1,153 @@
+"""
+Time the weather dashboard sections with one shared cleaned frame and
+vectorized drawing against the previous per-section cleaning and row-wise
+plots, on synthetic hourly OpenWeather data.
+
+Usage:
+    python -m benchmarks.weather_sections_benchmark --days 640
+"""
+import argparse
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from src.utils.pandas_options import enable_copy_on_write
+from src.utils.streamlit_section_cache import figure_to_png
+from src.utils.weather_helpers import clean_weather_data, handle_missing_data
+from src.visualization.open_weather.clouds_visualization import calculate_clouds_section_results
+from src.visualization.open_weather.dew_point_visualization import calculate_dew_point_section_results
+from src.visualization.open_weather.temperature_visualization import calculate_temperature_section_results
+from src.visualization.open_weather.visibility_visualization import calculate_visibility_section_results
+from src.visualization.open_weather.weather_conditions_visualization import (
+    calculate_weather_conditions_section_results,
+    plot_daily_weather_conditions,
+)
+
+section_computations = [
+    calculate_temperature_section_results,
+    calculate_visibility_section_results,
+    calculate_dew_point_section_results,
+    calculate_weather_conditions_section_results,
+    calculate_clouds_section_results,
+]
+
+# Columns each section used to interpolate on its own
+legacy_section_columns = [
+    ["temp", "feels_like", "temp_min", "temp_max"],
+    ["visibility"],
+    ["dew_point", "humidity"],
+    ["weather_id"],
+    ["clouds_all"],
+]
+
+
+def make_weather_data(days, seed=42):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-01", periods=days * 24, freq="h", name="dt")
+    hours = np.arange(len(index))
+    data = pd.DataFrame(index=index)
+    data["temp"] = 295 + 8 * np.sin(2 * np.pi * hours / 24) + rng.normal(0, 1, len(index))
+    data["feels_like"] = data["temp"] + rng.normal(0, 1, len(index))
+    data["temp_min"] = data["temp"] - rng.uniform(0, 2, len(index))
+    data["temp_max"] = data["temp"] + rng.uniform(0, 2, len(index))
+    data["dew_point"] = rng.normal(15, 4, len(index))
+    data["humidity"] = rng.uniform(30, 100, len(index))
+    data["visibility"] = rng.uniform(500, 30000, len(index))
+    data["clouds_all"] = rng.uniform(0, 100, len(index))
+    data["weather_id"] = rng.choice([800, 801, 500, 701], len(index))
+    data["weather_main"] = rng.choice(["Clear", "Clouds", "Rain", "Mist"], len(index))
+    data["weather_description"] = rng.choice(["clear sky", "light rain", "mist"], len(index))
+    for column in ["temp", "temp_min", "temp_max", "dew_point", "humidity", "visibility", "clouds_all"]:
+        data.loc[data.index[rng.choice(len(index), len(index) // 50, replace=False)], column] = np.nan
+    return data
+
+
+def legacy_temperature_range_plot(sampled_data):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    for idx, row in sampled_data.iterrows():
+        ax.vlines(x=idx, ymin=row["temp_min"], ymax=row["temp_max"], color="blue", alpha=0.5)
+    return figure_to_png(fig)
+
+
+def temperature_range_plot(sampled_data):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.vlines(
+        x=sampled_data.index,
+        ymin=sampled_data["temp_min"],
+        ymax=sampled_data["temp_max"],
+        color="blue",
+        alpha=0.5,
+    )
+    return figure_to_png(fig)
+
+
+def legacy_daily_conditions_plot(weather_data):
+    daily_weather = weather_data.reset_index()
+    daily_weather["date"] = daily_weather["dt"].dt.date
+    daily_counts = daily_weather.groupby(["date", "weather_main"]).size().unstack(fill_value=0)
+    fig, ax = plt.subplots(figsize=(14, 7))
+    daily_counts.plot(kind="bar", stacked=True, ax=ax, colormap="viridis")
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+def legacy_clean_per_section(weather_data):
+    # Every section interpolated its own columns again, on the shared frame
+    for columns in legacy_section_columns:
+        for column in columns:
+            weather_data = handle_missing_data(weather_data, column)
+    return weather_data
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=640)
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    weather_data = make_weather_data(args.days)
+    sampled_data = weather_data.sample(min(100, len(weather_data)), random_state=0).sort_index()
+    cleaned_data = clean_weather_data(weather_data)
+
+    rows = [
+        (
+            "cleaning",
+            timed(legacy_clean_per_section, weather_data.copy()),
+            timed(clean_weather_data, weather_data),
+        ),
+        (
+            "temperature range",
+            timed(legacy_temperature_range_plot, sampled_data),
+            timed(temperature_range_plot, sampled_data),
+        ),
+        (
+            "daily conditions",
+            timed(legacy_daily_conditions_plot, cleaned_data),
+            timed(plot_daily_weather_conditions, cleaned_data),
+        ),
+    ]
+
+    print(f"Weather data: {len(weather_data)} hourly rows")
+    print(f"{'step':<20}{'legacy s':>10}{'new s':>10}")
+    for name, legacy_time, new_time in rows:
+        print(f"{name:<20}{legacy_time:>10.3f}{new_time:>10.3f}")
+
+    total = sum(timed(compute, cleaned_data) for compute in section_computations)
+    print(f"all five sections on the shared cleaned frame: {total:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+enphase_15min_file = "enphase_15m_Jan23_Sep24_total.csv"
+
+enphase_energy_metrics = [
+    "Energy Produced (Wh)",
+    "Energy Consumed (Wh)",
+    "Exported to Grid (Wh)",
+    "Imported from Grid (Wh)",
+]
+
+# Seasonality periods in 15-minute intervals
+enphase_seasonality_periods = {
+    "Daily": 96,  # 24 hours * 4 intervals per hour
+    "Weekly": 672,  # 7 days * 96 intervals per day
+}
@@ -0,0 +1,30 @@
+forecast_targets = [
+    "Energy Produced (Wh)",
+    "Energy Consumed (Wh)",
+    "net_export_import_grid",
+]
+
+hourly_features_file = "hourly_features_data.csv"
+
+merged_hourly_file = "merged_hourly_data.csv"
+
+# Lag and rolling window features of 03_feature_engineering.ipynb
+feature_lag_columns = [
+    "Battery State of Charge",
+    "Battery Internal Temperature",
+    "Studer Grid Net Export/Import - L1-1",
+    "Studer Grid Net Export/Import - L2-2",
+    "Studer Grid Net Export/Import - L3-3",
+    "clouds_all",
+    "temp",
+    "humidity",
+    "Energy Produced (Wh)",
+    "Energy Consumed (Wh)",
+    "Exported to Grid (Wh)",
+    "Imported from Grid (Wh)",
+]
+hourly_lags = [1, 2, 3, 6, 12, 24, 48, 72]
+hourly_windows = [3, 6, 24]
+
+# Calendar columns encoded as sine/cosine pairs, with their period
+cyclical_feature_periods = {"hour": 24, "day_of_week": 7, "month": 12}
@@ -1,3 +1,4 @@
+openweather_data_file = "FormulaHouse-Jan2023-Sep2024.csv"
 
 required_weather_columns = [
     "dt",
@@ -17,3 +18,21 @@ required_weather_columns = [
     "weather_description",
     "weather_icon"
 ]
+
+weather_severity_levels = {
+    "Clear": 0,
+    "Clouds": 1,
+    "Mist": 2,
+    "Fog": 3,
+    "Haze": 3,
+    "Drizzle": 4,
+    "Rain": 5,
+    "Thunderstorm": 6,
+}
+
+weather_intensity_levels = {
+    "light": 0.5,
+    "heavy": 1.5,
+}
+
+time_of_day_labels = ["night", "morning", "afternoon", "evening"]
@@ -0,0 +1,287 @@
+"""
+Walk-forward backtesting for the forecast models.
+
+Folds move through the hourly data with an expanding or sliding training window
+and a fixed forecast horizon. The feature matrix is shared with worker processes
+once, folds run in parallel chunks, and only per-fold error sums travel back to
+the parent, where ``BacktestAccumulator`` turns them into per-fold and pooled
+MAE/RMSE/SMAPE/R2. Predictions are never kept, so hundreds of folds stay cheap.
+
+Usage:
+    python -m src.modeling.backtesting --target "Energy Produced (Wh)" \
+        --model XGBoost --horizon 24 --step 24 --window expanding
+"""
+import argparse
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from src.config.modeling_constants import forecast_targets, hourly_features_file
+from src.modeling.metrics import error_sums, metrics_from_error_sums
+from src.modeling.shared_arrays import (
+    attach_shared_array,
+    budget_cores,
+    release_shared_arrays,
+    share_array,
+)
+from src.modeling.training_runner import model_builders, split_features_targets
+from src.utils.data_reader import read_hourly_features_data_file
+from src.utils.pandas_options import enable_copy_on_write
+
+metric_names = ["MAE", "RMSE", "SMAPE", "R2"]
+
+
+def generate_walk_forward_folds(
+    n_samples,
+    initial_train_size,
+    horizon,
+    step=None,
+    window="expanding",
+    max_train_size=None,
+):
+    """
+    Build walk-forward folds as (train_start, train_end, test_start, test_end) row bounds.
+
+    Parameters:
+    -----------
+    n_samples : int
+        Number of rows in the time-ordered dataset
+    initial_train_size : int
+        Rows in the first training window
+    horizon : int
+        Rows forecast in each fold
+    step : int, optional
+        Rows the origin moves between folds, defaults to ``horizon``
+    window : {'expanding', 'sliding'}, default 'expanding'
+        Expanding windows keep all history; sliding windows keep the last
+        ``max_train_size`` rows (``initial_train_size`` if not given)
+    max_train_size : int, optional
+        Cap on the training window length
+
+    Returns:
+    --------
+    list of tuple of int
+    """
+    if window not in ("expanding", "sliding"):
+        raise ValueError("window must be 'expanding' or 'sliding'")
+    if initial_train_size < 1 or horizon < 1:
+        raise ValueError("initial_train_size and horizon must be positive")
+
+    step = step or horizon
+    if window == "sliding" and max_train_size is None:
+        max_train_size = initial_train_size
+
+    folds = []
+    train_end = initial_train_size
+    while train_end + horizon <= n_samples:
+        train_start = 0
+        if max_train_size is not None:
+            train_start = max(train_end - max_train_size, 0)
+        folds.append((train_start, train_end, train_end, train_end + horizon))
+        train_end += step
+
+    return folds
+
+
+class BacktestAccumulator:
+    """Streaming collector of per-fold metrics and pooled error sums"""
+
+    def __init__(self):
+        self.fold_rows = []
+        self.pooled_sums = None
+
+    def add(self, fold_result):
+        sums = fold_result["sums"]
+        row = {key: value for key, value in fold_result.items() if key != "sums"}
+        row.update(metrics_from_error_sums(sums))
+        self.fold_rows.append(row)
+
+        if self.pooled_sums is None:
+            self.pooled_sums = dict(sums)
+        else:
+            for key, value in sums.items():
+                self.pooled_sums[key] += value
+
+    def folds_frame(self):
+        """Per-fold metrics ordered by fold"""
+        if not self.fold_rows:
+            return pd.DataFrame(columns=["fold"] + metric_names)
+        return pd.DataFrame(self.fold_rows).sort_values("fold", ignore_index=True)
+
+    def summary(self):
+        """Pooled metrics over all forecast points plus the mean and std across folds"""
+        if self.pooled_sums is None:
+            return {}
+
+        folds = self.folds_frame()
+        summary = {"Folds": len(folds), "Points": self.pooled_sums["n"]}
+        for name, value in metrics_from_error_sums(self.pooled_sums).items():
+            summary[f"Pooled {name}"] = value
+        for name in metric_names:
+            summary[f"Mean Fold {name}"] = folds[name].mean()
+            summary[f"Std Fold {name}"] = folds[name].std()
+        return summary
+
+
+def _run_fold_chunk(x_spec, y_spec, target_idx, model_name, params, n_jobs, folds):
+    X = attach_shared_array(x_spec)
+    y = attach_shared_array(y_spec)[:, target_idx]
+
+    results = []
+    for fold, train_start, train_end, test_start, test_end in folds:
+        model = model_builders[model_name](n_jobs, **params)
+        start = time.perf_counter()
+        model.fit(X[train_start:train_end], y[train_start:train_end])
+        fit_seconds = time.perf_counter() - start
+
+        predictions = model.predict(X[test_start:test_end])
+        results.append(
+            {
+                "fold": fold,
+                "train_start": train_start,
+                "train_end": train_end,
+                "test_start": test_start,
+                "test_end": test_end,
+                "fit_seconds": fit_seconds,
+                "sums": error_sums(y[test_start:test_end], predictions),
+            }
+        )
+    return results
+
+
+def run_backtest(
+    X,
+    y,
+    model_name="XGBoost",
+    model_params=None,
+    initial_train_size=None,
+    horizon=24,
+    step=None,
+    window="expanding",
+    max_train_size=None,
+    max_workers=None,
+    total_cores=None,
+    chunks_per_worker=4,
+    accumulator=None,
+):
+    """
+    Walk-forward backtest of one model on one target.
+
+    Parameters:
+    -----------
+    X : pandas.DataFrame or numpy.ndarray
+        Precomputed numeric feature matrix ordered in time
+    y : pandas.Series or numpy.ndarray
+        Target aligned with ``X``
+    model_name : str, default 'XGBoost'
+        Key of ``model_builders``
+    model_params : dict, optional
+        Extra estimator parameters
+    initial_train_size : int, optional
+        Rows in the first training window, defaults to half of the data
+    horizon, step, window, max_train_size :
+        Fold layout, see ``generate_walk_forward_folds``
+    max_workers : int, optional
+        Upper bound on worker processes
+    total_cores : int, optional
+        Cores to share between workers, defaults to ``os.cpu_count()``
+    chunks_per_worker : int, default 4
+        Folds are sent in about ``workers * chunks_per_worker`` chunks to keep
+        scheduling overhead low while still balancing uneven fold costs
+    accumulator : BacktestAccumulator, optional
+        Collector to stream fold results into; a new one is created if omitted
+
+    Returns:
+    --------
+    BacktestAccumulator
+    """
+    n_samples = len(X)
+    initial_train_size = initial_train_size or n_samples // 2
+    folds = generate_walk_forward_folds(
+        n_samples, initial_train_size, horizon, step, window, max_train_size
+    )
+    accumulator = accumulator or BacktestAccumulator()
+    if not folds:
+        return accumulator
+
+    numbered_folds = [(fold, *bounds) for fold, bounds in enumerate(folds)]
+    workers, cores_per_job = budget_cores(len(folds), max_workers, total_cores)
+    chunk_size = math.ceil(len(folds) / (workers * chunks_per_worker))
+    chunks = [
+        numbered_folds[start:start + chunk_size]
+        for start in range(0, len(numbered_folds), chunk_size)
+    ]
+
+    x_block, x_spec = share_array(np.asarray(X, dtype=np.float64))
+    y_block, y_spec = share_array(np.asarray(y, dtype=np.float64).reshape(-1, 1))
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_fold_chunk,
+                    x_spec,
+                    y_spec,
+                    0,
+                    model_name,
+                    model_params or {},
+                    cores_per_job,
+                    chunk,
+                )
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                for fold_result in future.result():
+                    accumulator.add(fold_result)
+    finally:
+        release_shared_arrays([x_block, y_block])
+
+    return accumulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk-forward backtest of a forecast model")
+    parser.add_argument("--features-file", default=hourly_features_file)
+    parser.add_argument("--target", default=forecast_targets[0], choices=forecast_targets)
+    parser.add_argument("--model", default="XGBoost", choices=list(model_builders))
+    parser.add_argument("--horizon", type=int, default=24)
+    parser.add_argument("--step", type=int)
+    parser.add_argument("--initial-train-size", type=int)
+    parser.add_argument("--window", default="expanding", choices=["expanding", "sliding"])
+    parser.add_argument("--max-train-size", type=int)
+    parser.add_argument("--max-workers", type=int)
+    parser.add_argument("--output", help="Optional CSV path for the per-fold metrics")
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    df = read_hourly_features_data_file(args.features_file)
+    X, Y = split_features_targets(df)
+
+    start = time.perf_counter()
+    accumulator = run_backtest(
+        X,
+        Y[args.target],
+        model_name=args.model,
+        initial_train_size=args.initial_train_size,
+        horizon=args.horizon,
+        step=args.step,
+        window=args.window,
+        max_train_size=args.max_train_size,
+        max_workers=args.max_workers,
+    )
+    for name, value in accumulator.summary().items():
+        print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+    print(f"Backtest finished in {time.perf_counter() - start:.1f}s")
+
+    if args.output:
+        accumulator.folds_frame().to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
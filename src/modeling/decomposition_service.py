@@ -0,0 +1,243 @@
+"""
+Precomputed seasonal decompositions of the Enphase 15-minute energy metrics.
+
+A refresh job decomposes the full history of every metric at every
+seasonality period (daily, weekly) and writes the components to
+``data/decompositions``, together with a fingerprint of the source file. The
+Enphase dashboard slices the cached components for the selected dates instead
+of decomposing (a truncated part of) the range inside a rerun.
+
+Classical decomposition is cheap at any length. STL cost grows with both the
+number of points and the period, so very long series are decomposed at a
+coarser resolution (hourly, then daily, as long as the period still spans at
+least two points) to keep them within ``max_decomposition_points``. The
+resolution used is recorded in the metadata and the components are stored at
+that resolution.
+
+Usage:
+    python -m src.modeling.decomposition_service --method stl
+"""
+import argparse
+import json
+import os
+
+import pandas as pd
+from statsmodels.tsa.seasonal import STL, seasonal_decompose
+
+from src.config.enphase_constants import (
+    enphase_15min_file,
+    enphase_energy_metrics,
+    enphase_seasonality_periods,
+)
+from src.utils.data_fingerprint import fingerprint_files
+from src.utils.data_reader import get_sample_data_path, read_enphase_15min_data_file
+from src.utils.file_store import atomic_write
+from src.utils.name_helpers import slugify
+from src.utils.pandas_options import enable_copy_on_write
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+default_cache_dir = os.path.join(project_root, "data", "decompositions")
+metadata_file = "decompositions.json"
+
+base_resolution = "15min"
+# Resolutions tried in order, finest first
+decomposition_resolutions = ["15min", "1h", "1D"]
+decomposition_methods = ["stl", "classical"]
+max_decomposition_points = {"stl": 20000, "classical": 2000000}
+
+
+def decomposition_source_paths(file_name=enphase_15min_file):
+    return [get_sample_data_path("enphase", file_name)]
+
+
+def regularize_series(series, freq=base_resolution):
+    """Put the series on a regular ``freq`` grid and fill gaps by time interpolation"""
+    series = series[~series.index.duplicated(keep="last")].sort_index()
+    regular = series.resample(freq).mean()
+    return regular.interpolate(method="time").bfill().ffill()
+
+
+def choose_resolution(n_points, period, method="stl", freq=base_resolution):
+    """
+    Finest resolution at which the series fits the method's point budget.
+
+    Parameters:
+    - n_points: length of the series at ``freq``
+    - period: seasonality period in ``freq`` intervals
+    - method: "stl" or "classical"
+
+    Returns:
+    - (resolution, period in intervals of that resolution)
+    """
+    base = pd.Timedelta(freq)
+    chosen = None
+    for resolution in decomposition_resolutions:
+        factor = pd.Timedelta(resolution) // base
+        if factor < 1 or period % factor or period // factor < 2:
+            continue
+        chosen = (resolution, period // factor)
+        if n_points // factor <= max_decomposition_points[method]:
+            break
+    if chosen is None:
+        raise ValueError(f"No resolution can represent a period of {period} x {freq}")
+    return chosen
+
+
+def decompose_series(series, period, method="stl", freq=base_resolution):
+    """
+    Decompose a ``freq`` series, downsampling it first if it is too long for ``method``.
+
+    Returns:
+    - (components, resolution) where components is a DataFrame with columns
+      observed, trend, seasonal and resid at ``resolution``
+    """
+    series = regularize_series(series, freq)
+    resolution, resolution_period = choose_resolution(len(series), period, method, freq)
+    if resolution != freq:
+        series = series.resample(resolution).mean()
+
+    if len(series) < 2 * resolution_period:
+        raise ValueError(
+            f"Need at least {2 * resolution_period} points at {resolution}, got {len(series)}"
+        )
+
+    if method == "stl":
+        result = STL(series, period=resolution_period, robust=True).fit()
+    elif method == "classical":
+        result = seasonal_decompose(
+            series, model="additive", period=resolution_period, extrapolate_trend="freq"
+        )
+    else:
+        raise ValueError(f"Unknown decomposition method: {method}")
+
+    components = pd.DataFrame(
+        {
+            "observed": result.observed,
+            "trend": result.trend,
+            "seasonal": result.seasonal,
+            "resid": result.resid,
+        },
+        index=series.index,
+    )
+    components.index.name = "Timestamp"
+    return components, resolution
+
+
+def decomposition_file_name(metric, period_name, method):
+    return f"{slugify(metric)}-{slugify(period_name)}-{method}.csv"
+
+
+def refresh_decomposition_cache(
+    file_name=enphase_15min_file,
+    metrics=enphase_energy_metrics,
+    periods=enphase_seasonality_periods,
+    method="stl",
+    cache_dir=default_cache_dir,
+):
+    """Decompose the full history of every metric at every period and rewrite the cache"""
+    data = read_enphase_15min_data_file(file_name)
+    data_fingerprint = fingerprint_files(decomposition_source_paths(file_name))
+
+    entries = {}
+    for metric in metrics:
+        for period_name, period in periods.items():
+            components, resolution = decompose_series(data[metric], period, method)
+            components_file = decomposition_file_name(metric, period_name, method)
+            atomic_write(
+                os.path.join(cache_dir, components_file),
+                lambda f: components.to_csv(f),
+            )
+            entries[f"{metric}|{period_name}"] = {
+                "metric": metric,
+                "period_name": period_name,
+                "period": period,
+                "resolution": resolution,
+                "file": components_file,
+                "start": components.index.min().isoformat(),
+                "end": components.index.max().isoformat(),
+            }
+
+    metadata = {
+        "generated_at": pd.Timestamp.now().isoformat(),
+        "source_file": file_name,
+        "method": method,
+        "data_fingerprint": data_fingerprint,
+        "decompositions": entries,
+    }
+    # Metadata goes last so readers never see new metadata next to old components
+    atomic_write(os.path.join(cache_dir, metadata_file), lambda f: json.dump(metadata, f, indent=2))
+    return metadata
+
+
+def read_decomposition_metadata(cache_dir=default_cache_dir):
+    """Metadata of the cached decompositions, or None if no cache has been written"""
+    path = os.path.join(cache_dir, metadata_file)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def decomposition_cache_version(cache_dir=default_cache_dir):
+    """Modification time of the cache metadata (None if absent), for keying reader caches"""
+    path = os.path.join(cache_dir, metadata_file)
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+def is_decomposition_cache_stale(metadata, file_name=enphase_15min_file):
+    """A cache is stale when it is missing, was built from another file, or the file changed"""
+    if metadata is None or metadata.get("source_file") != file_name:
+        return True
+    return metadata.get("data_fingerprint") != fingerprint_files(decomposition_source_paths(file_name))
+
+
+def read_decomposition(metadata, metric, period_name, cache_dir=default_cache_dir):
+    """
+    Cached components of ``metric`` at ``period_name``.
+
+    Returns:
+    - (components, resolution) or (None, None) if that decomposition is not cached
+    """
+    entry = (metadata or {}).get("decompositions", {}).get(f"{metric}|{period_name}")
+    if entry is None:
+        return None, None
+    path = os.path.join(cache_dir, entry["file"])
+    if not os.path.exists(path):
+        return None, None
+    components = pd.read_csv(path, index_col="Timestamp", parse_dates=["Timestamp"])
+    return components, entry["resolution"]
+
+
+def slice_components(components, start_date, end_date):
+    """Components between two dates, both days included"""
+    end = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+    index = components.index
+    return components.iloc[index.searchsorted(pd.Timestamp(start_date)):index.searchsorted(end)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the precomputed Enphase decompositions")
+    parser.add_argument("--file-name", default=enphase_15min_file)
+    parser.add_argument("--method", choices=decomposition_methods, default="stl")
+    parser.add_argument(
+        "--if-stale",
+        action="store_true",
+        help="Only refresh when the source data changed since the last run",
+    )
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    if args.if_stale:
+        metadata = read_decomposition_metadata()
+        if not is_decomposition_cache_stale(metadata, args.file_name) and metadata["method"] == args.method:
+            print("Decomposition cache is up to date")
+            return
+
+    metadata = refresh_decomposition_cache(file_name=args.file_name, method=args.method)
+    for entry in metadata["decompositions"].values():
+        print(f"{entry['metric']} ({entry['period_name']}): {entry['resolution']} resolution")
+    print(f"Decomposition cache written at {metadata['generated_at']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Ingestion-to-features pipeline of ``02_data_preprocessing.ipynb`` and
+``03_feature_engineering.ipynb`` as a sequence of named stages.
+
+``build_merged_hourly_data`` reads the Studer, Enphase and weather data,
+resamples them to hours and joins them; ``build_hourly_features`` adds the
+engineered features and drops incomplete rows, producing the hourly features
+file the models are trained on. Pass a ``MemoryAccountant`` to record the
+size, copies and RSS change of every stage.
+
+Usage:
+    python -m src.modeling.feature_pipeline --output data/processed/hourly_features_data.csv
+    python -m src.modeling.feature_pipeline --memory-report results/pipeline_memory.json
+"""
+import argparse
+import os
+
+import pandas as pd
+
+from src.config.enphase_constants import enphase_15min_file
+from src.config.modeling_constants import (
+    cyclical_feature_periods,
+    feature_lag_columns,
+    hourly_features_file,
+    hourly_lags,
+    hourly_windows,
+)
+from src.config.openweather_weather_constants import openweather_data_file
+from src.utils.data_processing import resample_numeric_data
+from src.utils.data_reader import (
+    read_enphase_15min_data_file,
+    read_filtered_studer_data_directory,
+    read_filtered_weather_open_weather_data_file,
+)
+from src.utils.feature_engineering import (
+    add_net_export_import_grid_feature,
+    add_time_features,
+    add_time_of_day_features,
+    add_weather_intensity_feature,
+    add_weather_severity_feature,
+    create_cyclical_features,
+    create_lag_and_rolling_features_for_columns,
+)
+from src.utils.memory_accounting import MemoryAccountant
+from src.utils.pandas_options import enable_copy_on_write
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+default_studer_data_dir = os.path.join(project_root, "data", "sample", "studer")
+
+
+def run_stage(accountant, stage, func, *args, **kwargs):
+    if accountant is None:
+        return func(*args, **kwargs)
+    return accountant.run(stage, func, *args, **kwargs)
+
+
+def _merge_hourly(left, right):
+    return pd.merge(left, right, left_index=True, right_index=True, how="inner")
+
+
+def _add_time_features(hourly_df):
+    return add_time_features(hourly_df.reset_index(), "timestamp").set_index("timestamp")
+
+
+def _add_weather_impact(hourly_df):
+    return hourly_df.assign(weather_impact=hourly_df["weather_severity"] * hourly_df["weather_intensity"])
+
+
+def build_merged_hourly_data(
+    studer_data_dir=default_studer_data_dir,
+    enphase_file=enphase_15min_file,
+    weather_file=openweather_data_file,
+    accountant=None,
+):
+    """Hourly Studer, weather and Enphase data joined on their timestamps"""
+    studer_data = run_stage(accountant, "read studer", read_filtered_studer_data_directory, studer_data_dir)
+    studer_hourly = run_stage(accountant, "resample studer hourly", resample_numeric_data, studer_data, freq="1h")
+    del studer_data
+
+    enphase_data = run_stage(accountant, "read enphase", read_enphase_15min_data_file, enphase_file)
+    enphase_hourly = run_stage(accountant, "resample enphase hourly", resample_numeric_data, enphase_data, freq="1h")
+    del enphase_data
+
+    weather_data = run_stage(accountant, "read weather", read_filtered_weather_open_weather_data_file, weather_file)
+
+    merged = run_stage(accountant, "merge studer and weather", _merge_hourly, studer_hourly, weather_data)
+    merged = run_stage(accountant, "merge enphase", _merge_hourly, merged, enphase_hourly)
+    merged.index.name = "timestamp"
+    return merged
+
+
+def build_hourly_features(hourly_df, accountant=None):
+    """Engineered features of the merged hourly data, without incomplete rows"""
+    hourly_df = run_stage(accountant, "net export/import feature", add_net_export_import_grid_feature, hourly_df)
+    hourly_df = run_stage(accountant, "time features", _add_time_features, hourly_df)
+    for column, period in cyclical_feature_periods.items():
+        hourly_df = run_stage(
+            accountant, f"cyclical {column} features", create_cyclical_features, hourly_df, column, period
+        )
+    hourly_df = run_stage(accountant, "time of day features", add_time_of_day_features, hourly_df, "hour")
+    hourly_df = run_stage(
+        accountant,
+        "lag and rolling features",
+        create_lag_and_rolling_features_for_columns,
+        hourly_df,
+        feature_lag_columns,
+        hourly_lags,
+        hourly_windows,
+    )
+    hourly_df = run_stage(accountant, "weather severity feature", add_weather_severity_feature, hourly_df, "weather_main")
+    hourly_df = run_stage(
+        accountant, "weather intensity feature", add_weather_intensity_feature, hourly_df, "weather_description"
+    )
+    hourly_df = run_stage(accountant, "weather impact feature", _add_weather_impact, hourly_df)
+    return run_stage(accountant, "drop incomplete rows", lambda df: df.dropna(), hourly_df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the hourly features file from the raw data")
+    parser.add_argument("--studer-data-dir", default=default_studer_data_dir)
+    parser.add_argument("--output", help=f"Features CSV, e.g. data/processed/{hourly_features_file}")
+    parser.add_argument("--memory-report", help="Record the memory of every stage and write the report as JSON")
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    accountant = MemoryAccountant("feature_pipeline") if args.memory_report else None
+    merged = build_merged_hourly_data(args.studer_data_dir, accountant=accountant)
+    features = build_hourly_features(merged, accountant=accountant)
+    print(f"Features: {features.shape[0]} rows x {features.shape[1]} columns")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        features.to_csv(args.output)
+    if accountant is not None:
+        print(accountant.report().to_string(index=False, float_format="{:.3f}".format))
+        os.makedirs(os.path.dirname(os.path.abspath(args.memory_report)), exist_ok=True)
+        with open(args.memory_report, "w") as f:
+            f.write(accountant.to_json(rows=len(features)))
+
+
+if __name__ == "__main__":
+    main()
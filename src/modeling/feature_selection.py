@@ -0,0 +1,302 @@
+"""
+Parallel, cached feature importance and feature selection.
+
+For every target, three importance measures are computed in parallel worker
+processes over a shared copy of the training rows of the feature matrix (the
+first ``train_fraction``, as in ``training_runner``), so the rows the models
+are evaluated on never inform the selection:
+
+- ``tree``: impurity importances of a Random Forest
+- ``lasso``: ``LassoCV`` coefficients on standardised features, plus the alpha at
+  which each feature enters the Lasso path
+- ``permutation``: permutation importance of a Random Forest on a validation
+  split at the end of the training rows
+
+Results are cached on disk keyed by a fingerprint of the feature matrix, the
+target and the method parameters, so reruns on unchanged data are instant. The
+combined scores are reduced to a feature list that the training runner reads
+with ``--selected-features``.
+
+Usage:
+    python -m src.modeling.feature_selection --output data/processed/selected_features.json
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.inspection import permutation_importance
+from sklearn.linear_model import LassoCV, lasso_path
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.preprocessing import StandardScaler
+
+from src.config.modeling_constants import forecast_targets, hourly_features_file
+from src.modeling.shared_arrays import (
+    attach_shared_array,
+    budget_cores,
+    release_shared_arrays,
+    share_array,
+)
+from src.modeling.training_runner import split_features_targets
+from src.utils.data_fingerprint import fingerprint_frame
+from src.utils.data_reader import read_hourly_features_data_file
+from src.utils.name_helpers import slugify
+from src.utils.pandas_options import enable_copy_on_write
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+default_cache_dir = os.path.join(project_root, "data", "feature_selection")
+default_selected_features_path = os.path.join(project_root, "data", "processed", "selected_features.json")
+
+importance_params = {
+    "tree": {"n_estimators": 100, "random_state": 42},
+    "lasso": {"cv_splits": 5, "max_iter": 5000},
+    "permutation": {"n_estimators": 100, "n_repeats": 5, "holdout_fraction": 0.2, "random_state": 42},
+}
+
+
+def compute_tree_importance(X, y, n_jobs, n_estimators, random_state):
+    model = RandomForestRegressor(n_estimators=n_estimators, random_state=random_state, n_jobs=n_jobs)
+    model.fit(X, y)
+    return {"tree_importance": model.feature_importances_}
+
+
+def compute_lasso_importance(X, y, n_jobs, cv_splits, max_iter):
+    X_scaled = StandardScaler().fit_transform(X)
+    model = LassoCV(cv=TimeSeriesSplit(n_splits=cv_splits), max_iter=max_iter, n_jobs=n_jobs)
+    model.fit(X_scaled, y)
+
+    alphas, coefs, _ = lasso_path(X_scaled, y, alphas=model.alphas_, max_iter=max_iter)
+    # Alphas are decreasing, so the first non-zero coefficient marks where a feature enters
+    active = coefs != 0
+    entered = active.any(axis=1)
+    entry_alpha = np.where(entered, alphas[active.argmax(axis=1)], 0.0)
+
+    return {"lasso_coef": np.abs(model.coef_), "lasso_entry_alpha": entry_alpha}
+
+
+def compute_permutation_importance(X, y, n_jobs, n_estimators, n_repeats, holdout_fraction, random_state):
+    split_idx = int(len(X) * (1 - holdout_fraction))
+    model = RandomForestRegressor(n_estimators=n_estimators, random_state=random_state, n_jobs=n_jobs)
+    model.fit(X[:split_idx], y[:split_idx])
+    result = permutation_importance(
+        model,
+        X[split_idx:],
+        y[split_idx:],
+        n_repeats=n_repeats,
+        random_state=random_state,
+        n_jobs=n_jobs,
+    )
+    return {"permutation_importance": result.importances_mean}
+
+
+importance_methods = {
+    "tree": compute_tree_importance,
+    "lasso": compute_lasso_importance,
+    "permutation": compute_permutation_importance,
+}
+
+
+def _run_importance(x_spec, y_spec, target_idx, method, params, n_jobs):
+    X = attach_shared_array(x_spec)
+    y = attach_shared_array(y_spec)[:, target_idx]
+    scores = importance_methods[method](X, y, n_jobs, **params)
+    return {name: values.tolist() for name, values in scores.items()}
+
+
+def _cache_path(cache_dir, matrix_fingerprint, target, method, params):
+    key = hashlib.sha1(
+        json.dumps([matrix_fingerprint, target, method, params], sort_keys=True).encode()
+    ).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{slugify(target)}-{method}-{key}.json")
+
+
+def compute_feature_importances(
+    X,
+    Y,
+    methods=tuple(importance_methods),
+    cache_dir=default_cache_dir,
+    train_fraction=0.8,
+    max_workers=None,
+    total_cores=None,
+):
+    """
+    Compute (or read from cache) every importance measure for every target, on the training rows only.
+
+    Parameters:
+    -----------
+    X : pandas.DataFrame
+        Numeric feature matrix ordered in time
+    Y : pandas.DataFrame
+        Target columns aligned with ``X``
+    methods : iterable of str
+        Keys of ``importance_methods``
+    cache_dir : str or None
+        Directory of the on-disk cache, ``None`` disables caching
+    train_fraction : float, default 0.8
+        Leading fraction of rows the importances are computed on; keep it equal
+        to the training runner's so its test rows stay unseen
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Long frame with columns Target, Feature, Measure and Score
+    """
+    split_idx = int(len(X) * train_fraction)
+    X = X.iloc[:split_idx]
+    Y = Y.iloc[:split_idx]
+
+    matrix_fingerprint = fingerprint_frame(pd.concat([X, Y], axis=1))
+    results = {}
+    jobs = []
+    for target_idx, target in enumerate(Y.columns):
+        for method in methods:
+            params = importance_params[method]
+            path = _cache_path(cache_dir, matrix_fingerprint, target, method, params) if cache_dir else None
+            if path and os.path.exists(path):
+                with open(path) as f:
+                    results[(target, method)] = json.load(f)
+            else:
+                jobs.append((target_idx, target, method, params, path))
+
+    if jobs:
+        workers, cores_per_job = budget_cores(len(jobs), max_workers, total_cores)
+        x_block, x_spec = share_array(X.to_numpy(dtype=np.float64))
+        y_block, y_spec = share_array(Y.to_numpy(dtype=np.float64))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _run_importance, x_spec, y_spec, target_idx, method, params, cores_per_job
+                    ): (target, method, path)
+                    for target_idx, target, method, params, path in jobs
+                }
+                for future in as_completed(futures):
+                    target, method, path = futures[future]
+                    scores = future.result()
+                    results[(target, method)] = scores
+                    if path:
+                        os.makedirs(cache_dir, exist_ok=True)
+                        tmp_path = f"{path}.tmp"
+                        with open(tmp_path, "w") as f:
+                            json.dump(scores, f)
+                        os.replace(tmp_path, path)
+        finally:
+            release_shared_arrays([x_block, y_block])
+
+    frames = [
+        pd.DataFrame({"Target": target, "Feature": X.columns, "Measure": measure, "Score": values})
+        for (target, _), scores in results.items()
+        for measure, values in scores.items()
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def select_features(importances, min_tree_importance=1e-4, min_votes=2, max_features=None):
+    """
+    Reduce the feature set using all importance measures.
+
+    Each measure votes for a feature when its tree importance is at least
+    ``min_tree_importance``, its permutation importance is positive, or Lasso
+    keeps a non-zero coefficient. A feature is kept for a target with at least
+    ``min_votes`` votes (capped at the number of measures computed), and the
+    selection is the union over targets. With ``max_features``, the kept
+    features are ranked by their mean rank across targets and voting measures
+    and truncated; ties go to the feature that enters the Lasso path first
+    (highest mean ``lasso_entry_alpha``).
+
+    Returns:
+    --------
+    list of str
+        Selected features in their original column order
+    """
+    scores = importances.pivot_table(
+        index=["Target", "Feature"], columns="Measure", values="Score", sort=False
+    )
+    votes = []
+    if "tree_importance" in scores:
+        votes.append(scores["tree_importance"] >= min_tree_importance)
+    if "permutation_importance" in scores:
+        votes.append(scores["permutation_importance"] > 0)
+    if "lasso_coef" in scores:
+        votes.append(scores["lasso_coef"] > 0)
+    keep = sum(vote.astype(int) for vote in votes) >= min(min_votes, len(votes))
+
+    feature_order = importances["Feature"].drop_duplicates().tolist()
+    kept = set(keep[keep].index.get_level_values("Feature"))
+    selected = [feature for feature in feature_order if feature in kept]
+
+    if max_features is not None and len(selected) > max_features:
+        voting_measures = [
+            measure
+            for measure in ["tree_importance", "permutation_importance", "lasso_coef"]
+            if measure in scores
+        ]
+        ranking = pd.DataFrame(
+            {
+                "mean_rank": scores[voting_measures]
+                .groupby(level="Target")
+                .rank(ascending=False)
+                .groupby(level="Feature")
+                .mean()
+                .mean(axis=1)
+            }
+        )
+        sort_by, ascending = ["mean_rank"], [True]
+        if "lasso_entry_alpha" in scores:
+            ranking["entry_alpha"] = scores["lasso_entry_alpha"].groupby(level="Feature").mean()
+            sort_by, ascending = sort_by + ["entry_alpha"], ascending + [False]
+        ranking = ranking.loc[selected].sort_values(sort_by, ascending=ascending, kind="stable")
+        top = set(ranking.index[:max_features])
+        selected = [feature for feature in selected if feature in top]
+
+    return selected
+
+
+def save_selected_features(features, path=default_selected_features_path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(features, f, indent=2)
+
+
+def load_selected_features(path=default_selected_features_path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute feature importances and select features")
+    parser.add_argument("--features-file", default=hourly_features_file)
+    parser.add_argument("--methods", nargs="+", default=list(importance_methods), choices=list(importance_methods))
+    parser.add_argument("--min-tree-importance", type=float, default=1e-4)
+    parser.add_argument("--min-votes", type=int, default=2)
+    parser.add_argument("--max-features", type=int)
+    parser.add_argument(
+        "--train-fraction",
+        type=float,
+        default=0.8,
+        help="Leading fraction of rows to compute importances on, as in the training runner",
+    )
+    parser.add_argument("--max-workers", type=int)
+    parser.add_argument("--output", default=default_selected_features_path)
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    df = read_hourly_features_data_file(args.features_file)
+    X, Y = split_features_targets(df, forecast_targets)
+    importances = compute_feature_importances(
+        X, Y, methods=args.methods, train_fraction=args.train_fraction, max_workers=args.max_workers
+    )
+    selected = select_features(importances, args.min_tree_importance, args.min_votes, args.max_features)
+    save_selected_features(selected, args.output)
+    print(f"Selected {len(selected)} of {X.shape[1]} features, written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
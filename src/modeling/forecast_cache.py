@@ -0,0 +1,214 @@
+"""
+Precomputed forecast cache read by the Forecast dashboard.
+
+A refresh job produces forecasts for every target with the models in the
+registry and writes them, together with their generation time and a
+fingerprint of its inputs, to ``data/forecasts``. The dashboard only reads
+this cache, so rendering it never fits a model. The cache is stale once the
+fingerprint changes: when new raw Studer, Enphase or weather data lands, the
+features file is rebuilt, or a model version is saved to the registry.
+
+SARIMAX models, and tabular models whose features are all known in advance
+(calendar features and long enough lags, see ``src.modeling.future_features``),
+forecast past the last row of the features file. Models that need current
+observations cannot, so for them the cache holds a backtest of the last
+``horizon`` rows of the features file; each row records which of the two it is
+in ``Kind``.
+
+A lock file in the cache directory keeps concurrent refreshes from racing on
+the cache files; a refresh started while another one runs exits.
+
+Usage:
+    python -m src.modeling.forecast_cache --horizon 48
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from contextlib import contextmanager
+
+import pandas as pd
+
+from src.config.enphase_constants import enphase_15min_file
+from src.config.modeling_constants import forecast_targets, hourly_features_file
+from src.config.openweather_weather_constants import openweather_data_file
+from src.modeling.model_registry import get_registry
+from src.utils.data_fingerprint import fingerprint_files
+from src.utils.data_reader import get_sample_data_path, read_hourly_features_data_file
+from src.utils.file_store import atomic_write, exclusive_lock
+from src.utils.pandas_options import enable_copy_on_write
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+default_cache_dir = os.path.join(project_root, "data", "forecasts")
+forecast_file = "forecasts.csv"
+metadata_file = "forecasts.json"
+lock_file = ".refresh.lock"
+
+
+def forecast_source_paths(features_file=hourly_features_file, registry=None):
+    """Files the cached forecasts depend on: the raw data, the features file and every model version"""
+    registry = registry or get_registry()
+    return [
+        get_sample_data_path("studer"),
+        get_sample_data_path("enphase", enphase_15min_file),
+        get_sample_data_path("weather", openweather_data_file),
+        os.path.join(project_root, "data", "processed", features_file),
+        *registry.metadata_paths(),
+    ]
+
+
+def forecast_inputs_ready(features_file=hourly_features_file, registry=None):
+    """Whether the features file and at least one registered model exist"""
+    registry = registry or get_registry()
+    features_path = os.path.join(project_root, "data", "processed", features_file)
+    return os.path.exists(features_path) and bool(registry.metadata_paths())
+
+
+def write_forecast_cache(forecasts, metadata, cache_dir=default_cache_dir):
+    """Atomically replace the cached forecasts and their metadata"""
+    atomic_write(os.path.join(cache_dir, forecast_file), lambda f: forecasts.to_csv(f, index=False))
+    # Metadata goes last so readers never see new metadata next to old forecasts
+    atomic_write(os.path.join(cache_dir, metadata_file), lambda f: json.dump(metadata, f, indent=2))
+
+
+def read_forecast_cache(cache_dir=default_cache_dir):
+    """
+    Return (forecasts, metadata) or (None, None) if no cache has been written.
+
+    ``forecasts`` is a long frame with columns Target, Model, Kind, Timestamp and
+    Forecast, where Kind is "forecast" or "backtest".
+    """
+    metadata_path = os.path.join(cache_dir, metadata_file)
+    forecast_path = os.path.join(cache_dir, forecast_file)
+    if not (os.path.exists(metadata_path) and os.path.exists(forecast_path)):
+        return None, None
+
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    forecasts = pd.read_csv(forecast_path, parse_dates=["Timestamp"])
+    return forecasts, metadata
+
+
+def is_forecast_cache_stale(metadata, source_paths=None):
+    """A cache is stale when it is missing or its data or models changed since it was generated"""
+    if metadata is None:
+        return True
+    source_paths = source_paths or forecast_source_paths()
+    return metadata.get("data_fingerprint") != fingerprint_files(source_paths)
+
+
+def refresh_forecast_cache(
+    horizon=48,
+    targets=forecast_targets,
+    features_file=hourly_features_file,
+    model_names=None,
+    cache_dir=default_cache_dir,
+    registry=None,
+):
+    """
+    Forecast every target with the registered models and rewrite the cache.
+
+    ``model_names`` optionally maps a target to a registered model name; by
+    default the model with the lowest RMSE is used. Models that cannot predict
+    past the last feature row backtest its last ``horizon`` rows instead.
+    """
+    registry = registry or get_registry()
+    model_names = model_names or {}
+    source_paths = forecast_source_paths(features_file, registry)
+    data_fingerprint = fingerprint_files(source_paths)
+    features = read_hourly_features_data_file(features_file)
+
+    frames = []
+    models_used = {}
+    for target in targets:
+        forecast = registry.predict(
+            target, horizon, features=features, model_name=model_names.get(target)
+        )
+        _, _, model_metadata = registry.load(target, model_names.get(target))
+        kind = "forecast" if registry.forecastable_steps(model_metadata, horizon) else "backtest"
+        models_used[target] = {
+            "model_name": model_metadata["model_name"],
+            "version": model_metadata["version"],
+            "kind": kind,
+        }
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Target": target,
+                    "Model": model_metadata["model_name"],
+                    "Kind": kind,
+                    "Timestamp": forecast.index,
+                    "Forecast": forecast.to_numpy(),
+                }
+            )
+        )
+
+    metadata = {
+        "generated_at": pd.Timestamp.now().isoformat(),
+        "horizon": horizon,
+        "data_fingerprint": data_fingerprint,
+        "models": models_used,
+    }
+    write_forecast_cache(pd.concat(frames, ignore_index=True), metadata, cache_dir)
+    return metadata
+
+
+@contextmanager
+def refresh_lock(cache_dir=default_cache_dir):
+    """Exclusive lock on the cache for one refresh; the OS releases it if the refresh dies"""
+    with exclusive_lock(
+        os.path.join(cache_dir, lock_file), f"Another forecast refresh is writing {cache_dir}"
+    ):
+        yield
+
+
+def is_refresh_running(cache_dir=default_cache_dir):
+    """Whether a refresh currently holds the cache lock"""
+    try:
+        with refresh_lock(cache_dir):
+            return False
+    except RuntimeError:
+        return True
+
+
+def start_background_refresh(horizon=48):
+    """Launch the refresh job as a detached process so the caller never waits on model code"""
+    return subprocess.Popen(
+        [sys.executable, "-m", "src.modeling.forecast_cache", "--horizon", str(horizon)],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the precomputed forecast cache")
+    parser.add_argument("--horizon", type=int, default=48)
+    parser.add_argument("--features-file", default=hourly_features_file)
+    parser.add_argument(
+        "--if-stale",
+        action="store_true",
+        help="Only refresh when the data or models changed since the last run",
+    )
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    if args.if_stale:
+        _, metadata = read_forecast_cache()
+        if not is_forecast_cache_stale(metadata, forecast_source_paths(args.features_file)):
+            print("Forecast cache is up to date")
+            return
+
+    try:
+        with refresh_lock():
+            metadata = refresh_forecast_cache(horizon=args.horizon, features_file=args.features_file)
+    except RuntimeError as e:
+        print(e)
+        return
+    print(f"Forecast cache written at {metadata['generated_at']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Feature rows of the hours after the last row of the features file.
+
+Only features that are known in advance can be filled in: the calendar
+features, computed from the timestamp exactly as ``build_hourly_features``
+does, and lag features whose lag is at least the number of steps ahead, read
+from the history. Current observations and rolling windows are not known
+until the hour has passed, so a model trained on them cannot forecast; a model
+whose features are all known in advance can forecast as many steps ahead as
+its smallest lag.
+"""
+import pandas as pd
+
+from src.config.modeling_constants import cyclical_feature_periods, feature_lag_columns, hourly_lags
+from src.utils.feature_engineering import (
+    add_time_features,
+    add_time_of_day_features,
+    create_cyclical_features,
+)
+
+# Lag feature column -> (source column, lag in steps), as named by generate_lag_features
+lag_feature_sources = {
+    f"{column}_lag{lag}": (column, lag) for column in feature_lag_columns for lag in hourly_lags
+}
+
+
+def calendar_features(index):
+    """Calendar feature columns of the timestamps in ``index``"""
+    frame = add_time_features(pd.DataFrame({"timestamp": index}), "timestamp")
+    for column, period in cyclical_feature_periods.items():
+        frame = create_cyclical_features(frame, column, period)
+    frame = add_time_of_day_features(frame, "hour")
+    return frame.drop(columns="timestamp").set_index(pd.DatetimeIndex(index))
+
+
+def forecastable_steps(feature_columns, horizon):
+    """
+    Steps ahead, up to ``horizon``, whose rows ``build_future_features`` can fill for ``feature_columns``.
+
+    Returns 0 when any column is neither a calendar nor a lag feature.
+    """
+    calendar_columns = set(calendar_features(pd.DatetimeIndex([])).columns)
+    steps = horizon
+    for column in feature_columns:
+        if column in lag_feature_sources:
+            steps = min(steps, lag_feature_sources[column][1])
+        elif column not in calendar_columns:
+            return 0
+    return steps
+
+
+def forecast_feature_columns(feature_columns, horizon):
+    """The calendar features and lags of at least ``horizon`` steps among ``feature_columns``"""
+    calendar_columns = set(calendar_features(pd.DatetimeIndex([])).columns)
+    return [
+        column
+        for column in feature_columns
+        if column in calendar_columns
+        or (column in lag_feature_sources and lag_feature_sources[column][1] >= horizon)
+    ]
+
+
+def _source_values(history, source, step):
+    # The features file starts after its longest lag (incomplete rows are
+    # dropped), so the earliest values of a source only survive in its lag
+    # columns: the lag-k value of hour t is the source value of hour t - k.
+    values = history[source]
+    for lag in hourly_lags:
+        lag_column = f"{source}_lag{lag}"
+        if lag_column in history:
+            shifted = history[lag_column]
+            values = values.combine_first(shifted.set_axis(shifted.index - lag * step))
+    return values
+
+
+def build_future_features(history, feature_columns, steps, freq="1h"):
+    """
+    Feature rows of the ``steps`` timestamps after the last row of ``history``.
+
+    Parameters:
+    -----------
+    history : pandas.DataFrame
+        Hourly features frame indexed by timestamp, with the lagged source columns
+    feature_columns : list of str
+        Columns to build, all known ``steps`` ahead (see ``forecastable_steps``)
+    steps : int
+        Number of future rows
+
+    Returns:
+    --------
+    pandas.DataFrame
+        ``feature_columns`` indexed by the future timestamps; lags that fall in a
+        gap of the history are NaN
+    """
+    step = pd.Timedelta(freq)
+    index = pd.date_range(history.index[-1] + step, periods=steps, freq=freq, name=history.index.name)
+    future = calendar_features(index)
+    source_values = {}
+    for column in feature_columns:
+        if column in lag_feature_sources:
+            source, lag = lag_feature_sources[column]
+            if source not in source_values:
+                source_values[source] = _source_values(history, source, step)
+            future[column] = source_values[source].reindex(index - lag * step).to_numpy()
+    return future[feature_columns]
@@ -0,0 +1,309 @@
+"""
+Batch grid-quality KPI report over many sites and date ranges.
+
+Computes the voltage, frequency, grid connection, battery and import/export
+KPIs of ``grid_metrics_helpers`` and ``pq_metrics_helpers`` for every
+(site, date range) pair and writes one row per pair to CSV or Parquet. Each
+site's Studer data is loaded once and its KPI columns are shared with the
+worker processes through shared memory; ranges are sent to the workers in
+chunks and only the KPI rows travel back.
+
+Ranges are given explicitly (``--range 2024-01-01:2024-01-31``) or generated
+as calendar periods covering each site's data (``--period month``); without
+either, each site gets one row for its full range.
+
+Usage:
+    python -m src.modeling.grid_kpi_report --period month --output data/reports/monthly.csv
+    python -m src.modeling.grid_kpi_report --site main=data/sample/studer \\
+        --range 2024-01-01:2024-01-02 --range 2024-01-03:2024-01-05 --output report.parquet
+"""
+import argparse
+import importlib.util
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from src.modeling.shared_arrays import (
+    attach_shared_array,
+    budget_cores,
+    release_shared_arrays,
+    share_array,
+)
+from src.utils.data_reader import read_filtered_studer_data_directory
+from src.utils.grid_metrics_helpers import (
+    calculate_average_battery_soc,
+    calculate_battery_soc_stats,
+    calculate_frequency_stats,
+    calculate_import_export_stats,
+    calculate_total_battery_drain_days,
+    calculate_total_grid_disconnected_days,
+    calculate_total_grid_disconnected_instances,
+    calculate_total_import_export_efficiency,
+    calculate_total_import_export_grid,
+    calculate_total_load_shedding_days,
+    calculate_total_load_shedding_instances,
+    calculate_total_wrong_frequency_days,
+    calculate_total_wrong_frequency_instances,
+    calculate_uptime_percentage,
+    calculate_voltage_stats,
+)
+from src.utils.pandas_options import enable_copy_on_write
+from src.utils.pq_metrics_helpers import (
+    calculate_long_duration_voltage_variation,
+    calculate_power_frequency_variation,
+)
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+default_sites = {"sample": os.path.join(project_root, "data", "sample", "studer")}
+
+voltage_columns = ["Grid Input Voltage - L1", "Grid Input Voltage - L2", "Grid Input Voltage - L3"]
+frequency_columns = ["Grid Input Frequency - L1", "Grid Input Frequency - L2", "Grid Input Frequency - L3"]
+grid_status_columns = ["Studer Grid Status - L1", "Studer Grid Status - L2", "Studer Grid Status - L3"]
+import_export_columns = [
+    "Studer Grid Net Export/Import - L1-1",
+    "Studer Grid Net Export/Import - L2-2",
+    "Studer Grid Net Export/Import - L3-3",
+]
+kpi_columns = (
+    voltage_columns
+    + frequency_columns
+    + grid_status_columns
+    + ["Battery State of Charge"]
+    + import_export_columns
+)
+
+# Statistics of ``calculate_stats`` reported per column
+report_stats = ["Min", "Max", "Average", "Standard Deviation"]
+period_frequencies = {"day": "D", "week": "W", "month": "M", "quarter": "Q", "year": "Y"}
+
+
+def _flatten_stats(stats):
+    return {
+        f"{column} {stat}": stats.loc[column, stat]
+        for column in stats.index
+        for stat in report_stats
+    }
+
+
+def calculate_range_kpis(data):
+    """
+    Flat KPI set of one date range of Studer data.
+
+    Returns:
+    - dict of KPI name -> value; only "rows" when the range has no data
+    """
+    kpis = {"rows": len(data)}
+    if data.empty:
+        return kpis
+
+    load_shedding_days, non_load_shedding_days, load_shedding_efficiency = calculate_total_load_shedding_days(data)
+    kpis.update(
+        {
+            "load_shedding_instances": calculate_total_load_shedding_instances(data),
+            "total_load_shedding_days": load_shedding_days,
+            "total_non_load_shedding_days": non_load_shedding_days,
+            "load_shedding_efficiency": load_shedding_efficiency,
+            "uptime_percentage": calculate_uptime_percentage(data),
+        }
+    )
+    for column in voltage_columns:
+        kpis[f"{column} long duration variations"] = calculate_long_duration_voltage_variation(data, column)
+    kpis.update(_flatten_stats(calculate_voltage_stats(data)))
+
+    wrong_frequency_days, correct_frequency_days, frequency_efficiency = calculate_total_wrong_frequency_days(data)
+    kpis.update(
+        {
+            "wrong_freq_instances": calculate_total_wrong_frequency_instances(data),
+            "total_wrong_frequency_days": wrong_frequency_days,
+            "total_correct_frequency_days": correct_frequency_days,
+            "frequency_efficiency": frequency_efficiency,
+        }
+    )
+    for column in frequency_columns:
+        kpis[f"{column} power frequency variations"] = calculate_power_frequency_variation(data, column)
+    kpis.update(_flatten_stats(calculate_frequency_stats(data)))
+
+    disconnected_days, connected_days, grid_connection_efficiency = calculate_total_grid_disconnected_days(data)
+    kpis.update(
+        {
+            "grid_disconnected_instances": calculate_total_grid_disconnected_instances(data),
+            "total_grid_disconnected_days": disconnected_days,
+            "total_grid_connected_days": connected_days,
+            "grid_connection_efficiency": grid_connection_efficiency,
+        }
+    )
+
+    drain_days, charge_days, battery_support_efficiency = calculate_total_battery_drain_days(data)
+    kpis.update(
+        {
+            "avg_battery_soc": calculate_average_battery_soc(data),
+            "total_battery_drain_days": drain_days,
+            "total_battery_charge_days": charge_days,
+            "battery_support_efficiency": battery_support_efficiency,
+        }
+    )
+    kpis.update(_flatten_stats(calculate_battery_soc_stats(data)))
+
+    net_import_export, net_l1, net_l2, net_l3 = calculate_total_import_export_grid(data)
+    export_instances, import_instances, import_export_efficiency = calculate_total_import_export_efficiency(data)
+    kpis.update(
+        {
+            "net_import_export": net_import_export,
+            "net_import_export_l1": net_l1,
+            "net_import_export_l2": net_l2,
+            "net_import_export_l3": net_l3,
+            "total_export_instances": export_instances,
+            "total_import_instances": import_instances,
+            "import_export_efficiency": import_export_efficiency,
+        }
+    )
+    kpis.update(_flatten_stats(calculate_import_export_stats(data)))
+    return kpis
+
+
+def parse_range(text):
+    """Parse ``START:END`` (both days included) into a (start, end) pair of Timestamps"""
+    start, sep, end = text.partition(":")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected START:END, got {text!r}")
+    return pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+
+
+def period_ranges(index, period):
+    """Calendar periods (e.g. months) covering a datetime index, as (start, end) day pairs"""
+    periods = pd.period_range(index.min(), index.max(), freq=period_frequencies[period])
+    return [(p.start_time.normalize(), p.end_time.normalize()) for p in periods]
+
+
+def range_bounds(index, ranges):
+    """Row positions [start, stop) of every (start day, end day) range in a sorted index"""
+    return [
+        (
+            int(index.searchsorted(start, side="left")),
+            int(index.searchsorted(end + pd.Timedelta(days=1), side="left")),
+        )
+        for start, end in ranges
+    ]
+
+
+def _run_range_chunk(values_spec, index_spec, chunk):
+    values = attach_shared_array(values_spec)
+    index = pd.DatetimeIndex(attach_shared_array(index_spec).view("datetime64[ns]"))
+
+    rows = []
+    for position, start, stop in chunk:
+        data = pd.DataFrame(values[start:stop], index=index[start:stop], columns=kpi_columns)
+        rows.append((position, calculate_range_kpis(data)))
+    return rows
+
+
+def compute_site_report(studer_data, ranges, max_workers=None, chunks_per_worker=4):
+    """
+    KPIs of one site's Studer data for every range, in parallel.
+
+    Parameters:
+    - studer_data: frame of ``read_filtered_studer_data_directory``
+    - ranges: list of (start day, end day) Timestamps, both days included
+
+    Returns:
+    - DataFrame with one row per range, in the order of ``ranges``
+    """
+    studer_data = studer_data.sort_index()
+    bounds = range_bounds(studer_data.index, ranges)
+    numbered = [(position, start, stop) for position, (start, stop) in enumerate(bounds)]
+
+    workers, _ = budget_cores(len(numbered), max_workers)
+    chunk_size = max(1, math.ceil(len(numbered) / (workers * chunks_per_worker)))
+    chunks = [numbered[start:start + chunk_size] for start in range(0, len(numbered), chunk_size)]
+
+    values_block, values_spec = share_array(studer_data[kpi_columns].to_numpy(dtype=np.float64))
+    index_block, index_spec = share_array(studer_data.index.values.view("int64"))
+
+    rows = [None] * len(ranges)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=enable_copy_on_write,
+        ) as executor:
+            futures = [
+                executor.submit(_run_range_chunk, values_spec, index_spec, chunk)
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                for position, kpis in future.result():
+                    rows[position] = kpis
+    finally:
+        release_shared_arrays([values_block, index_block])
+
+    report = pd.DataFrame(rows)
+    report.insert(0, "start_date", [start.date() for start, _ in ranges])
+    report.insert(1, "end_date", [end.date() for _, end in ranges])
+    return report
+
+
+def write_report(report, output):
+    """Write the report as Parquet for ``.parquet`` paths and as CSV otherwise"""
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    if output.endswith(".parquet"):
+        report.to_parquet(output, index=False)
+    else:
+        report.to_csv(output, index=False)
+
+
+def parse_site(text):
+    name, sep, directory = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected NAME=DIRECTORY, got {text!r}")
+    return name, directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid-quality KPIs for many sites and date ranges")
+    parser.add_argument(
+        "--site",
+        type=parse_site,
+        action="append",
+        help="NAME=DIRECTORY of a site's Studer CSV files; repeatable (default: the sample data)",
+    )
+    parser.add_argument("--range", type=parse_range, action="append", dest="ranges", help="START:END, repeatable")
+    parser.add_argument("--period", choices=list(period_frequencies), help="One range per calendar period")
+    parser.add_argument("--max-workers", type=int)
+    parser.add_argument("--output", required=True, help="Report path, .csv or .parquet")
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    if args.output.endswith(".parquet") and not (
+        importlib.util.find_spec("pyarrow") or importlib.util.find_spec("fastparquet")
+    ):
+        parser.error("Parquet output needs pyarrow or fastparquet; install one or write .csv")
+
+    sites = dict(args.site) if args.site else default_sites
+    reports = []
+    for site, directory in sites.items():
+        start = time.perf_counter()
+        studer_data = read_filtered_studer_data_directory(directory)
+        if args.ranges:
+            ranges = args.ranges
+        elif args.period:
+            ranges = period_ranges(studer_data.index, args.period)
+        else:
+            ranges = [(studer_data.index.min().normalize(), studer_data.index.max().normalize())]
+
+        report = compute_site_report(studer_data, ranges, args.max_workers)
+        report.insert(0, "site", site)
+        reports.append(report)
+        print(f"{site}: {len(ranges)} ranges in {time.perf_counter() - start:.1f}s")
+
+    write_report(pd.concat(reports, ignore_index=True), args.output)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
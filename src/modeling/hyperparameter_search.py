@@ -0,0 +1,239 @@
+"""
+Budgeted successive-halving search over the Random Forest and XGBoost spaces.
+
+Candidates sampled from ``search_spaces`` are first scored with few trees /
+boosting rounds on ``TimeSeriesSplit`` folds. Only the best ``1 / eta`` of each
+rung moves on to ``eta`` times more trees, so unpromising configurations stop
+early. Evaluations of a rung run in parallel worker processes over a shared
+feature matrix, each rung splitting the cores between its candidates, and the
+search stops once the CPU time spent by the workers reaches
+``cpu_budget_seconds``.
+
+Usage:
+    python -m src.modeling.hyperparameter_search --model XGBoost \
+        --target "Energy Produced (Wh)" --cpu-budget 3600
+"""
+import argparse
+import math
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterSampler, TimeSeriesSplit
+
+from src.config.modeling_constants import forecast_targets, hourly_features_file
+from src.modeling.metrics import evaluate_model
+from src.modeling.shared_arrays import (
+    attach_shared_array,
+    budget_cores,
+    release_shared_arrays,
+    share_array,
+)
+from src.modeling.training_runner import model_builders, split_features_targets
+from src.utils.data_reader import read_hourly_features_data_file
+from src.utils.pandas_options import enable_copy_on_write
+
+search_spaces = {
+    "Random Forest": {
+        "max_depth": [None, 8, 12, 16, 24],
+        "min_samples_leaf": [1, 2, 4, 8],
+        "max_features": [1.0, "sqrt", 0.5, 0.3],
+    },
+    "XGBoost": {
+        "max_depth": [3, 4, 5, 6, 7],
+        "learning_rate": [0.01, 0.05, 0.1, 0.2],
+        "subsample": [0.6, 0.8, 1.0],
+        "colsample_bytree": [0.6, 0.8, 1.0],
+        "min_child_weight": [1, 3, 5],
+    },
+}
+
+
+def _evaluate_candidate(x_spec, y_spec, model_name, params, n_estimators, n_jobs, folds):
+    X = attach_shared_array(x_spec)
+    y = attach_shared_array(y_spec)[:, 0]
+
+    cpu_start = time.process_time()
+    fold_rmse = []
+    for train_idx, test_idx in folds:
+        model = model_builders[model_name](n_jobs, **params, n_estimators=n_estimators)
+        model.fit(X[train_idx], y[train_idx])
+        fold_rmse.append(evaluate_model(y[test_idx], model.predict(X[test_idx]))["RMSE"])
+
+    # process_time covers every thread of this worker, including estimator threads
+    return float(np.mean(fold_rmse)), time.process_time() - cpu_start
+
+
+def successive_halving_search(
+    X,
+    y,
+    model_name="XGBoost",
+    n_candidates=27,
+    eta=3,
+    min_estimators=25,
+    max_estimators=400,
+    n_splits=3,
+    cpu_budget_seconds=3600,
+    max_workers=None,
+    total_cores=None,
+    random_state=42,
+):
+    """
+    Successive-halving hyperparameter search capped by a total CPU-time budget.
+
+    Parameters:
+    -----------
+    X : pandas.DataFrame or numpy.ndarray
+        Numeric feature matrix ordered in time
+    y : pandas.Series or numpy.ndarray
+        Target aligned with ``X``
+    model_name : str, default 'XGBoost'
+        Key of ``model_builders`` and ``search_spaces``
+    n_candidates : int, default 27
+        Configurations sampled for the first rung
+    eta : int, default 3
+        Halving rate: each rung keeps ``1 / eta`` of the candidates and gives them
+        ``eta`` times more estimators
+    min_estimators, max_estimators : int
+        Trees / boosting rounds on the first and the largest rung
+    n_splits : int, default 3
+        ``TimeSeriesSplit`` folds per evaluation
+    cpu_budget_seconds : float, default 3600
+        Total CPU time the workers may spend. Once it is used up, evaluations
+        that have not started are cancelled; those already handed to a worker
+        cannot be interrupted, so they finish and are counted. The CPU time spent
+        therefore exceeds the budget by at most about one evaluation per worker.
+    max_workers, total_cores : int, optional
+        Parallelism limits, see ``budget_cores``
+    random_state : int, default 42
+        Seed for candidate sampling
+
+    Returns:
+    --------
+    tuple
+        (best_params, history) where ``best_params`` includes ``n_estimators`` and
+        ``history`` has one row per evaluation with its rung, RMSE and CPU time
+    """
+    candidates = list(
+        ParameterSampler(search_spaces[model_name], n_iter=n_candidates, random_state=random_state)
+    )
+    folds = list(TimeSeriesSplit(n_splits=n_splits).split(np.arange(len(X))))
+    workers, _ = budget_cores(len(candidates), max_workers, total_cores)
+
+    x_block, x_spec = share_array(np.asarray(X, dtype=np.float64))
+    y_block, y_spec = share_array(np.asarray(y, dtype=np.float64).reshape(-1, 1))
+
+    history = []
+    cpu_spent = 0.0
+    n_estimators = min_estimators
+    rung = 0
+    budget_exhausted = False
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            while candidates and not budget_exhausted:
+                # Later rungs have fewer candidates, so each one gets more cores
+                _, cores_per_job = budget_cores(len(candidates), max_workers, total_cores)
+                pending = {
+                    executor.submit(
+                        _evaluate_candidate,
+                        x_spec,
+                        y_spec,
+                        model_name,
+                        params,
+                        n_estimators,
+                        cores_per_job,
+                        folds,
+                    ): candidate_id
+                    for candidate_id, params in enumerate(candidates)
+                }
+                scores = {}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        candidate_id = pending.pop(future)
+                        rmse, cpu_seconds = future.result()
+                        cpu_spent += cpu_seconds
+                        scores[candidate_id] = rmse
+                        history.append(
+                            {
+                                "Rung": rung,
+                                "n_estimators": n_estimators,
+                                "Params": candidates[candidate_id],
+                                "RMSE": rmse,
+                                "CPU Seconds": cpu_seconds,
+                            }
+                        )
+                    if cpu_spent >= cpu_budget_seconds and not budget_exhausted:
+                        budget_exhausted = True
+                        # Evaluations a worker already picked up cannot be cancelled;
+                        # keep waiting for them so their CPU time is counted
+                        pending = {
+                            future: candidate_id
+                            for future, candidate_id in pending.items()
+                            if not future.cancel()
+                        }
+
+                if budget_exhausted or not scores or n_estimators >= max_estimators:
+                    break
+
+                ranked = sorted(scores, key=scores.get)
+                survivors = max(1, math.floor(len(ranked) / eta))
+                candidates = [candidates[candidate_id] for candidate_id in ranked[:survivors]]
+                n_estimators = min(n_estimators * eta, max_estimators)
+                rung += 1
+    finally:
+        release_shared_arrays([x_block, y_block])
+
+    history = pd.DataFrame(history)
+    if history.empty:
+        raise RuntimeError("CPU budget was exhausted before any configuration finished")
+
+    # Prefer the deepest rung reached, then the lowest error within it
+    best = history.sort_values(["n_estimators", "RMSE"], ascending=[False, True]).iloc[0]
+    best_params = {**best["Params"], "n_estimators": int(best["n_estimators"])}
+    return best_params, history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Budgeted successive-halving hyperparameter search")
+    parser.add_argument("--features-file", default=hourly_features_file)
+    parser.add_argument("--target", default=forecast_targets[0], choices=forecast_targets)
+    parser.add_argument("--model", default="XGBoost", choices=list(search_spaces))
+    parser.add_argument("--candidates", type=int, default=27)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--cpu-budget", type=float, default=3600, help="Total CPU seconds")
+    parser.add_argument("--max-workers", type=int)
+    parser.add_argument("--output", help="Optional CSV path for the evaluation history")
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    df = read_hourly_features_data_file(args.features_file)
+    X, Y = split_features_targets(df)
+    split_idx = int(len(X) * 0.8)
+
+    start = time.perf_counter()
+    best_params, history = successive_halving_search(
+        X.iloc[:split_idx],
+        Y[args.target].iloc[:split_idx],
+        model_name=args.model,
+        n_candidates=args.candidates,
+        eta=args.eta,
+        cpu_budget_seconds=args.cpu_budget,
+        max_workers=args.max_workers,
+    )
+    print(f"Best params for {args.model}: {best_params}")
+    print(
+        f"{len(history)} evaluations, {history['CPU Seconds'].sum():.0f} CPU seconds, "
+        f"{time.perf_counter() - start:.0f}s wall time"
+    )
+
+    if args.output:
+        history.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
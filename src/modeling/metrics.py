@@ -0,0 +1,52 @@
+import numpy as np
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+
+def smape(y_true, y_pred):
+    """Symmetric mean absolute percentage error, as used in the modeling notebooks"""
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    return 100 * np.mean(2 * np.abs(y_pred - y_true) / (np.abs(y_true) + np.abs(y_pred) + 1e-8))
+
+
+def evaluate_model(y_true, y_pred):
+    mae = mean_absolute_error(y_true, y_pred)
+    rmse = np.sqrt(mean_squared_error(y_true, y_pred))
+    r2 = r2_score(y_true, y_pred)
+    return {"MAE": mae, "RMSE": rmse, "SMAPE": smape(y_true, y_pred), "R2": r2}
+
+
+def error_sums(y_true, y_pred):
+    """
+    Additive error sums for one block of predictions.
+
+    Sums from many blocks can be added together and turned into pooled metrics
+    with ``metrics_from_error_sums`` without keeping the predictions around.
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    error = y_pred - y_true
+    return {
+        "n": len(y_true),
+        "abs_error": np.abs(error).sum(),
+        "squared_error": np.square(error).sum(),
+        "smape_terms": (2 * np.abs(error) / (np.abs(y_true) + np.abs(y_pred) + 1e-8)).sum(),
+        "y_sum": y_true.sum(),
+        "y_squared_sum": np.square(y_true).sum(),
+    }
+
+
+def metrics_from_error_sums(sums):
+    """Turn ``error_sums`` output (possibly added across blocks) into MAE, RMSE, SMAPE and R2"""
+    n = sums["n"]
+    if n == 0:
+        return {"MAE": np.nan, "RMSE": np.nan, "SMAPE": np.nan, "R2": np.nan}
+
+    total_variance = sums["y_squared_sum"] - sums["y_sum"] ** 2 / n
+    r2 = 1 - sums["squared_error"] / total_variance if total_variance > 0 else np.nan
+    return {
+        "MAE": sums["abs_error"] / n,
+        "RMSE": np.sqrt(sums["squared_error"] / n),
+        "SMAPE": 100 * sums["smape_terms"] / n,
+        "R2": r2,
+    }
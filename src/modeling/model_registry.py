@@ -0,0 +1,325 @@
+"""
+Local registry of fitted forecast models.
+
+Each saved model gets its own version directory::
+
+    data/models/<target>/<model>/<version>/
+        model.joblib | model.keras
+        scaler.joblib            (optional)
+        metadata.json            feature spec, training window, metrics, ...
+
+Models are loaded lazily, once per process, and reused by ``predict`` so a
+forecast costs a dictionary lookup plus the model's own inference time.
+
+Tabular models forecast past the last feature row only when every feature
+they use is known in advance (see ``src.modeling.future_features``); train
+them on ``forecast_feature_columns(X.columns, horizon)`` for that. Models that
+need current observations backtest the last rows of the features instead.
+
+Example:
+    registry = get_registry()
+    registry.save_model("Energy Produced (Wh)", "XGBoost", xgb_model,
+                        feature_columns=list(X.columns),
+                        training_index=X_train.index,
+                        metrics=evaluate_model(y_test, xgb_preds))
+    forecast = registry.predict("Energy Produced (Wh)", horizon=24, features=X)
+"""
+import glob
+import json
+import os
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.modeling.future_features import build_future_features, forecastable_steps
+from src.modeling.sequence_dataset import create_sequence_windows
+from src.utils.name_helpers import slugify
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+default_registry_root = os.path.join(project_root, "data", "models")
+
+
+def _is_keras_model(model):
+    return type(model).__module__.split(".")[0] in ("keras", "tensorflow", "tf_keras")
+
+
+def _is_statsmodels_results(model):
+    return type(model).__module__.startswith("statsmodels") and hasattr(model, "forecast")
+
+
+class ModelRegistry:
+    def __init__(self, root=default_registry_root):
+        self.root = root
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def _model_dir(self, target, model_name):
+        return os.path.join(self.root, slugify(target), slugify(model_name))
+
+    def save_model(
+        self,
+        target,
+        model_name,
+        model,
+        feature_columns=None,
+        training_index=None,
+        metrics=None,
+        scaler=None,
+        scaler_columns=None,
+        window=None,
+        params=None,
+    ):
+        """
+        Persist a fitted model with everything needed to forecast from it.
+
+        Parameters:
+        -----------
+        target : str
+            Forecast target column, e.g. 'Energy Produced (Wh)'
+        model_name : str
+            Model family, e.g. 'XGBoost', 'Random Forest', 'SARIMAX', 'LSTM'
+        model : object
+            Fitted sklearn/XGBoost estimator, statsmodels results or Keras model
+        feature_columns : list of str, optional
+            Columns the model was trained on, in order (not needed for SARIMAX)
+        training_index : pandas.Index, optional
+            Index of the training rows; its first and last timestamps are stored
+        metrics : dict, optional
+            Evaluation metrics, e.g. the output of ``evaluate_model``
+        scaler : object, optional
+            Fitted scaler such as the ``MinMaxScaler`` of the DL notebook
+        scaler_columns : list of str, optional
+            Columns the scaler was fitted on, defaults to ``feature_columns``
+        window : int, optional
+            Sequence length for sequence models
+        params : dict, optional
+            Hyperparameters, stored for reference
+
+        Returns:
+        --------
+        str
+            The new version identifier
+        """
+        model_dir = self._model_dir(target, model_name)
+        os.makedirs(model_dir, exist_ok=True)
+        version = pd.Timestamp.now().strftime("%Y%m%dT%H%M%S%f")
+
+        kind = "keras" if _is_keras_model(model) else "joblib"
+        metadata = {
+            "target": target,
+            "model_name": model_name,
+            "kind": kind,
+            "version": version,
+            "created_at": pd.Timestamp.now().isoformat(),
+            "feature_columns": list(feature_columns) if feature_columns is not None else None,
+            "scaler_columns": list(scaler_columns or feature_columns or []) if scaler is not None else None,
+            "window": window,
+            "training_start": str(training_index[0]) if training_index is not None and len(training_index) else None,
+            "training_end": str(training_index[-1]) if training_index is not None and len(training_index) else None,
+            "metrics": {key: float(value) for key, value in (metrics or {}).items()},
+            "params": params or {},
+        }
+
+        # Write into a scratch directory and rename it into place so readers never
+        # see a half-written version
+        staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=model_dir)
+        try:
+            if kind == "keras":
+                model.save(os.path.join(staging_dir, "model.keras"))
+            else:
+                joblib.dump(model, os.path.join(staging_dir, "model.joblib"))
+            if scaler is not None:
+                joblib.dump(scaler, os.path.join(staging_dir, "scaler.joblib"))
+            with open(os.path.join(staging_dir, "metadata.json"), "w") as f:
+                json.dump(metadata, f, indent=2)
+            os.replace(staging_dir, os.path.join(model_dir, version))
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+        with self._lock:
+            # Drop cached entries for this target, including the "best model" lookup
+            self._loaded = {key: value for key, value in self._loaded.items() if key[0] != target}
+        return version
+
+    def list_versions(self, target, model_name):
+        model_dir = self._model_dir(target, model_name)
+        if not os.path.isdir(model_dir):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(model_dir)
+            if not name.startswith(".") and os.path.isfile(os.path.join(model_dir, name, "metadata.json"))
+        )
+
+    def metadata_paths(self):
+        """Metadata files of every saved version; a new version changes the set"""
+        return sorted(glob.glob(os.path.join(self.root, "*", "*", "*", "metadata.json")))
+
+    def list_models(self):
+        """Metadata of the latest version of every registered (target, model) as a DataFrame"""
+        rows = []
+        if os.path.isdir(self.root):
+            for target_slug in sorted(os.listdir(self.root)):
+                target_dir = os.path.join(self.root, target_slug)
+                if not os.path.isdir(target_dir):
+                    continue
+                for model_slug in sorted(os.listdir(target_dir)):
+                    versions = sorted(
+                        name
+                        for name in os.listdir(os.path.join(target_dir, model_slug))
+                        if not name.startswith(".")
+                    )
+                    if versions:
+                        rows.append(self._read_metadata(os.path.join(target_dir, model_slug, versions[-1])))
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _read_metadata(version_dir):
+        with open(os.path.join(version_dir, "metadata.json")) as f:
+            return json.load(f)
+
+    def _best_model_name(self, target):
+        models = self.list_models()
+        if models.empty:
+            raise FileNotFoundError(f"No models registered under {self.root}")
+        models = models[models["target"] == target]
+        if models.empty:
+            raise FileNotFoundError(f"No models registered for target '{target}'")
+        rmse = models["metrics"].map(lambda metrics: metrics.get("RMSE", np.inf))
+        return models.loc[rmse.idxmin(), "model_name"]
+
+    def load(self, target, model_name=None, version=None):
+        """
+        Return (model, scaler, metadata), loading from disk only on first use in this process.
+
+        ``model_name`` defaults to the registered model with the lowest RMSE and
+        ``version`` to the latest one.
+        """
+        key = (target, model_name, version)
+        loaded = self._loaded.get(key)
+        if loaded is not None:
+            return loaded
+
+        with self._lock:
+            loaded = self._loaded.get(key)
+            if loaded is not None:
+                return loaded
+
+            resolved_name = model_name or self._best_model_name(target)
+            versions = self.list_versions(target, resolved_name)
+            if not versions:
+                raise FileNotFoundError(f"No saved versions of '{resolved_name}' for '{target}'")
+            resolved_version = version or versions[-1]
+            version_dir = os.path.join(self._model_dir(target, resolved_name), resolved_version)
+
+            metadata = self._read_metadata(version_dir)
+            if metadata["kind"] == "keras":
+                from tensorflow import keras
+
+                model = keras.models.load_model(os.path.join(version_dir, "model.keras"))
+            else:
+                model = joblib.load(os.path.join(version_dir, "model.joblib"))
+
+            scaler_path = os.path.join(version_dir, "scaler.joblib")
+            scaler = joblib.load(scaler_path) if os.path.exists(scaler_path) else None
+
+            loaded = (model, scaler, metadata)
+            self._loaded[key] = loaded
+            return loaded
+
+    @staticmethod
+    def forecastable_steps(metadata, horizon):
+        """
+        Steps past the last feature row, up to ``horizon``, a registered model can forecast.
+
+        SARIMAX forecasts any horizon and sequence models none. Tabular models
+        forecast up to their smallest lag when all their features are known in
+        advance, and none otherwise.
+        """
+        if metadata["feature_columns"] is None:
+            return horizon
+        if metadata["window"]:
+            return 0
+        return forecastable_steps(metadata["feature_columns"], horizon)
+
+    def predict(self, target, horizon, features=None, model_name=None, version=None):
+        """
+        Forecast the next ``horizon`` steps of ``target`` with a registered model.
+
+        Parameters:
+        -----------
+        target : str
+            Forecast target column
+        horizon : int
+            Number of steps to forecast
+        features : pandas.DataFrame, optional
+            Hourly features frame ending at the last observed hour. Tabular models
+            whose features are known in advance read the lags of the future rows
+            from it; other feature-based models cannot see past it and backtest its
+            last ``horizon`` rows instead (sequence models also need the preceding
+            ``window`` rows). Not needed for SARIMAX.
+        model_name, version : str, optional
+            See ``load``
+
+        Returns:
+        --------
+        pandas.Series
+            Predicted values, indexed by their timestamps when known; a forecast is
+            cut to ``forecastable_steps`` rows, a backtest has ``horizon`` rows
+        """
+        model, scaler, metadata = self.load(target, model_name, version)
+
+        if _is_statsmodels_results(model):
+            return model.forecast(steps=horizon)
+
+        if features is None:
+            raise ValueError(f"'{metadata['model_name']}' needs feature rows to forecast")
+
+        if metadata["window"]:
+            return self._predict_sequences(model, scaler, metadata, features, horizon)
+
+        steps = self.forecastable_steps(metadata, horizon)
+        if steps:
+            X = build_future_features(features, metadata["feature_columns"], steps)
+        else:
+            X = features[metadata["feature_columns"]].iloc[-horizon:]
+        return pd.Series(model.predict(X), index=X.index, name=target)
+
+    @staticmethod
+    def _predict_sequences(model, scaler, metadata, features, horizon):
+        window = metadata["window"]
+        feature_columns = metadata["feature_columns"]
+        target = metadata["target"]
+        if len(features) < horizon + window:
+            raise ValueError(f"Sequence models need {horizon + window} feature rows (window + horizon)")
+        rows = features.iloc[-(horizon + window):]
+
+        values = rows.reindex(columns=metadata["scaler_columns"] or feature_columns, fill_value=0.0)
+        if scaler is not None:
+            values = pd.DataFrame(scaler.transform(values), index=values.index, columns=values.columns)
+
+        # As in training, window k covers rows [k, k + window) and predicts row
+        # k + window, so the horizon windows end just before each forecast row
+        X_seq, _ = create_sequence_windows(values[feature_columns].to_numpy(), np.zeros(len(rows)), window)
+        predictions = np.asarray(model.predict(X_seq, verbose=0)).reshape(-1)
+
+        if scaler is not None and target in values.columns:
+            # Undo the target scaling through a matrix that only holds the target column
+            target_idx = values.columns.get_loc(target)
+            scaled = np.zeros((len(predictions), values.shape[1]))
+            scaled[:, target_idx] = predictions
+            predictions = scaler.inverse_transform(scaled)[:, target_idx]
+
+        return pd.Series(predictions, index=rows.index[-horizon:], name=target)
+
+
+@lru_cache(maxsize=None)
+def get_registry(root=default_registry_root):
+    """Process-wide registry instance per root, so loaded models are shared"""
+    return ModelRegistry(root)
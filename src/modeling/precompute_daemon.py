@@ -0,0 +1,311 @@
+"""
+Headless precompute daemon for the dashboard aggregates.
+
+Every ``--interval`` seconds the daemon fingerprints the Studer, Enphase and
+weather sources and the forecast inputs (those sources plus the hourly
+features file and the registered models) and runs the jobs whose source changed
+since their last successful run: hourly resamples, daily summaries, the grid
+KPIs of the full range, the Enphase decompositions and the forecasts. Jobs
+run in a small process pool (``--max-workers``) and their results are written
+atomically to the store in ``src.utils.precomputed_store``, which dashboards
+only read. Decompositions and forecasts keep their own caches and are
+refreshed in place.
+
+Jobs are idempotent: a job is identified by its name and the fingerprint of
+its source, and is skipped once the manifest records it as done. The manifest
+is written by the daemon process only, before (status "running") and after
+each job. A job still marked "running" when the daemon starts was interrupted
+by a crash and simply runs again; failed jobs are retried on later cycles up
+to ``max_attempts`` times per source version. A lock file keeps a second
+daemon from sharing the store.
+
+Usage:
+    python -m src.modeling.precompute_daemon --once
+    python -m src.modeling.precompute_daemon --interval 900 --max-workers 2
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import pandas as pd
+
+from src.config.enphase_constants import enphase_15min_file, enphase_energy_metrics
+from src.config.openweather_weather_constants import openweather_data_file
+from src.utils.data_fingerprint import expand_source_paths, fingerprint_files
+from src.utils.data_processing import daily_summary, daily_totals, resample_numeric_data
+from src.utils.data_reader import (
+    get_sample_data_path,
+    read_enphase_15min_data_file,
+    read_filtered_studer_data_directory,
+    read_filtered_weather_open_weather_data_file,
+)
+from src.utils.file_store import exclusive_lock
+from src.utils.grid_section_metrics import grid_section_metrics
+from src.utils.pandas_options import enable_copy_on_write
+from src.utils.precomputed_store import (
+    default_store_dir,
+    precompute_version,
+    read_manifest,
+    write_artifact,
+    write_manifest,
+)
+from src.utils.weather_helpers import clean_weather_data
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+studer_data_dir = os.path.join(project_root, "data", "sample", "studer")
+lock_file = ".daemon.lock"
+
+default_interval_seconds = 900
+max_attempts = 3
+
+
+def precompute_sources():
+    """Source name -> paths whose fingerprint versions the jobs reading that source"""
+    # Imported here like the forecast job, which loads the model code only when it runs
+    from src.modeling.forecast_cache import forecast_inputs_ready, forecast_source_paths
+
+    return {
+        "studer": [studer_data_dir],
+        "enphase": [get_sample_data_path("enphase", enphase_15min_file)],
+        "weather": [get_sample_data_path("weather", openweather_data_file)],
+        # Raw data, features file and registered model versions; skipped until
+        # the features file and a model exist
+        "forecast_inputs": forecast_source_paths() if forecast_inputs_ready() else [],
+    }
+
+
+def load_source(source):
+    if source == "studer":
+        return read_filtered_studer_data_directory(studer_data_dir)
+    if source == "enphase":
+        return read_enphase_15min_data_file(enphase_15min_file)
+    if source == "weather":
+        return clean_weather_data(read_filtered_weather_open_weather_data_file(openweather_data_file))
+    raise ValueError(f"Source {source} has no loader")
+
+
+def calculate_grid_kpis(studer_data):
+    """Metrics of every grid dashboard section over the full Studer range"""
+    return {
+        section_name: calculate_section(studer_data)
+        for section_name, calculate_section in grid_section_metrics.items()
+    }
+
+
+def refresh_decompositions():
+    from src.modeling.decomposition_service import refresh_decomposition_cache
+
+    refresh_decomposition_cache(method="stl")
+
+
+def refresh_forecasts():
+    from src.modeling.forecast_cache import refresh_forecast_cache, refresh_lock
+
+    # The lock the CLI and the dashboard's refresh take; while one of them runs
+    # this job fails and is retried on the next cycle
+    with refresh_lock():
+        refresh_forecast_cache()
+
+
+# Job name -> (source, function computing the stored artifact from the source data)
+artifact_jobs = {
+    "studer_hourly": ("studer", resample_numeric_data),
+    "studer_daily_summary": ("studer", daily_summary),
+    "grid_kpis": ("studer", calculate_grid_kpis),
+    "enphase_hourly": (
+        "enphase",
+        lambda data: data[enphase_energy_metrics].resample("1h").sum(min_count=1),
+    ),
+    "enphase_daily_energy": ("enphase", daily_totals),
+    "weather_daily_summary": ("weather", daily_summary),
+}
+
+# Job name -> (source, function refreshing a cache that lives outside the store)
+cache_jobs = {
+    "decompositions": ("enphase", refresh_decompositions),
+    "forecasts": ("forecast_inputs", refresh_forecasts),
+}
+
+# Source data loaded in a worker process: source -> (fingerprint, data)
+_worker_source_data = {}
+
+
+def run_precompute_job(job_name, data_fingerprint, store_dir):
+    """
+    Worker task: run one job and write its result.
+
+    Returns:
+    - (file name of the artifact in the store, or None for jobs with their own
+      cache, run time in seconds)
+    """
+    start = time.perf_counter()
+    if job_name in cache_jobs:
+        _, refresh = cache_jobs[job_name]
+        refresh()
+        return None, time.perf_counter() - start
+
+    source, compute = artifact_jobs[job_name]
+    cached = _worker_source_data.get(source)
+    if cached is None or cached[0] != data_fingerprint:
+        _worker_source_data[source] = (data_fingerprint, load_source(source))
+    _, data = _worker_source_data[source]
+    file_name = write_artifact(job_name, data_fingerprint, compute(data), store_dir)
+    return file_name, time.perf_counter() - start
+
+
+def job_source(job_name):
+    return (artifact_jobs.get(job_name) or cache_jobs[job_name])[0]
+
+
+def needs_run(entry, data_fingerprint, store_dir):
+    """Whether a job must run for the current fingerprint of its source"""
+    if (
+        entry is None
+        or entry.get("data_fingerprint") != data_fingerprint
+        or entry.get("version") != precompute_version
+    ):
+        return True
+    if entry["status"] == "done":
+        # A deleted artifact is recomputed
+        return bool(entry.get("file")) and not os.path.exists(os.path.join(store_dir, entry["file"]))
+    if entry["status"] == "failed":
+        return entry.get("attempts", 0) < max_attempts
+    # "running": the daemon that started it crashed or was killed
+    return True
+
+
+def remove_stale_files(store_dir, manifest):
+    """Delete temporary files of interrupted writes and artifacts the manifest no longer points to"""
+    current = {entry.get("file") for entry in manifest.get("jobs", {}).values()}
+    for path in glob.glob(os.path.join(store_dir, ".tmp-*")):
+        os.remove(path)
+    for path in glob.glob(os.path.join(store_dir, "*-*.csv")) + glob.glob(os.path.join(store_dir, "*-*.pkl")):
+        if os.path.basename(path) not in current:
+            os.remove(path)
+
+
+@contextmanager
+def daemon_lock(store_dir):
+    """Exclusive lock on the store; the OS releases it if the daemon dies"""
+    with exclusive_lock(os.path.join(store_dir, lock_file), f"Another precompute daemon is using {store_dir}"):
+        yield
+
+
+def run_pending_jobs(store_dir=default_store_dir, max_workers=1, job_names=None):
+    """
+    Run every job whose source changed since its last successful run.
+
+    Returns:
+    - the manifest entries of the jobs that ran, by job name
+    """
+    manifest = read_manifest(store_dir)
+    jobs = manifest.setdefault("jobs", {})
+    manifest["version"] = precompute_version
+
+    sources = precompute_sources()
+    fingerprints = {
+        source: fingerprint_files(paths)
+        for source, paths in sources.items()
+        # Sources without files are skipped until data lands
+        if expand_source_paths(paths)
+    }
+
+    pending = []
+    for job_name in job_names or list(artifact_jobs) + list(cache_jobs):
+        data_fingerprint = fingerprints.get(job_source(job_name))
+        if data_fingerprint is None:
+            continue
+        entry = jobs.get(job_name)
+        if not needs_run(entry, data_fingerprint, store_dir):
+            continue
+        attempts = entry.get("attempts", 0) if entry and entry.get("data_fingerprint") == data_fingerprint else 0
+        jobs[job_name] = {
+            **(entry or {}),
+            "status": "running",
+            "data_fingerprint": data_fingerprint,
+            "version": precompute_version,
+            "attempts": attempts,
+            "started_at": pd.Timestamp.now().isoformat(),
+        }
+        pending.append(job_name)
+
+    if not pending:
+        return {}
+    write_manifest(manifest, store_dir)
+
+    replaced_files = []
+    # spawn: workers start clean and release their memory when the cycle ends
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(pending)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=enable_copy_on_write,
+    ) as executor:
+        futures = {
+            executor.submit(
+                run_precompute_job, job_name, jobs[job_name]["data_fingerprint"], store_dir
+            ): job_name
+            for job_name in pending
+        }
+        for future in as_completed(futures):
+            job_name = futures[future]
+            entry = jobs[job_name]
+            try:
+                file_name, duration = future.result()
+            except Exception as e:
+                # Includes BrokenProcessPool when a worker is killed (e.g. out of memory)
+                entry.update(
+                    status="failed",
+                    attempts=entry["attempts"] + 1,
+                    error="".join(traceback.format_exception_only(e)).strip(),
+                )
+            else:
+                if entry.get("file") and entry["file"] != file_name:
+                    replaced_files.append(entry["file"])
+                entry.pop("error", None)
+                entry.update(
+                    status="done",
+                    file=file_name,
+                    attempts=0,
+                    generated_at=pd.Timestamp.now().isoformat(),
+                    duration_seconds=round(duration, 3),
+                )
+            write_manifest(manifest, store_dir)
+
+    # Old versions go only after the manifest stopped pointing at them
+    for file_name in replaced_files:
+        path = os.path.join(store_dir, file_name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    return {job_name: jobs[job_name] for job_name in pending}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute dashboard aggregates when new data lands")
+    parser.add_argument("--store-dir", default=default_store_dir)
+    parser.add_argument("--once", action="store_true", help="Run one cycle and exit")
+    parser.add_argument("--interval", type=float, default=default_interval_seconds, help="Seconds between cycles")
+    parser.add_argument("--max-workers", type=int, default=max(1, (os.cpu_count() or 1) - 1))
+    parser.add_argument("--jobs", nargs="+", choices=list(artifact_jobs) + list(cache_jobs))
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    with daemon_lock(args.store_dir):
+        remove_stale_files(args.store_dir, read_manifest(args.store_dir))
+        while True:
+            ran = run_pending_jobs(args.store_dir, args.max_workers, args.jobs)
+            for job_name, entry in ran.items():
+                detail = entry.get("error") or f"{entry.get('duration_seconds', 0):.1f} s"
+                print(f"{pd.Timestamp.now():%Y-%m-%d %H:%M:%S} {job_name}: {entry['status']} ({detail})", flush=True)
+            if args.once:
+                break
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Sliding-window sequence datasets for the LSTM/GRU/Transformer models.
+
+``create_sequences`` in ``06_modeling_dl.ipynb`` stacks every window into a new
+(n, window, features) array. The helpers here build the same windows as a
+read-only view over the feature matrix and copy only one mini-batch at a time.
+
+Example:
+    X_seq, y_seq = create_sequence_windows(X, y, window=168)
+    (X_train, y_train), (X_test, y_test) = split_sequences(X_seq, y_seq, 0.8)
+    (X_fit, y_fit), (X_val, y_val) = split_sequences(X_train, y_train, 0.8)
+
+    model.fit(
+        sequence_batch_generator(X_fit, y_fit, batch_size=16, seed=42),
+        steps_per_epoch=count_batches(len(y_fit), 16),
+        validation_data=sequence_batch_generator(X_val, y_val, 16, shuffle=False),
+        validation_steps=count_batches(len(y_val), 16),
+        epochs=50,
+    )
+"""
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def create_sequence_windows(features, target, window):
+    """
+    Build the inputs and targets of ``create_sequences`` without copying.
+
+    Parameters:
+    -----------
+    features : array-like of shape (n_samples, n_features)
+        Feature matrix ordered in time
+    target : array-like of shape (n_samples,)
+        Target values aligned with ``features``
+    window : int
+        Number of past time steps in each input sequence
+
+    Returns:
+    --------
+    tuple of numpy.ndarray
+        ``X`` is a read-only view of shape (n_samples - window, window, n_features)
+        where ``X[i] == features[i:i + window]``, and ``y[i] == target[i + window]``
+    """
+    features = np.asarray(features)
+    target = np.asarray(target)
+
+    if features.ndim != 2:
+        raise ValueError("features must be a 2-D array of shape (n_samples, n_features)")
+    if len(features) != len(target):
+        raise ValueError("features and target must have the same length")
+    if not 0 < window < len(features):
+        raise ValueError("window must be between 1 and the number of samples - 1")
+
+    # sliding_window_view puts the window axis last: (n - window + 1, n_features, window)
+    windows = sliding_window_view(features, window, axis=0).transpose(0, 2, 1)
+
+    return windows[:-1], target[window:]
+
+
+def split_sequences(X, y, train_fraction=0.8):
+    """Split sequence views in time order, returning ((X_train, y_train), (X_test, y_test)) views"""
+    split_idx = int(len(X) * train_fraction)
+    return (X[:split_idx], y[:split_idx]), (X[split_idx:], y[split_idx:])
+
+
+def count_batches(n_samples, batch_size):
+    """Number of mini-batches needed to cover ``n_samples``, for Keras ``steps_per_epoch``"""
+    return math.ceil(n_samples / batch_size)
+
+
+def iterate_sequence_batches(X, y, batch_size=16, shuffle=True, seed=None):
+    """
+    Yield one pass of (X_batch, y_batch) mini-batches over a sequence view.
+
+    Only the current batch is copied out of ``X``, so memory stays at
+    ``batch_size * window * n_features`` regardless of the window length.
+    """
+    n_samples = len(X)
+    order = np.arange(n_samples)
+    if shuffle:
+        np.random.default_rng(seed).shuffle(order)
+
+    for start in range(0, n_samples, batch_size):
+        batch_idx = order[start:start + batch_size]
+        # Sorted indices keep the gathered reads close together in memory
+        batch_idx.sort()
+        yield X[batch_idx], y[batch_idx]
+
+
+def sequence_batch_generator(X, y, batch_size=16, shuffle=True, seed=None):
+    """
+    Endless mini-batch generator for ``model.fit``, reshuffled every epoch.
+
+    Pair with ``steps_per_epoch=count_batches(len(X), batch_size)``.
+    """
+    rng = np.random.default_rng(seed)
+    while True:
+        epoch_seed = rng.integers(2**32) if shuffle else None
+        yield from iterate_sequence_batches(X, y, batch_size, shuffle, epoch_seed)
+
+
+def predict_sequences(model, X, batch_size=256):
+    """Predict over a sequence view batch by batch and return a flat prediction array"""
+    predictions = [
+        np.asarray(model.predict(X[start:start + batch_size], verbose=0)).reshape(-1)
+        for start in range(0, len(X), batch_size)
+    ]
+    if not predictions:
+        return np.empty(0)
+    return np.concatenate(predictions)
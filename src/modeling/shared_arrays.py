@@ -0,0 +1,72 @@
+"""
+Share read-only numpy arrays with worker processes through shared memory.
+
+The parent copies an array into a ``SharedMemory`` block once; workers attach to
+it by name and get a zero-copy view instead of unpickling their own copy.
+"""
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Blocks attached in this process, kept alive for as long as the views are used
+_attached_blocks = {}
+
+
+def share_array(array):
+    """
+    Copy ``array`` into a new shared memory block.
+
+    Returns:
+    --------
+    tuple
+        (SharedMemory, spec) where ``spec`` is a small picklable dict to pass to
+        ``attach_shared_array`` in workers. The caller must ``close()`` and
+        ``unlink()`` the block once all workers are done.
+    """
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    shared[...] = array
+
+    spec = {"name": block.name, "shape": array.shape, "dtype": array.dtype.str}
+    return block, spec
+
+
+def attach_shared_array(spec):
+    """Return a read-only view of the shared block described by ``spec``"""
+    block = _attached_blocks.get(spec["name"])
+    if block is None:
+        block = shared_memory.SharedMemory(name=spec["name"])
+        _attached_blocks[spec["name"]] = block
+
+    array = np.ndarray(spec["shape"], dtype=np.dtype(spec["dtype"]), buffer=block.buf)
+    array.flags.writeable = False
+    return array
+
+
+def release_shared_arrays(blocks):
+    """Close and unlink shared blocks created with ``share_array``"""
+    for block in blocks:
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def budget_cores(n_jobs, max_workers=None, total_cores=None):
+    """
+    Split the machine's cores between concurrent jobs.
+
+    Returns:
+    --------
+    tuple of int
+        (workers, cores_per_job) such that ``workers * cores_per_job`` never
+        exceeds ``total_cores``, so estimator-level ``n_jobs`` cannot oversubscribe.
+    """
+    total_cores = total_cores or os.cpu_count() or 1
+    workers = min(n_jobs, max_workers or total_cores, total_cores)
+    workers = max(workers, 1)
+    cores_per_job = max(total_cores // workers, 1)
+    return workers, cores_per_job
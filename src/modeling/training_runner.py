@@ -0,0 +1,193 @@
+"""
+Train every (target, model) pair of ``05_modeling_ml.ipynb`` across a process pool.
+
+The feature matrix is loaded once and placed in shared memory; each worker fits
+one model on a zero-copy view with its share of the cores, and the
+``evaluate_model`` metrics of all jobs are collected into one results table.
+
+Usage:
+    python -m src.modeling.training_runner --output results/ml_results.csv
+"""
+import argparse
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from xgboost import XGBRegressor
+
+from src.config.modeling_constants import forecast_targets, hourly_features_file
+from src.modeling.metrics import evaluate_model
+from src.modeling.shared_arrays import (
+    attach_shared_array,
+    budget_cores,
+    release_shared_arrays,
+    share_array,
+)
+from src.utils.data_reader import read_hourly_features_data_file
+from src.utils.pandas_options import enable_copy_on_write
+
+
+def build_random_forest(n_jobs, **params):
+    params = {"n_estimators": 100, "random_state": 42, **params}
+    return RandomForestRegressor(n_jobs=n_jobs, **params)
+
+
+def build_xgboost(n_jobs, **params):
+    params = {"n_estimators": 100, "learning_rate": 0.1, "random_state": 42, **params}
+    return XGBRegressor(n_jobs=n_jobs, **params)
+
+
+model_builders = {
+    "Random Forest": build_random_forest,
+    "XGBoost": build_xgboost,
+}
+
+# Rough relative fit cost, used to start the slowest jobs first
+model_costs = {
+    "Random Forest": 3,
+    "XGBoost": 1,
+}
+
+
+def split_features_targets(df, targets=forecast_targets):
+    """Split the hourly feature frame into the numeric feature matrix X and the targets Y"""
+    X = df.drop(columns=targets).select_dtypes(include=[np.number])
+    Y = df[targets]
+    return X, Y
+
+
+def _fit_and_evaluate(x_spec, y_spec, target_idx, target, model_name, params, n_jobs, split_idx):
+    X = attach_shared_array(x_spec)
+    y = attach_shared_array(y_spec)[:, target_idx]
+
+    model = model_builders[model_name](n_jobs, **params)
+    start = time.perf_counter()
+    model.fit(X[:split_idx], y[:split_idx])
+    fit_seconds = time.perf_counter() - start
+
+    predictions = model.predict(X[split_idx:])
+    result = evaluate_model(y[split_idx:], predictions)
+    result.update(
+        {
+            "Target": target,
+            "Model": model_name,
+            "Fit Seconds": fit_seconds,
+            "n_jobs": n_jobs,
+        }
+    )
+    return result
+
+
+def run_training_grid(
+    X,
+    Y,
+    models=None,
+    model_params=None,
+    train_fraction=0.8,
+    max_workers=None,
+    total_cores=None,
+):
+    """
+    Fit and evaluate every (target, model) pair in parallel.
+
+    Parameters:
+    -----------
+    X : pandas.DataFrame
+        Numeric feature matrix ordered in time
+    Y : pandas.DataFrame
+        Target columns aligned with ``X``
+    models : list of str, optional
+        Keys of ``model_builders`` to train, defaults to all of them
+    model_params : dict, optional
+        Extra estimator parameters per model name, e.g. tuned hyperparameters
+    train_fraction : float, default 0.8
+        Fraction of rows used for training in the time-aware split
+    max_workers : int, optional
+        Upper bound on concurrent jobs, defaults to one per (target, model) pair
+    total_cores : int, optional
+        Cores to share between jobs, defaults to ``os.cpu_count()``
+
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per (target, model) with MAE, RMSE, SMAPE, R2 and fit time
+    """
+    models = models or list(model_builders)
+    model_params = model_params or {}
+    split_idx = int(len(X) * train_fraction)
+
+    jobs = [
+        (target_idx, target, model_name)
+        for target_idx, target in enumerate(Y.columns)
+        for model_name in models
+    ]
+    jobs.sort(key=lambda job: model_costs.get(job[2], 1), reverse=True)
+    workers, cores_per_job = budget_cores(len(jobs), max_workers, total_cores)
+
+    x_block, x_spec = share_array(X.to_numpy(dtype=np.float64))
+    y_block, y_spec = share_array(Y.to_numpy(dtype=np.float64))
+
+    results = []
+    try:
+        # Spawned workers avoid forking a parent that may hold OpenMP thread state
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _fit_and_evaluate,
+                    x_spec,
+                    y_spec,
+                    target_idx,
+                    target,
+                    model_name,
+                    model_params.get(model_name, {}),
+                    cores_per_job,
+                    split_idx,
+                )
+                for target_idx, target, model_name in jobs
+            ]
+            for future in as_completed(futures):
+                results.append(future.result())
+    finally:
+        release_shared_arrays([x_block, y_block])
+
+    results_df = pd.DataFrame(results)
+    columns = ["Target", "Model", "MAE", "RMSE", "SMAPE", "R2", "Fit Seconds", "n_jobs"]
+    return results_df[columns].sort_values(["Target", "Model"], ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train all forecast targets and models in parallel")
+    parser.add_argument("--features-file", default=hourly_features_file)
+    parser.add_argument("--models", nargs="+", choices=list(model_builders))
+    parser.add_argument("--max-workers", type=int)
+    parser.add_argument(
+        "--selected-features",
+        help="JSON feature list written by src.modeling.feature_selection",
+    )
+    parser.add_argument("--output", help="Optional CSV path for the results table")
+    args = parser.parse_args()
+    enable_copy_on_write()
+
+    df = read_hourly_features_data_file(args.features_file)
+    X, Y = split_features_targets(df)
+    if args.selected_features:
+        with open(args.selected_features) as f:
+            X = X[json.load(f)]
+
+    start = time.perf_counter()
+    results_df = run_training_grid(X, Y, models=args.models, max_workers=args.max_workers)
+    print(results_df.round(2).to_string(index=False))
+    print(f"Grid finished in {time.perf_counter() - start:.1f}s")
+
+    if args.output:
+        results_df.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
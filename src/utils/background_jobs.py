@@ -0,0 +1,228 @@
+"""
+Background worker pool for long dashboard computations.
+
+Dashboards submit a job as a list of independent, named tasks (for example one
+per section or per month) to a process pool shared by all sessions, and render
+the tasks that have finished instead of blocking the script thread until
+everything is done. A progress fragment polls the running job and reruns the
+page whenever another task finishes.
+
+Each job belongs to a scope (a dashboard or widget group of one session, see
+``session_scope``) and is identified by a key describing its inputs (date
+range, data fingerprint, ...). Jobs are shared by key: a session submitting a
+key that another session is running, or that finished recently, gets the
+existing job, so reruns and concurrent sessions never recompute. Submitting a
+new key to a scope releases the scope's previous job, whose tasks that have
+not started are cancelled once no other session holds it; tasks already
+running in a worker cannot be interrupted and their results are dropped.
+
+Task functions and their arguments are pickled to the worker processes, so
+they must be module-level functions; pass file paths, or only the rows the
+task needs, rather than whole datasets.
+"""
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from src.utils.pandas_options import enable_copy_on_write
+
+# Finished jobs double as the results cache, sized like the section cache
+max_finished_jobs = 64
+poll_interval_seconds = 0.5
+
+
+@contextmanager
+def _page_script_hidden_from_workers():
+    # Spawned workers re-run the parent's __main__, which under Streamlit is the
+    # page script being executed; give them an empty main module instead.
+    main_module = sys.modules.get("__main__")
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main_module
+
+
+class BackgroundJob:
+    """Named tasks of one job and their futures, in submission order"""
+
+    def __init__(self, key, task_names, futures):
+        self.key = key
+        self.task_names = list(task_names)
+        self.futures = dict(zip(self.task_names, futures))
+        self.cancelled = False
+        # Scopes (sessions) currently showing this job
+        self.holders = set()
+
+    @property
+    def done_count(self):
+        return sum(future.done() for future in self.futures.values())
+
+    @property
+    def progress(self):
+        return self.done_count / len(self.futures) if self.futures else 1.0
+
+    def done(self):
+        return all(future.done() for future in self.futures.values())
+
+    def task_done(self, task_name):
+        return self.futures[task_name].done()
+
+    def task_cancelled(self, task_name):
+        return self.futures[task_name].cancelled()
+
+    def task_result(self, task_name):
+        """Result of a finished task; re-raises the exception it failed with"""
+        return self.futures[task_name].result(timeout=0)
+
+    def cancel(self):
+        """Cancel the tasks that have not started; running tasks finish and are ignored"""
+        self.cancelled = True
+        for future in self.futures.values():
+            future.cancel()
+
+
+class WorkerPool:
+    """Process pool plus the job each scope holds, running jobs and a few finished jobs by key"""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 1) - 1)
+        self._executor = self._new_executor()
+        self._lock = threading.RLock()
+        self._active = {}
+        self._running = {}
+        self._finished = OrderedDict()
+
+    def _new_executor(self):
+        # spawn: workers must not inherit the Streamlit server's threads
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=enable_copy_on_write,
+        )
+
+    def submit(self, scope, key, tasks):
+        """
+        Run ``tasks`` for ``scope`` unless a job with the same key exists.
+
+        Parameters:
+        - scope: name of the session's widget group the job belongs to
+        - key: hashable description of the job's inputs, unique across dashboards
+        - tasks: list of (task_name, function, args); submitted in this order
+
+        Returns:
+        - the BackgroundJob for ``key``
+        """
+        with self._lock:
+            active = self._active.get(scope)
+            if active is not None and active.key == key:
+                return active
+            self._release(scope)
+
+            finished = self._finished.get(key)
+            if finished is not None:
+                self._finished.move_to_end(key)
+                return finished
+
+            job = self._running.get(key)
+            if job is None:
+                job = self._start(key, tasks)
+            job.holders.add(scope)
+            self._active[scope] = job
+            return job
+
+    def _start(self, key, tasks):
+        # Workers are started on demand by submit
+        with _page_script_hidden_from_workers():
+            try:
+                futures = [self._executor.submit(function, *args) for _, function, args in tasks]
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory); start a fresh pool once
+                self._executor = self._new_executor()
+                futures = [self._executor.submit(function, *args) for _, function, args in tasks]
+
+        job = BackgroundJob(key, [name for name, _, _ in tasks], futures)
+        self._running[key] = job
+        for future in futures:
+            future.add_done_callback(lambda _, job=job: self._task_finished(job))
+        return job
+
+    def _release(self, scope):
+        # Called with the lock held; the job is cancelled once no session holds it
+        job = self._active.pop(scope, None)
+        if job is None:
+            return
+        job.holders.discard(scope)
+        if not job.holders and not job.done():
+            self._running.pop(job.key, None)
+            job.cancel()
+
+    def _task_finished(self, job):
+        if job.cancelled or not job.done():
+            return
+        with self._lock:
+            if self._running.get(job.key) is job:
+                del self._running[job.key]
+            for scope in job.holders:
+                if self._active.get(scope) is job:
+                    del self._active[scope]
+            job.holders.clear()
+            self._finished[job.key] = job
+            self._finished.move_to_end(job.key)
+            while len(self._finished) > max_finished_jobs:
+                self._finished.popitem(last=False)
+
+    def cancel(self, scope):
+        with self._lock:
+            self._release(scope)
+
+    def shutdown(self):
+        with self._lock:
+            for job in self._running.values():
+                job.cancel()
+            self._active.clear()
+            self._running.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_worker_pool():
+    """Worker pool shared by every session of the app"""
+    return WorkerPool()
+
+
+def session_scope(name):
+    """Scope ``name`` of the current session, so sessions never cancel each other's jobs"""
+    ctx = get_script_run_ctx()
+    return f"{name}:{ctx.session_id}" if ctx is not None else name
+
+
+def show_job_progress(job, label):
+    """
+    Progress bar of a running job that refreshes on its own and reruns the page when a task finishes.
+
+    Only this fragment reruns while polling, so the rest of the page stays
+    responsive. Call it before rendering the job's finished tasks: a task
+    finishing in between then costs one extra rerun instead of going unshown.
+    """
+    shown_count = job.done_count
+
+    @st.fragment(run_every=poll_interval_seconds)
+    def job_progress():
+        if job.done_count > shown_count:
+            st.rerun()
+        st.progress(
+            job.progress,
+            text=f"{label}: {job.done_count} of {len(job.task_names)} done",
+        )
+
+    job_progress()
@@ -0,0 +1,38 @@
+import glob
+import hashlib
+import os
+
+import pandas as pd
+
+
+def expand_source_paths(paths):
+    """Expand files and directories (their *.csv/*.CSV files) into a sorted list of files"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(glob.glob(os.path.join(path, '*.csv')) + glob.glob(os.path.join(path, '*.CSV')))
+        elif os.path.exists(path):
+            files.append(path)
+    return sorted(set(files))
+
+
+def fingerprint_files(paths):
+    """
+    Cheap fingerprint of source files from their names, sizes and modification times.
+
+    Directories are expanded to their CSV files, so adding, removing or rewriting
+    any file changes the fingerprint without reading file contents.
+    """
+    digest = hashlib.sha1()
+    for file_name in expand_source_paths(paths):
+        stat = os.stat(file_name)
+        digest.update(f"{os.path.abspath(file_name)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def fingerprint_frame(df):
+    """Content fingerprint of a DataFrame: column names, dtypes, index and values"""
+    digest = hashlib.sha1()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
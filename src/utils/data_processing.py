@@ -1,5 +1,7 @@
 import pandas as pd
+from src.utils.perf_trace import perf_timed
 
+@perf_timed
 def resample_numeric_data(df, freq='1h'):
     """
     Resample a DataFrame with a datetime index, handling non-numeric columns.
@@ -32,6 +34,7 @@ def resample_numeric_data(df, freq='1h'):
 
     return df_resampled
 
+@perf_timed
 def resample_numeric_categorical_data(df, freq='1h'):
     """
     Resample a DataFrame with a datetime index, handling both numeric and categorical columns.
@@ -49,9 +52,6 @@ def resample_numeric_categorical_data(df, freq='1h'):
     pandas.DataFrame
         The resampled DataFrame with both numeric and categorical columns
     """
-    # Make a copy of the DataFrame to avoid modifying the original
-    df = df.copy()
-    
     # Handle duplicate indices by grouping by index before resampling
     if df.index.duplicated().any():
         # For numeric columns, we can use mean to aggregate duplicates
@@ -97,4 +97,45 @@ def resample_numeric_categorical_data(df, freq='1h'):
             # Add to result DataFrame
             result[col] = resampled_series
 
-    return result
\ No newline at end of file
+    return result
+
+@perf_timed
+def daily_totals(df):
+    """
+    Sum a DataFrame with a datetime index per calendar day.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        The DataFrame to aggregate, must have a datetime index
+
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per day with the column sums, indexed by the day's midnight
+    """
+    daily_data = df.groupby(df.index.date).sum()
+    daily_data.index = pd.to_datetime(daily_data.index)
+    return daily_data
+
+@perf_timed
+def daily_summary(df, aggregations=('mean', 'min', 'max')):
+    """
+    Summarize the numeric columns of a DataFrame with a datetime index per day.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        The DataFrame to summarize, must have a datetime index
+    aggregations : tuple of str, default ('mean', 'min', 'max')
+        The aggregations to compute for every numeric column
+
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per day with a "<column> (<aggregation>)" column per pair
+    """
+    numeric_data = df.select_dtypes(include=['number'])
+    summary = numeric_data.resample('1D').agg(list(aggregations))
+    summary.columns = [f"{column} ({aggregation})" for column, aggregation in summary.columns]
+    return summary
@@ -5,7 +5,14 @@ import os
 
 from src.config.studer_constants import studer_names, required_studer_columns
 from src.config.openweather_weather_constants import required_weather_columns
+from src.utils.perf_trace import perf_timed
 
+def get_sample_data_path(source, file_name=''):
+    """Absolute path of a file (or the directory) of a source under data/sample"""
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    return os.path.join(project_root, 'data', 'sample', source, file_name)
+
+@perf_timed
 def read_raw_studer_data_directory(directory):
     all_files = glob.glob(os.path.join(directory, '*.csv'), recursive=True) + glob.glob(os.path.join(directory, '*.CSV'), recursive=True)
     li = []
@@ -20,6 +27,7 @@ def read_raw_studer_data_directory(directory):
 
     return studer_raw_data
 
+@perf_timed
 def read_filtered_studer_data_directory(directory):
     all_files = glob.glob(os.path.join(directory, '*.csv'), recursive=True) + glob.glob(os.path.join(directory, '*.CSV'), recursive=True)
     li = []
@@ -31,14 +39,18 @@ def read_filtered_studer_data_directory(directory):
 
     studer_raw_data = pd.concat(li, axis=0, ignore_index=True)
     studer_raw_data.columns = studer_names
-    studer_raw_data = studer_raw_data[required_studer_columns]
 
-    studer_raw_data['Timestamp'] = pd.to_datetime(studer_raw_data['Timestamp'], format='mixed', dayfirst=True)
-    studer_raw_data.set_index('Timestamp', inplace=True)
-    studer_raw_data.sort_index(inplace=True)
+    return filter_studer_data(studer_raw_data)
 
-    return studer_raw_data
+def filter_studer_data(studer_raw_data):
+    """Keep the required columns of raw Studer rows and index them by their parsed timestamp"""
+    timestamps = pd.to_datetime(studer_raw_data['Timestamp'], format='mixed', dayfirst=True)
+    studer_data = studer_raw_data[required_studer_columns].drop(columns='Timestamp')
+    studer_data.index = pd.DatetimeIndex(timestamps, name='Timestamp')
 
+    return studer_data.sort_index()
+
+@perf_timed
 def read_raw_enphase_data_file(file_name):
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
     file_name = os.path.join(project_root, 'data', 'sample', 'enphase', file_name)
@@ -47,6 +59,7 @@ def read_raw_enphase_data_file(file_name):
 
     return data
 
+@perf_timed
 def read_filtered_enphase_data_file(file_name):
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
     file_name = os.path.join(project_root, 'data', 'sample', 'enphase', file_name)
@@ -60,6 +73,7 @@ def read_filtered_enphase_data_file(file_name):
 
     return data
 
+@perf_timed
 def read_enphase_15min_data_file(file_name):
     """Read 15-minute Enphase energy data file"""
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -78,6 +92,7 @@ def read_enphase_15min_data_file(file_name):
 
     return data
 
+@perf_timed
 def read_solar_data_file(file_name):
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
     file_name = os.path.join(project_root, 'data', 'sample', 'solar', file_name)
@@ -85,6 +100,7 @@ def read_solar_data_file(file_name):
     data = pd.read_csv(file_name, index_col=False, header=0, on_bad_lines='skip', encoding='utf-8', sep=';')
     return data
 
+@perf_timed
 def read_raw_weather_open_weather_data_file(file_name):
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
     file_name = os.path.join(project_root, 'data', 'sample', 'weather', file_name)
@@ -93,6 +109,7 @@ def read_raw_weather_open_weather_data_file(file_name):
 
     return data
 
+@perf_timed
 def read_filtered_weather_open_weather_data_file(file_name):
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
     file_name = os.path.join(project_root, 'data', 'sample', 'weather', file_name)
@@ -104,3 +121,13 @@ def read_filtered_weather_open_weather_data_file(file_name):
     data.sort_index(inplace=True)
 
     return data
+
+@perf_timed
+def read_hourly_features_data_file(file_name):
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    file_name = os.path.join(project_root, 'data', 'processed', file_name)
+
+    data = pd.read_csv(file_name, parse_dates=['timestamp'], index_col='timestamp')
+    data.sort_index(inplace=True)
+
+    return data
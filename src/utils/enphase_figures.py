@@ -0,0 +1,180 @@
+"""
+Figures of the Enphase dashboard, without Streamlit.
+
+Every function takes only the rows or aggregates it plots and returns PNG
+bytes, so the dashboard can run them as background worker tasks.
+"""
+import matplotlib.pyplot as plt
+
+from src.config.enphase_constants import enphase_energy_metrics
+from src.modeling.decomposition_service import decompose_series
+from src.utils.figure_png import figure_to_png
+
+energy_metrics = enphase_energy_metrics
+colors = ["green", "blue", "orange", "red"]
+
+
+def metric_time_series_png(metric_data, metric_name):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.plot(metric_data.index, metric_data, linewidth=1, alpha=0.7)
+    ax.set_title(f"{metric_name} Over Time")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Wh")
+    ax.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+def metrics_comparison_png(filtered_data):
+    fig, ax = plt.subplots(figsize=(14, 8))
+    for i, metric in enumerate(energy_metrics):
+        ax.plot(
+            filtered_data.index,
+            filtered_data[metric],
+            label=metric.replace(" (Wh)", ""),
+            color=colors[i],
+            alpha=0.8,
+            linewidth=1.5,
+        )
+    ax.set_title("Energy Metrics Comparison")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Energy (Wh)")
+    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
+    ax.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+def daily_totals_png(daily_data):
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    axes = axes.flatten()
+
+    for i, metric in enumerate(energy_metrics):
+        axes[i].bar(
+            daily_data.index, daily_data[metric], color=colors[i], alpha=0.7, width=0.8
+        )
+        axes[i].set_title(f'Daily {metric.replace(" (Wh)", "")}')
+        axes[i].set_xlabel("Date")
+        axes[i].set_ylabel("Wh")
+        axes[i].grid(True, alpha=0.3)
+        axes[i].tick_params(axis="x", rotation=45)
+
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+def hourly_patterns_png(hourly_avg):
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    axes = axes.flatten()
+
+    for i, metric in enumerate(energy_metrics):
+        axes[i].plot(
+            hourly_avg.index,
+            hourly_avg[metric],
+            marker="o",
+            color=colors[i],
+            linewidth=2,
+            markersize=4,
+        )
+        axes[i].set_title(f'Average Hourly {metric.replace(" (Wh)", "")}')
+        axes[i].set_xlabel("Hour of Day")
+        axes[i].set_ylabel("Wh")
+        axes[i].grid(True, alpha=0.3)
+        axes[i].set_xlim(0, 23)
+
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+def energy_balance_png(daily_data):
+    # Calculate energy balance metrics
+    # New columns go to a shallow copy; the caller's daily totals are not modified
+    daily_data_balance = daily_data.copy(deep=False)
+    daily_data_balance["Net_Energy"] = (
+        daily_data_balance["Energy Produced (Wh)"]
+        - daily_data_balance["Energy Consumed (Wh)"]
+    )
+    daily_data_balance["Grid_Balance"] = (
+        daily_data_balance["Exported to Grid (Wh)"]
+        - daily_data_balance["Imported from Grid (Wh)"]
+    )
+    daily_data_balance["Self_Consumption"] = (
+        daily_data_balance["Energy Produced (Wh)"]
+        - daily_data_balance["Exported to Grid (Wh)"]
+    )
+
+    # Energy balance plots
+    fig, axes = plt.subplots(3, 1, figsize=(14, 12))
+
+    # Net Energy (Production - Consumption)
+    colors_balance = [
+        "green" if x >= 0 else "red" for x in daily_data_balance["Net_Energy"]
+    ]
+    axes[0].bar(
+        daily_data_balance.index,
+        daily_data_balance["Net_Energy"],
+        color=colors_balance,
+        alpha=0.7,
+    )
+    axes[0].set_title("Daily Net Energy Balance (Production - Consumption)")
+    axes[0].set_ylabel("Net Energy (Wh)")
+    axes[0].axhline(y=0, color="black", linestyle="--", alpha=0.5)
+    axes[0].grid(True, alpha=0.3)
+
+    # Grid Balance (Export - Import)
+    colors_grid = [
+        "orange" if x >= 0 else "blue" for x in daily_data_balance["Grid_Balance"]
+    ]
+    axes[1].bar(
+        daily_data_balance.index,
+        daily_data_balance["Grid_Balance"],
+        color=colors_grid,
+        alpha=0.7,
+    )
+    axes[1].set_title("Daily Grid Balance (Export - Import)")
+    axes[1].set_ylabel("Grid Balance (Wh)")
+    axes[1].axhline(y=0, color="black", linestyle="--", alpha=0.5)
+    axes[1].grid(True, alpha=0.3)
+
+    # Self Consumption
+    axes[2].bar(
+        daily_data_balance.index,
+        daily_data_balance["Self_Consumption"],
+        color="purple",
+        alpha=0.7,
+    )
+    axes[2].set_title("Daily Self Consumption")
+    axes[2].set_ylabel("Self Consumption (Wh)")
+    axes[2].set_xlabel("Date")
+    axes[2].grid(True, alpha=0.3)
+
+    for ax in axes:
+        ax.tick_params(axis="x", rotation=45)
+
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+def decomposition_png(components):
+    fig, axes = plt.subplots(4, 1, figsize=(14, 12), sharex=True)
+    for ax, column, title in zip(
+        axes,
+        ["observed", "trend", "seasonal", "resid"],
+        ["Observed", "Trend", "Seasonal", "Residual"],
+    ):
+        ax.plot(components.index, components[column], linewidth=0.8)
+        ax.set_title(title)
+    plt.xlabel("Date")
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+def classical_decomposition_png(metric_data, period):
+    """Classical decomposition of the whole series, or None if it is too short for ``period``"""
+    try:
+        components, _ = decompose_series(metric_data, period, method="classical")
+    except ValueError:
+        return None
+    return decomposition_png(components)
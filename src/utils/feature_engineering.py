@@ -1,7 +1,18 @@
 import pandas as pd
 import numpy as np
 
+from src.config.openweather_weather_constants import (
+    weather_severity_levels,
+    weather_intensity_levels,
+    time_of_day_labels,
+)
+from src.utils.perf_trace import perf_timed
 
+# Right edges of the night/morning/afternoon bins; evening runs to hour 24
+time_of_day_edges = np.array([6, 12, 18])
+
+
+@perf_timed
 def create_lag_and_rolling_features_for_columns(df, columns, lags, windows):
     feature_frames = [df]
     for col in columns:
@@ -26,66 +37,89 @@ def generate_rolling_features(df, col, windows):
     return pd.DataFrame(new_cols)
 
 
+@perf_timed
 def create_cyclical_features(df, col, period):
-    df[f"{col}_sin"] = np.sin(2 * np.pi * df[col] / period)
-    df[f"{col}_cos"] = np.cos(2 * np.pi * df[col] / period)
-    return df
+    return df.assign(
+        **{
+            f"{col}_sin": np.sin(2 * np.pi * df[col] / period),
+            f"{col}_cos": np.cos(2 * np.pi * df[col] / period),
+        }
+    )
 
 
+@perf_timed
 def add_time_features(df, time_col):
-    df["hour"] = df[time_col].dt.hour
-    df["day_of_week"] = df[time_col].dt.dayofweek  # 0=Monday
-    df["is_weekend"] = df["day_of_week"].isin([5, 6]).astype(int)
-    df["month"] = df[time_col].dt.month
-    return df
+    day_of_week = df[time_col].dt.dayofweek  # 0=Monday
+    return df.assign(
+        hour=df[time_col].dt.hour,
+        day_of_week=day_of_week,
+        is_weekend=day_of_week.isin([5, 6]).astype(int),
+        month=df[time_col].dt.month,
+    )
 
 
+@perf_timed
 def add_time_of_day_features(df, time_col):
-    df["time_of_day"] = pd.cut(
-        df["hour"],
-        bins=[0, 6, 12, 18, 24],
-        labels=["night", "morning", "afternoon", "evening"],
-        include_lowest=True,
+    """Add one-hot time-of-day columns without copying the frame's existing columns.
+
+    Hours fall into the same right-closed bins as ``pd.cut(bins=[0, 6, 12, 18, 24],
+    include_lowest=True)``; missing or out-of-range hours get all-zero dummies.
+    """
+    hours = df["hour"].to_numpy(dtype=float)
+    codes = np.searchsorted(time_of_day_edges, hours, side="left")
+    codes[~((hours >= 0) & (hours <= 24))] = -1
+
+    return df.assign(
+        **{f"time_of_day_{label}": (codes == i).astype(int) for i, label in enumerate(time_of_day_labels)}
     )
 
-    df = pd.get_dummies(df, columns=["time_of_day"], dtype=int)
-    return df
 
+def encode_categorical_lookup(values, lookup, default):
+    """
+    Encode a categorical column by factorizing it once and indexing a lookup table.
 
-def add_weather_severity_feature(df, col):
-    weather_severity = {
-        "Clear": 0,
-        "Clouds": 1,
-        "Mist": 2,
-        "Fog": 3,
-        "Haze": 3,
-        "Drizzle": 4,
-        "Rain": 5,
-        "Thunderstorm": 6,
-    }
+    ``lookup`` is evaluated once per distinct value instead of once per row.
+    Missing values map to ``default``.
+    """
+    codes, uniques = pd.factorize(values)
+    table = np.fromiter(
+        (lookup(value) for value in uniques), dtype=float, count=len(uniques)
+    )
+    # Factorize marks missing values with code -1, which indexes the trailing default
+    table = np.append(table, default)
+    return table[codes]
 
-    df["weather_severity"] = df[col].map(weather_severity).fillna(0)
-    return df
 
+@perf_timed
+def add_weather_severity_feature(df, col):
+    return df.assign(
+        weather_severity=encode_categorical_lookup(
+            df[col], lambda weather: weather_severity_levels.get(weather, 0), 0
+        )
+    )
 
-def add_weather_intensity_feature(df, col):
-    def extract_weather_intensity(description):
-        if "light" in description.lower():
-            return 0.5
-        elif "heavy" in description.lower():
-            return 1.5
-        else:
-            return 1.0
 
-    df["weather_intensity"] = df[col].apply(extract_weather_intensity)
+def extract_weather_intensity(description):
+    description = description.lower()
+    for keyword, intensity in weather_intensity_levels.items():
+        if keyword in description:
+            return intensity
+    return 1.0
 
-    return df
+
+@perf_timed
+def add_weather_intensity_feature(df, col):
+    return df.assign(
+        weather_intensity=encode_categorical_lookup(
+            df[col], extract_weather_intensity, 1.0
+        )
+    )
 
 
+@perf_timed
 def add_net_export_import_grid_feature(df):
-    df["net_export_import_grid"] = (
-        df["Studer Grid Net Export/Import - L1-1"]
+    return df.assign(
+        net_export_import_grid=df["Studer Grid Net Export/Import - L1-1"]
         + df["Studer Grid Net Export/Import - L2-2"]
         + df["Studer Grid Net Export/Import - L3-3"]
     )
-    return df
@@ -0,0 +1,18 @@
+"""Matplotlib figures rendered to PNG bytes, for dashboards and their worker processes."""
+import io
+
+import matplotlib.pyplot as plt
+
+# st.image downsizes (and re-encodes) anything wider than its content width of
+# 1460 px on every call, so figures are rendered no wider than that.
+max_image_width = 1400
+max_image_dpi = 200
+
+
+def figure_to_png(fig):
+    """Render a matplotlib figure to PNG bytes (as ``st.pyplot`` would) and close it"""
+    dpi = min(max_image_dpi, max_image_width / fig.get_figwidth())
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=dpi)
+    plt.close(fig)
+    return buffer.getvalue()
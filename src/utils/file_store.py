@@ -0,0 +1,76 @@
+"""Helpers for files that are read by dashboards while a job rewrites them."""
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+def atomic_write(path, write, mode="w"):
+    """
+    Write ``path`` through a temporary file in the same directory and rename it into place.
+
+    Parameters:
+    - path: destination file
+    - write: callable receiving the open temporary file
+    - mode: "w" for text, "wb" for binary content
+
+    Readers therefore see either the previous or the new file, never a partial one.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, mode, newline=None if "b" in mode else "") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _lock_file(f):
+    # Imported here: fcntl only exists on POSIX and msvcrt only on Windows
+    if os.name == "nt":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _unlock_file(f):
+    if os.name == "nt":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@contextmanager
+def exclusive_lock(path, busy_message):
+    """
+    Hold an exclusive lock on ``path`` for the duration of the block; the OS releases it if the process dies.
+
+    Parameters:
+    - path: lock file, created if missing
+    - busy_message: message of the RuntimeError raised when another process holds the lock
+
+    The lock never waits, so a second caller fails at once instead of queueing.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Append mode: opening the file must not truncate it under another holder
+    with open(path, "a") as f:
+        try:
+            _lock_file(f)
+        except OSError:
+            raise RuntimeError(busy_message) from None
+        try:
+            yield
+        finally:
+            _unlock_file(f)
@@ -13,8 +13,10 @@ from src.utils.studer_data_helpers import (
     get_studer_grid_status,
     get_studer_grid_net_export_import,
 )
+from src.utils.perf_trace import perf_timed
 
 
+@perf_timed
 def calculate_stats(data, columns):
     stats = {
         "Min": data[columns].min(),
@@ -27,6 +29,7 @@ def calculate_stats(data, columns):
     return pd.DataFrame(stats, index=columns)
 
 
+@perf_timed
 def calculate_total_load_shedding_instances(data):
     total_load_shedding_instances = 0
 
@@ -39,6 +42,7 @@ def calculate_total_load_shedding_instances(data):
     return total_load_shedding_instances
 
 
+@perf_timed
 def calculate_total_load_shedding_days(voltage_data):
     total_non_load_shedding_days = 0
     total_load_shedding_days = 0
@@ -62,6 +66,7 @@ def calculate_total_load_shedding_days(voltage_data):
     )
 
 
+@perf_timed
 def calculate_voltage_stats(voltage_data):
     voltage_data = get_grid_input_voltages(voltage_data)
     voltage_stats = calculate_stats(voltage_data, voltage_data.columns)
@@ -70,12 +75,14 @@ def calculate_voltage_stats(voltage_data):
     return voltage_stats
 
 
+@perf_timed
 def calculate_uptime_percentage(data):
     total_instances = len(data)
     total_load_shedding_instances = calculate_total_load_shedding_instances(data)
     return (total_instances - total_load_shedding_instances) / total_instances * 100
 
 
+@perf_timed
 def calculate_total_wrong_frequency_instances(data):
     total_wrong_frequency_instances = 0
 
@@ -89,6 +96,7 @@ def calculate_total_wrong_frequency_instances(data):
     return total_wrong_frequency_instances
 
 
+@perf_timed
 def calculate_total_wrong_frequency_days(data):
     total_wrong_frequency_days = 0
     total_correct_frequency_days = 0
@@ -114,6 +122,7 @@ def calculate_total_wrong_frequency_days(data):
     )
 
 
+@perf_timed
 def calculate_frequency_stats(data):
     frequency_data = get_grid_input_frequencies(data)
     frequency_stats = calculate_stats(frequency_data, frequency_data.columns)
@@ -122,17 +131,20 @@ def calculate_frequency_stats(data):
     return frequency_stats
 
 
+@perf_timed
 def calculate_total_grid_disconnected_instances(data):
     total_grid_disconnected_instances = 0
 
-    for _, row in data.iterrows():
-        grid_status = get_studer_grid_status(pd.DataFrame([row]))
-        if (grid_status.iloc[0] < 1).any():
-            total_grid_disconnected_instances += 1
+    grid_status = get_studer_grid_status(data)
+
+    # Count instances where any phase reports a status below 1 (disconnected)
+    mask = (grid_status < 1).any(axis=1)
+    total_grid_disconnected_instances = mask.sum()
 
     return total_grid_disconnected_instances
 
 
+@perf_timed
 def calculate_total_grid_disconnected_days(data):
     total_grid_disconnected_days = 0
     total_grid_connected_days = 0
@@ -153,21 +165,17 @@ def calculate_total_grid_disconnected_days(data):
     )
 
 
+@perf_timed
 def calculate_average_battery_soc(data):
-    total_instances = 0
-    total_battery_soc = 0
-
-    for _, row in data.iterrows():
-        if pd.notna(row["Battery State of Charge"]):
-            total_battery_soc += row["Battery State of Charge"]
-            total_instances += 1
+    battery_soc = data["Battery State of Charge"].dropna()
 
-    if total_instances == 0:
+    if len(battery_soc) == 0:
         return 0
 
-    return total_battery_soc / total_instances
+    return battery_soc.mean()
 
 
+@perf_timed
 def calculate_total_battery_drain_days(data):
     total_battery_drain_days = 0
     total_battery_charge_days = 0
@@ -192,6 +200,7 @@ def calculate_total_battery_drain_days(data):
     )
 
 
+@perf_timed
 def calculate_battery_soc_stats(data):
     battery_soc_stats = calculate_stats(data, ["Battery State of Charge"])
     battery_soc_stats["Total Instances"] = len(data["Battery State of Charge"])
@@ -199,6 +208,7 @@ def calculate_battery_soc_stats(data):
     return battery_soc_stats
 
 
+@perf_timed
 def calculate_total_import_export_grid(data):
     grid_export_import = get_studer_grid_net_export_import(data)
     solar_export_to_grid_l1 = grid_export_import.iloc[:, 0].sum()
@@ -222,6 +232,7 @@ def calculate_total_import_export_grid(data):
     )
 
 
+@perf_timed
 def calculate_import_export_stats(data):
     import_export_data = get_studer_grid_net_export_import(data)
     import_export_stats = calculate_stats(
@@ -232,16 +243,11 @@ def calculate_import_export_stats(data):
     return import_export_stats
 
 
+@perf_timed
 def calculate_total_import_export_efficiency(data):
     import_export_data = get_studer_grid_net_export_import(data)
-    total_export_instances = 0
-    total_import_instances = 0
-
-    for _, row in import_export_data.iterrows():
-        if (row < 0).any():
-            total_export_instances += 1
-        if (row > 0).any():
-            total_import_instances += 1
+    total_export_instances = (import_export_data < 0).any(axis=1).sum()
+    total_import_instances = (import_export_data > 0).any(axis=1).sum()
 
     import_export_efficiency = total_export_instances / len(import_export_data)
 
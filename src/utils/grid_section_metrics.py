@@ -0,0 +1,107 @@
+"""
+Metrics of the grid dashboard sections, without Streamlit or plotting.
+
+Each ``calculate_*_section_metrics`` computes the numbers one section of the
+grid metrics dashboard renders; ``grid_section_metrics`` maps the section
+names to them. The dashboard pairs them with its renderers, and the headless
+precompute daemon and the dashboard's worker processes import only this
+module.
+"""
+from src.utils.grid_metrics_helpers import (
+    calculate_average_battery_soc,
+    calculate_battery_soc_stats,
+    calculate_frequency_stats,
+    calculate_import_export_stats,
+    calculate_total_battery_drain_days,
+    calculate_total_grid_disconnected_days,
+    calculate_total_grid_disconnected_instances,
+    calculate_total_import_export_efficiency,
+    calculate_total_import_export_grid,
+    calculate_total_load_shedding_days,
+    calculate_total_load_shedding_instances,
+    calculate_total_wrong_frequency_days,
+    calculate_total_wrong_frequency_instances,
+    calculate_uptime_percentage,
+    calculate_voltage_stats,
+)
+from src.utils.perf_trace import perf_timed
+from src.utils.pq_metrics_helpers import (
+    calculate_long_duration_voltage_variation,
+    calculate_power_frequency_variation,
+)
+
+
+@perf_timed
+def calculate_voltage_section_metrics(filtered_studer_data):
+    total_load_shedding_days, total_non_load_shedding_days, load_shedding_efficiency = calculate_total_load_shedding_days(filtered_studer_data)
+    return {
+        "load_shedding_instances": calculate_total_load_shedding_instances(filtered_studer_data),
+        "total_load_shedding_days": total_load_shedding_days,
+        "total_non_load_shedding_days": total_non_load_shedding_days,
+        "load_shedding_efficiency": load_shedding_efficiency,
+        "voltage_variation_instances": calculate_long_duration_voltage_variation(filtered_studer_data, 'Grid Input Voltage - L1'),
+        "uptime_percentage": calculate_uptime_percentage(filtered_studer_data),
+        "voltage_stats": calculate_voltage_stats(filtered_studer_data),
+    }
+
+
+@perf_timed
+def calculate_frequency_section_metrics(filtered_studer_data):
+    total_wrong_frequency_days, total_correct_frequency_days, frequency_efficiency = calculate_total_wrong_frequency_days(filtered_studer_data)
+    return {
+        "wrong_freq_instances": calculate_total_wrong_frequency_instances(filtered_studer_data),
+        "total_wrong_frequency_days": total_wrong_frequency_days,
+        "total_correct_frequency_days": total_correct_frequency_days,
+        "frequency_efficiency": frequency_efficiency,
+        "freq_variation_instances": calculate_power_frequency_variation(filtered_studer_data, 'Grid Input Frequency - L1'),
+        "frequency_stats": calculate_frequency_stats(filtered_studer_data),
+    }
+
+
+@perf_timed
+def calculate_grid_connection_section_metrics(filtered_studer_data):
+    total_grid_disconnected_days, total_grid_connected_days, grid_connection_efficiency = calculate_total_grid_disconnected_days(filtered_studer_data)
+    return {
+        "grid_disconnected_instances": calculate_total_grid_disconnected_instances(filtered_studer_data),
+        "total_grid_disconnected_days": total_grid_disconnected_days,
+        "total_grid_connected_days": total_grid_connected_days,
+        "grid_connection_efficiency": grid_connection_efficiency,
+    }
+
+
+@perf_timed
+def calculate_battery_soc_section_metrics(filtered_studer_data):
+    total_battery_drain_days, total_battery_charge_days, battery_support_efficiency = calculate_total_battery_drain_days(filtered_studer_data)
+    return {
+        "avg_battery_soc": calculate_average_battery_soc(filtered_studer_data),
+        "total_battery_drain_days": total_battery_drain_days,
+        "total_battery_charge_days": total_battery_charge_days,
+        "battery_support_efficiency": battery_support_efficiency,
+        "battery_soc_stats": calculate_battery_soc_stats(filtered_studer_data),
+    }
+
+
+@perf_timed
+def calculate_grid_impex_section_metrics(filtered_studer_data):
+    net_import_export, net_import_export_l1, net_import_export_l2, net_import_export_l3 = calculate_total_import_export_grid(filtered_studer_data)
+    total_export_instances, total_import_instances, import_export_efficiency = calculate_total_import_export_efficiency(filtered_studer_data)
+    return {
+        "net_import_export": net_import_export,
+        "net_import_export_l1": net_import_export_l1,
+        "net_import_export_l2": net_import_export_l2,
+        "net_import_export_l3": net_import_export_l3,
+        "total_export_instances": total_export_instances,
+        "total_import_instances": total_import_instances,
+        "import_export_efficiency": import_export_efficiency,
+        "import_export_stats": calculate_import_export_stats(filtered_studer_data),
+    }
+
+
+# Section name -> metrics computation, in the dashboard's order
+grid_section_metrics = {
+    "Voltage": calculate_voltage_section_metrics,
+    "Frequency": calculate_frequency_section_metrics,
+    "Grid Connection": calculate_grid_connection_section_metrics,
+    "Battery State": calculate_battery_soc_section_metrics,
+    "Grid Import/Export": calculate_grid_impex_section_metrics,
+}
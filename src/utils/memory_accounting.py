@@ -0,0 +1,199 @@
+"""
+Per-stage memory accounting for DataFrame pipelines.
+
+A ``MemoryAccountant`` runs (or is told about) each stage of a pipeline and
+records the deep size of the stage's output frame, how much of it is new
+memory rather than buffers shared with the stage's input frames, and the
+process RSS before and after the stage. The stages that copy the most are
+flagged, and the report is written as JSON so it can be compared across
+releases.
+
+Copies are detected per column with ``np.may_share_memory`` against the
+columns of the inputs, so a column counts as shared when it is a view of an
+input buffer. RSS is read from ``/proc/self/statm`` where available and falls
+back to the peak RSS of ``resource.getrusage`` elsewhere; freed memory is not
+always returned to the OS, so RSS deltas can be smaller than the copies made.
+"""
+import json
+import os
+import platform
+import time
+
+import numpy as np
+import pandas as pd
+
+# Stages whose copies exceed this share of the largest copy are flagged too
+default_flag_ratio = 0.5
+default_top_copies = 3
+
+
+def frame_memory(obj):
+    """Deep size in bytes of a DataFrame or Series, 0 for anything else"""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True, index=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True, index=True))
+    return 0
+
+
+def process_rss(pid=None):
+    """Resident set size in bytes of this process, or of ``pid`` (peak RSS where the current one is unavailable)"""
+    try:
+        with open(f"/proc/{pid or 'self'}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if pid is not None:
+        return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return max_rss if platform.system() == "Darwin" else max_rss * 1024
+
+
+def child_processes():
+    """Pids of this process's children, e.g. worker pool processes (Linux only, else empty)"""
+    pids = set()
+    try:
+        task_ids = os.listdir("/proc/self/task")
+    except OSError:
+        return []
+    for task_id in task_ids:
+        try:
+            with open(f"/proc/self/task/{task_id}/children") as f:
+                pids.update(int(pid) for pid in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return sorted(pids)
+
+
+def _column_arrays(obj):
+    if isinstance(obj, pd.Series):
+        return [obj.to_numpy(copy=False)]
+    if isinstance(obj, pd.DataFrame):
+        return [obj.iloc[:, i].to_numpy(copy=False) for i in range(obj.shape[1])]
+    return []
+
+
+def copied_memory(output, inputs):
+    """
+    Bytes of ``output`` that do not share a buffer with one of the ``inputs``.
+
+    Parameters:
+    - output: DataFrame or Series produced by a stage
+    - inputs: DataFrames or Series the stage received
+
+    Returns:
+    - deep size of the output columns that are new memory, including the index
+      when it is not one of the inputs' indexes
+    """
+    if not isinstance(output, (pd.DataFrame, pd.Series)):
+        return 0
+    input_arrays = [array for obj in inputs for array in _column_arrays(obj)]
+    input_indexes = [obj.index for obj in inputs if isinstance(obj, (pd.DataFrame, pd.Series))]
+
+    if isinstance(output, pd.Series):
+        columns = [output]
+    else:
+        columns = [output.iloc[:, i] for i in range(output.shape[1])]
+
+    copied = 0
+    for column in columns:
+        values = column.to_numpy(copy=False)
+        if not any(np.may_share_memory(values, array) for array in input_arrays):
+            copied += int(column.memory_usage(deep=True, index=False))
+    if not any(output.index is index for index in input_indexes):
+        copied += int(output.index.memory_usage(deep=True))
+    return copied
+
+
+class MemoryAccountant:
+    """Memory records of the stages of one pipeline run, in execution order"""
+
+    def __init__(self, name="pipeline"):
+        self.name = name
+        self.records = []
+        self._last_rss = process_rss()
+
+    def run(self, stage, func, *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` as ``stage``; frames among the arguments are its inputs"""
+        inputs = [arg for arg in list(args) + list(kwargs.values()) if isinstance(arg, (pd.DataFrame, pd.Series))]
+        # Frames modified in place still count as shared
+        input_frames = [obj.copy(deep=False) for obj in inputs]
+        self._last_rss = process_rss()
+        start = time.perf_counter()
+        output = func(*args, **kwargs)
+        self.record(stage, output, input_frames, seconds=time.perf_counter() - start)
+        return output
+
+    def record(self, stage, output, inputs=(), seconds=None):
+        """Record a stage that already ran, e.g. ``data.loc[mask]``, against its input frames"""
+        rss = process_rss()
+        rows, columns = (output.shape + (1,))[:2] if hasattr(output, "shape") else (None, None)
+        self.records.append(
+            {
+                "stage": stage,
+                "rows": rows,
+                "columns": columns,
+                "input_bytes": sum(frame_memory(obj) for obj in inputs),
+                "deep_bytes": frame_memory(output),
+                "copied_bytes": copied_memory(output, list(inputs)),
+                "rss_bytes": rss,
+                "rss_delta_bytes": None if rss is None or self._last_rss is None else rss - self._last_rss,
+                "seconds": seconds,
+            }
+        )
+        self._last_rss = rss
+        return output
+
+    def flagged_stages(self, top=default_top_copies, ratio=default_flag_ratio):
+        """
+        Transformation stages among the ``top`` largest copies, or copying at least
+        ``ratio`` of the largest one. Stages without input frames (readers) only
+        allocate their result and are not flagged.
+        """
+        copying = sorted(
+            (record for record in self.records if record["copied_bytes"] and record["input_bytes"]),
+            key=lambda record: record["copied_bytes"],
+            reverse=True,
+        )
+        if not copying:
+            return []
+        largest = copying[0]["copied_bytes"]
+        return [
+            record["stage"]
+            for rank, record in enumerate(copying)
+            if rank < top or record["copied_bytes"] >= ratio * largest
+        ]
+
+    def report(self):
+        """Stage table with sizes in MB and a ``copy_flag`` column"""
+        flagged = set(self.flagged_stages())
+        report = pd.DataFrame(self.records)
+        if report.empty:
+            return report
+        for column in ["input_bytes", "deep_bytes", "copied_bytes", "rss_bytes", "rss_delta_bytes"]:
+            report[column.replace("_bytes", "_mb")] = report[column].astype(float) / 1e6
+        report["copy_flag"] = report["stage"].isin(flagged)
+        return report[
+            ["stage", "rows", "columns", "input_mb", "deep_mb", "copied_mb", "rss_mb", "rss_delta_mb", "seconds", "copy_flag"]
+        ]
+
+    def to_json(self, **metadata):
+        """Records plus run metadata, for tracking the pipeline's memory over releases"""
+        return json.dumps(
+            {
+                "name": self.name,
+                "generated_at": pd.Timestamp.now().isoformat(),
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                **metadata,
+                "stages": self.records,
+                "flagged_stages": self.flagged_stages(),
+            },
+            indent=2,
+            default=float,
+        )
@@ -0,0 +1,6 @@
+import re
+
+
+def slugify(name):
+    """Filesystem-safe name for a target or model, e.g. 'Energy Produced (Wh)' -> 'energy_produced_wh'"""
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
@@ -0,0 +1,22 @@
+"""
+Pandas options the app, the CLIs and their worker processes run with.
+
+Copy-on-Write is a required process-wide setting: the readers, helpers and
+feature modules are written for it, so entry points call
+``enable_copy_on_write`` once before running them. These are the home page's
+page loader, the ``main`` of every CLI and benchmark that runs the analytics,
+and the initializer of every process pool whose tasks use pandas (spawned
+workers do not inherit the parent's options).
+
+Under Copy-on-Write, column selections, ``set_index`` / ``sort_index`` on
+sorted data and ``fillna`` / ``astype`` calls with nothing to change return
+frames that share their source's buffers, and a frame is only copied when one
+of the two is modified. It is also the default behaviour of pandas 3.0. The
+functions return the same results without it, only with more copies.
+"""
+import pandas as pd
+
+
+def enable_copy_on_write():
+    """Turn on pandas Copy-on-Write for this process"""
+    pd.set_option("mode.copy_on_write", True)
@@ -0,0 +1,221 @@
+"""
+Lightweight timing instrumentation of the data hot paths.
+
+Readers, KPI helpers, resamples, feature functions and section renderers are
+decorated with ``perf_timed``; other blocks can be wrapped in ``perf_span``.
+Nothing is recorded unless a ``perf_recording`` is active on the current
+thread: a disabled call costs one thread-local lookup. While recording, each
+call adds an event with its wall time, the rows it processed (length of its
+first DataFrame/Series argument, else of its result) and, with
+``track_memory``, the peak memory it allocated above the level at its start,
+measured with ``tracemalloc``. ``tracemalloc`` is process-wide, so peaks can
+include allocations of other threads, and it slows allocation-heavy code down
+noticeably while it runs.
+
+Recordings export to the Chrome trace event format (load the file in
+``chrome://tracing`` or https://ui.perfetto.dev) or to plain JSON.
+
+Usage:
+    with perf_recording() as recorder:
+        data = read_filtered_studer_data_directory(directory)
+    print(recorder.summary())
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_local = threading.local()
+_memory_lock = threading.Lock()
+_memory_recorders = 0
+_started_tracemalloc = False
+
+
+def _row_count(value):
+    shape = getattr(value, "shape", None)
+    return shape[0] if shape else None
+
+
+class PerfRecorder:
+    """Events of the instrumented calls made on one thread while recording"""
+
+    def __init__(self, track_memory=True):
+        self.track_memory = track_memory
+        self.events = []
+        self.origin = time.perf_counter()
+        self._stack = []
+
+    def _enter(self, name):
+        frame = {"name": name, "depth": len(self._stack)}
+        if self.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1]["max_memory"] = max(self._stack[-1]["max_memory"], peak)
+            tracemalloc.reset_peak()
+            frame["start_memory"] = frame["max_memory"] = current
+        self._stack.append(frame)
+        frame["start"] = time.perf_counter()
+        return frame
+
+    def _exit(self, frame, rows):
+        end = time.perf_counter()
+        self._stack.pop()
+        event = {
+            "name": frame["name"],
+            "start": frame["start"] - self.origin,
+            "duration": end - frame["start"],
+            "rows": rows,
+            "depth": frame["depth"],
+        }
+        if self.track_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            frame["max_memory"] = max(frame["max_memory"], peak)
+            if self._stack:
+                self._stack[-1]["max_memory"] = max(self._stack[-1]["max_memory"], frame["max_memory"])
+            event["peak_memory"] = frame["max_memory"] - frame["start_memory"]
+        self.events.append(event)
+
+    def summary(self):
+        """Per-name totals, slowest first: calls, total and max seconds, rows, max peak bytes"""
+        totals = {}
+        for event in self.events:
+            total = totals.setdefault(
+                event["name"],
+                {"name": event["name"], "calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "rows": 0, "peak_memory": None},
+            )
+            total["calls"] += 1
+            total["total_seconds"] += event["duration"]
+            total["max_seconds"] = max(total["max_seconds"], event["duration"])
+            total["rows"] += event["rows"] or 0
+            if "peak_memory" in event:
+                total["peak_memory"] = max(total["peak_memory"] or 0, event["peak_memory"])
+        return sorted(totals.values(), key=lambda total: total["total_seconds"], reverse=True)
+
+    def to_chrome_trace(self):
+        """Events as a Chrome trace (complete "X" events in microseconds)"""
+        pid, tid = os.getpid(), threading.get_ident()
+        trace_events = []
+        for event in self.events:
+            args = {"rows": event["rows"]}
+            if "peak_memory" in event:
+                args["peak_memory_bytes"] = event["peak_memory"]
+            trace_events.append(
+                {
+                    "name": event["name"],
+                    "cat": event["name"].split(".")[0],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["duration"] * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+        return json.dumps({"traceEvents": trace_events, "displayTimeUnit": "ms"})
+
+    def to_json(self):
+        return json.dumps({"events": self.events, "summary": self.summary()}, indent=2)
+
+
+def _start_memory_tracking():
+    global _memory_recorders, _started_tracemalloc
+    with _memory_lock:
+        if _memory_recorders == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracemalloc = True
+        _memory_recorders += 1
+
+
+def _stop_memory_tracking():
+    global _memory_recorders, _started_tracemalloc
+    with _memory_lock:
+        _memory_recorders -= 1
+        # Leave tracing on if someone else started it
+        if _memory_recorders == 0 and _started_tracemalloc:
+            tracemalloc.stop()
+            _started_tracemalloc = False
+
+
+@contextmanager
+def perf_recording(track_memory=True):
+    """Record the instrumented calls of the current thread; yields the PerfRecorder"""
+    recorder = PerfRecorder(track_memory)
+    previous = getattr(_local, "recorder", None)
+    if track_memory:
+        _start_memory_tracking()
+    _local.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _local.recorder = previous
+        if track_memory:
+            _stop_memory_tracking()
+
+
+def perf_timed(func=None, name=None):
+    """
+    Decorator recording each call of ``func`` while a perf_recording is active.
+
+    Usable as ``@perf_timed`` or ``@perf_timed(name="...")``; the default name
+    is ``<module>.<function>``.
+    """
+    if func is None:
+        return functools.partial(perf_timed, name=name)
+
+    event_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        recorder = getattr(_local, "recorder", None)
+        if recorder is None:
+            return func(*args, **kwargs)
+
+        frame = recorder._enter(event_name)
+        rows = _row_count(args[0]) if args else None
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            # Calls that raise are recorded too
+            recorder._exit(frame, rows if rows is not None else _row_count(result))
+
+    return wrapper
+
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_no_span = _NoSpan()
+
+
+class _Span:
+    def __init__(self, recorder, name, rows):
+        self.recorder = recorder
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self):
+        self.frame = self.recorder._enter(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder._exit(self.frame, self.rows)
+        return False
+
+
+def perf_span(name, rows=None):
+    """Context manager recording a block as one event while a perf_recording is active"""
+    recorder = getattr(_local, "recorder", None)
+    if recorder is None:
+        return _no_span
+    return _Span(recorder, name, rows)
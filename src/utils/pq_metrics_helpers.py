@@ -4,8 +4,10 @@ import pandas as pd
 import numpy as np
 
 from src.config.pq_parameter_constants import minimum_frequency_allowed, maximum_frequency_allowed, minimum_voltage_allowed, maximum_voltage_allowed
+from src.utils.perf_trace import perf_timed
 
 
+@perf_timed
 def calculate_power_frequency_variation(data, frequency_column):
     means = data.groupby(np.arange(len(data)) // 10)[frequency_column].mean()
     incorrect_instances = means[(means <= minimum_frequency_allowed) | (means >= maximum_frequency_allowed)].count()
@@ -13,11 +15,13 @@ def calculate_power_frequency_variation(data, frequency_column):
     return incorrect_instances
 
 
+@perf_timed
 def calculate_long_duration_voltage_variation(data, voltage_column):
-    data[voltage_column] = pd.to_numeric(data[voltage_column], errors='coerce')
-    mean_value = data[voltage_column].mean()
-    data.fillna({voltage_column: mean_value}, inplace=True)
-    means = data.groupby(np.arange(len(data)) // 10)[voltage_column].mean()
+    voltage = data[voltage_column]
+    if not pd.api.types.is_numeric_dtype(voltage):
+        voltage = pd.to_numeric(voltage, errors='coerce')
+    voltage = voltage.fillna(voltage.mean())
+    means = voltage.groupby(np.arange(len(voltage)) // 10).mean()
 
     incorrect_instances = means[(means <= minimum_voltage_allowed) | (means >= maximum_voltage_allowed)].count()
 
@@ -0,0 +1,95 @@
+"""
+Local store of aggregates precomputed by ``src.modeling.precompute_daemon``.
+
+The daemon is the only writer. Every artifact is written atomically under a
+file name that includes the fingerprint of the source data it was computed
+from, and ``manifest.json`` is rewritten last to point at it. Dashboards only
+read: an artifact is used when the manifest says it is done and was built from
+the same source fingerprint the dashboard loaded, otherwise the dashboard
+computes the value itself.
+"""
+import json
+import os
+import pickle
+
+import pandas as pd
+
+from src.utils.file_store import atomic_write
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+default_store_dir = os.path.join(project_root, "data", "precomputed")
+manifest_file = "manifest.json"
+
+# Bump when a job's output changes shape so old artifacts are recomputed
+precompute_version = 1
+
+
+def read_manifest(store_dir=default_store_dir):
+    """Manifest of the store; an empty one if the daemon has not run yet"""
+    path = os.path.join(store_dir, manifest_file)
+    if not os.path.exists(path):
+        return {"version": precompute_version, "jobs": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest, store_dir=default_store_dir):
+    manifest["updated_at"] = pd.Timestamp.now().isoformat()
+    atomic_write(os.path.join(store_dir, manifest_file), lambda f: json.dump(manifest, f, indent=2))
+
+
+def store_version(store_dir=default_store_dir):
+    """Modification time of the manifest (None if absent), for keying reader caches"""
+    path = os.path.join(store_dir, manifest_file)
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+def artifact_file_name(job_name, data_fingerprint, result):
+    extension = "csv" if isinstance(result, pd.DataFrame) else "pkl"
+    return f"{job_name}-{data_fingerprint[:12]}.{extension}"
+
+
+def write_artifact(job_name, data_fingerprint, result, store_dir=default_store_dir):
+    """
+    Atomically write the result of a job.
+
+    DataFrames with a datetime index are stored as CSV, anything else (e.g. dicts
+    of section metrics) is pickled.
+
+    Returns:
+    - the artifact's file name inside ``store_dir``
+    """
+    file_name = artifact_file_name(job_name, data_fingerprint, result)
+    path = os.path.join(store_dir, file_name)
+    if file_name.endswith(".csv"):
+        atomic_write(path, lambda f: result.to_csv(f))
+    else:
+        atomic_write(path, lambda f: pickle.dump(result, f), mode="wb")
+    return file_name
+
+
+def read_artifact(job_name, data_fingerprint, store_dir=default_store_dir):
+    """
+    Result of ``job_name`` computed from data with ``data_fingerprint``.
+
+    Returns:
+    - the stored DataFrame or object, or None when the store has no up-to-date result
+    """
+    entry = read_manifest(store_dir).get("jobs", {}).get(job_name)
+    if (
+        entry is None
+        or entry.get("status") != "done"
+        or entry.get("version") != precompute_version
+        or entry.get("data_fingerprint") != data_fingerprint
+    ):
+        return None
+
+    path = os.path.join(store_dir, entry["file"])
+    try:
+        if path.endswith(".csv"):
+            return pd.read_csv(path, index_col=0, parse_dates=True)
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        # Replaced by a newer version between reading the manifest and the file
+        return None
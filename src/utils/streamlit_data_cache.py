@@ -0,0 +1,103 @@
+"""
+Process-wide dataset cache shared by every Streamlit session and rerun.
+
+Datasets are parsed once per version of their source files and handed out by
+reference (``st.cache_resource``), so all sessions share one copy and a widget
+change never re-reads the CSVs. The cache key includes a fingerprint of the
+source files (names, sizes, modification times), which is itself re-checked at
+most every ``fingerprint_ttl_seconds``; when files change, the next rerun loads
+the new version and the oldest one is evicted. Precomputed artifacts are keyed
+by the version of the daemon's store, re-checked on the same interval.
+
+The returned frames are shared: callers must treat them as read-only and work
+on slices or copies.
+"""
+import streamlit as st
+
+from src.utils.data_fingerprint import fingerprint_files
+from src.utils.data_reader import (
+    get_sample_data_path,
+    read_enphase_15min_data_file,
+    read_filtered_studer_data_directory,
+    read_filtered_weather_open_weather_data_file,
+)
+from src.utils.precomputed_store import read_artifact, store_version
+from src.utils.studer_tail import LiveStuderFeed
+
+fingerprint_ttl_seconds = 30
+
+# Old versions are kept briefly so sessions mid-rerun are not left without data
+max_cached_versions = 2
+
+
+@st.cache_data(ttl=fingerprint_ttl_seconds, show_spinner=False)
+def get_source_fingerprint(paths):
+    return fingerprint_files(paths)
+
+
+@st.cache_data(ttl=fingerprint_ttl_seconds, show_spinner=False)
+def get_store_version():
+    return store_version()
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _load_precomputed(job_name, data_fingerprint, version):
+    return read_artifact(job_name, data_fingerprint)
+
+
+@st.cache_resource(max_entries=max_cached_versions, show_spinner="Loading Studer data...")
+def _load_studer_data(directory, fingerprint):
+    return read_filtered_studer_data_directory(directory)
+
+
+@st.cache_resource(max_entries=max_cached_versions, show_spinner="Loading Enphase data...")
+def _load_enphase_15min_data(file_name, fingerprint):
+    return read_enphase_15min_data_file(file_name)
+
+
+@st.cache_resource(max_entries=max_cached_versions, show_spinner="Loading weather data...")
+def _load_weather_open_weather_data(file_name, fingerprint):
+    return read_filtered_weather_open_weather_data_file(file_name)
+
+
+def get_studer_data_fingerprint(directory):
+    return get_source_fingerprint((str(directory),))
+
+
+def get_enphase_data_fingerprint(file_name):
+    return get_source_fingerprint((get_sample_data_path("enphase", file_name),))
+
+
+def get_weather_data_fingerprint(file_name):
+    return get_source_fingerprint((get_sample_data_path("weather", file_name),))
+
+
+def load_studer_data(directory):
+    """Shared, read-only result of ``read_filtered_studer_data_directory``"""
+    return _load_studer_data(directory, get_studer_data_fingerprint(directory))
+
+
+def load_enphase_15min_data(file_name):
+    """Shared, read-only result of ``read_enphase_15min_data_file``"""
+    return _load_enphase_15min_data(file_name, get_enphase_data_fingerprint(file_name))
+
+
+def load_weather_open_weather_data(file_name):
+    """Shared, read-only result of ``read_filtered_weather_open_weather_data_file``"""
+    return _load_weather_open_weather_data(file_name, get_weather_data_fingerprint(file_name))
+
+
+def load_precomputed(job_name, data_fingerprint):
+    """
+    Shared, read-only result of a precompute daemon job for the given source version.
+
+    Returns None while the daemon has not (yet) computed it from that version;
+    a result the daemon writes later is picked up within ``fingerprint_ttl_seconds``.
+    """
+    return _load_precomputed(job_name, data_fingerprint, get_store_version())
+
+
+@st.cache_resource(show_spinner=False)
+def get_live_studer_feed(directory):
+    """Process-wide ``LiveStuderFeed`` of a Studer directory; its ``poll()`` result is read-only"""
+    return LiveStuderFeed(directory)
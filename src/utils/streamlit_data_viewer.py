@@ -0,0 +1,162 @@
+"""
+Paginated table viewer that sends only the visible page to the browser.
+
+``st.write(df)`` serializes the whole frame on every rerun, which for
+minute-level Studer data means hundreds of thousands of rows. The viewer keeps
+the frame on the server: column selection, row filtering and sorting are done
+with pandas and only one page of rows is passed to ``st.dataframe``, so the
+payload does not grow with the date range.
+
+Sorting is the only step that is not linear in the number of rows; pass a
+``cache_key`` that identifies the frame (e.g. date range and data fingerprint)
+to reuse the computed row order across reruns.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+page_size_options = [25, 50, 100, 500]
+default_page_size = 50
+max_cached_row_orders = 32
+no_selection = "(none)"
+
+
+def _column_values(df, column):
+    if column in df.columns:
+        return df[column]
+    # The index is offered as a column under its name
+    return df.index.to_series(index=df.index)
+
+
+def parse_filter(values, filter_text):
+    """
+    Boolean mask of the rows matching ``filter_text``.
+
+    Numeric and datetime columns take a range ``min:max`` (either side may be
+    empty) or a single value; other columns are matched case-insensitively
+    on substrings.
+    """
+    filter_text = filter_text.strip()
+    if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+        convert = pd.Timestamp if pd.api.types.is_datetime64_any_dtype(values) else float
+        low, sep, high = filter_text.partition(":")
+        if not sep:
+            return (values == convert(low)).to_numpy()
+        mask = np.ones(len(values), dtype=bool)
+        if low.strip():
+            mask &= (values >= convert(low.strip())).to_numpy()
+        if high.strip():
+            mask &= (values <= convert(high.strip())).to_numpy()
+        return mask
+    return values.astype(str).str.contains(filter_text, case=False, regex=False).to_numpy()
+
+
+def compute_row_order(df, filter_column=None, filter_text="", sort_column=None, descending=False):
+    """
+    Positions of the rows to show after filtering and sorting.
+
+    Returns None when neither applies, i.e. all rows in their current order.
+    """
+    positions = None
+    if filter_column and filter_text.strip():
+        positions = np.flatnonzero(parse_filter(_column_values(df, filter_column), filter_text))
+
+    if sort_column:
+        values = _column_values(df, sort_column)
+        if positions is not None:
+            values = values.iloc[positions]
+        order = (
+            values.reset_index(drop=True)
+            .sort_values(ascending=not descending, kind="stable", na_position="last")
+            .index.to_numpy()
+        )
+        positions = order if positions is None else positions[order]
+
+    return positions
+
+
+@st.cache_data(max_entries=max_cached_row_orders, show_spinner=False)
+def _cached_row_order(cache_key, filter_column, filter_text, sort_column, descending, _df):
+    return compute_row_order(_df, filter_column, filter_text, sort_column, descending)
+
+
+def paginated_data_viewer(df, key, cache_key=None, page_size=default_page_size):
+    """
+    Show ``df`` one page at a time with server-side column selection, filtering and sorting.
+
+    Parameters:
+    - df: frame to browse; it is never modified or copied in full
+    - key: unique prefix for the viewer's widget keys
+    - cache_key: optional hashable identity of ``df`` used to cache the row order
+    - page_size: initial number of rows per page
+    """
+    index_name = df.index.name if df.index.name and df.index.name not in df.columns else None
+    all_columns = list(df.columns)
+    sortable_columns = ([index_name] if index_name else []) + all_columns
+
+    visible_columns = st.multiselect(
+        "Columns", all_columns, default=all_columns, key=f"{key}_columns"
+    )
+    sort_col, order_col, filter_col, value_col = st.columns([3, 1, 3, 3])
+    with sort_col:
+        sort_column = st.selectbox(
+            "Sort by", [no_selection] + sortable_columns, key=f"{key}_sort_column"
+        )
+    with order_col:
+        descending = st.checkbox("Descending", key=f"{key}_descending")
+    with filter_col:
+        filter_column = st.selectbox(
+            "Filter column", [no_selection] + sortable_columns, key=f"{key}_filter_column"
+        )
+    with value_col:
+        filter_text = st.text_input(
+            "Filter",
+            key=f"{key}_filter_text",
+            help="Numbers and dates: a value or a range min:max. Text: part of the value.",
+        )
+
+    sort_column = None if sort_column == no_selection else sort_column
+    filter_column = None if filter_column == no_selection else filter_column
+
+    try:
+        if cache_key is None:
+            positions = compute_row_order(df, filter_column, filter_text, sort_column, descending)
+        else:
+            positions = _cached_row_order(
+                cache_key, filter_column, filter_text, sort_column, descending, df
+            )
+    except (TypeError, ValueError) as e:
+        st.warning(f"Invalid filter: {e}")
+        positions = None
+
+    n_rows = len(df) if positions is None else len(positions)
+
+    size_col, page_col, info_col = st.columns([2, 2, 6])
+    with size_col:
+        page_size = st.selectbox(
+            "Rows per page",
+            page_size_options,
+            index=page_size_options.index(page_size) if page_size in page_size_options else 0,
+            key=f"{key}_page_size",
+        )
+    n_pages = max(1, -(-n_rows // page_size))
+    page_key = f"{key}_page"
+    # Filtering can shrink the result below the current page
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    with page_col:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    stop = min(start + page_size, n_rows)
+    if positions is None:
+        page_df = df.iloc[start:stop]
+    else:
+        page_df = df.iloc[positions[start:stop]]
+    with info_col:
+        if n_rows:
+            st.caption(f"Rows {start + 1}-{stop} of {n_rows:,} (page {page} of {n_pages})")
+        else:
+            st.caption("No matching rows")
+
+    st.dataframe(page_df[visible_columns])
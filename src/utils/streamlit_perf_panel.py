@@ -0,0 +1,78 @@
+"""
+Optional sidebar panel with the instrumented calls of the last rerun.
+
+When the "Perf panel" toggle is on, the page runs inside a ``perf_recording``
+and the sidebar lists the ``perf_timed`` readers, KPI helpers, resamples and
+section renderers that ran, with their time, rows and peak memory, plus
+downloads of the recording as a Chrome trace or JSON. With the toggle off the
+page runs untouched.
+
+Calls served from Streamlit caches do not run and are therefore not listed;
+work done in background worker processes is not recorded.
+"""
+from contextlib import contextmanager
+
+import streamlit as st
+
+from src.utils.perf_trace import perf_recording
+
+
+@contextmanager
+def perf_panel(page_name):
+    """Record the page rendered inside the block and show the panel after it"""
+    enabled = st.sidebar.toggle(
+        "Perf panel",
+        key="perf_panel",
+        help="Time the instrumented data and rendering calls of each rerun",
+    )
+    if not enabled:
+        yield
+        return
+
+    track_memory = st.sidebar.checkbox(
+        "Track peak memory", value=True, key="perf_panel_memory", help="Uses tracemalloc, which slows allocations down"
+    )
+    with perf_recording(track_memory=track_memory) as recorder:
+        yield
+    show_perf_panel(recorder, page_name)
+
+
+def show_perf_panel(recorder, page_name):
+    summary = recorder.summary()
+    with st.sidebar.expander("Performance", expanded=True):
+        if not summary:
+            st.caption("No instrumented calls ran in this rerun")
+            return
+
+        top_level = sum(event["duration"] for event in recorder.events if event["depth"] == 0)
+        st.caption(f"{len(recorder.events)} calls, {top_level:.3f} s in top-level calls")
+        st.dataframe(
+            [
+                {
+                    "Call": total["name"],
+                    "Calls": total["calls"],
+                    "Total ms": round(total["total_seconds"] * 1000, 1),
+                    "Max ms": round(total["max_seconds"] * 1000, 1),
+                    "Rows": total["rows"],
+                    "Peak MB": None if total["peak_memory"] is None else round(total["peak_memory"] / 1e6, 2),
+                }
+                for total in summary
+            ],
+            hide_index=True,
+        )
+
+        file_stem = page_name.lower().replace(" ", "_")
+        st.download_button(
+            "Chrome trace",
+            recorder.to_chrome_trace(),
+            file_name=f"{file_stem}_trace.json",
+            mime="application/json",
+            key="perf_panel_trace",
+        )
+        st.download_button(
+            "JSON",
+            recorder.to_json(),
+            file_name=f"{file_stem}_perf.json",
+            mime="application/json",
+            key="perf_panel_json",
+        )
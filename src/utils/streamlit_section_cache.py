@@ -0,0 +1,44 @@
+"""
+Run only the dashboard section the user is looking at, and cache its results.
+
+``st.tabs`` executes every tab body on every rerun. Dashboards instead pick the
+active section with ``select_section`` and compute only that one through
+``cached_section_results``, which memoises the section's numbers and rendered
+figures per (section, date range, data fingerprint). Switching back to a
+section, or rerunning for an unrelated widget, reuses the cached results.
+"""
+import streamlit as st
+
+# Re-exported for the dashboards that render in the script thread
+from src.utils.figure_png import figure_to_png
+
+max_cached_sections = 64
+
+
+def select_section(section_names, key):
+    """Horizontal section picker that replaces ``st.tabs``; returns the active section name"""
+    return st.radio(
+        "Section",
+        section_names,
+        horizontal=True,
+        key=key,
+        label_visibility="collapsed",
+    )
+
+
+@st.cache_data(max_entries=max_cached_sections, show_spinner="Computing section...")
+def _cached_section_results(section_name, start_date, end_date, data_fingerprint, _compute, _data):
+    return _compute(_data)
+
+
+def cached_section_results(section_name, start_date, end_date, data_fingerprint, compute, data):
+    """
+    Results of ``compute(data)`` cached by (section, date range, data fingerprint).
+
+    ``data`` and ``compute`` are not hashed, so ``section_name`` must identify
+    the computation and ``data_fingerprint`` the source data version.
+    """
+    return _cached_section_results(
+        section_name, str(start_date), str(end_date), data_fingerprint, compute, data
+    )
+
@@ -1,7 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
 
-def create_metric_section(title, value, data_df, chart_columns=None, y_min=None, y_max=None):
+from src.utils.streamlit_data_viewer import paginated_data_viewer
+from src.utils.perf_trace import perf_timed
+
+@perf_timed
+def create_metric_section(title, value, data_df, chart_columns=None, y_min=None, y_max=None, cache_key=None):
     st.write(f"### {title}")
     st.write(value)
 
@@ -37,9 +41,10 @@ def create_metric_section(title, value, data_df, chart_columns=None, y_min=None,
         fig.update_yaxes(range=[y_min, y_max])
 
     st.write(fig)
-    st.write(data_df)
+    paginated_data_viewer(data_df, key=f"data_viewer_{title}", cache_key=cache_key)
 
-def create_interactive_chart(df, title, y_col=None, y_min=None, y_max=None):
+@perf_timed
+def create_interactive_chart(df, title, y_col=None, y_min=None, y_max=None, cache_key=None):
     """Create an interactive Plotly chart with parameter selection."""
     # Create containers
     select_container = st.container()
@@ -74,4 +79,4 @@ def create_interactive_chart(df, title, y_col=None, y_min=None, y_max=None):
         fig.update_yaxes(range=[y_min, y_max])
 
     st.write(fig)
-    st.write(df)
\ No newline at end of file
+    paginated_data_viewer(df, key=f"data_viewer_{title}", cache_key=cache_key)
\ No newline at end of file
@@ -5,38 +5,26 @@ def get_start_end_date(data):
     end_date = pd.to_datetime(data['Timestamp'].iloc[-1])
     return start_date, end_date
 
+def _numeric_columns(data, columns):
+    # Under Copy-on-Write (see src.utils.pandas_options) the selection, and the fillna
+    # and astype when there is nothing to fill or convert, share the input's
+    # buffers; only columns with gaps or of another dtype are copied.
+    return data[columns].fillna(0).astype(float)
+
 def get_grid_input_voltages(data):
-    voltage_data = data[['Grid Input Voltage - L1', 'Grid Input Voltage - L2', 'Grid Input Voltage - L3']]
-    voltage_data = voltage_data.fillna(0)
-    voltage_data = voltage_data.astype(float)
-    return voltage_data
+    return _numeric_columns(data, ['Grid Input Voltage - L1', 'Grid Input Voltage - L2', 'Grid Input Voltage - L3'])
 
 def get_grid_input_frequencies(data):
-    frequency_data = data[['Grid Input Frequency - L1', 'Grid Input Frequency - L2', 'Grid Input Frequency - L3']]
-    frequency_data = frequency_data.fillna(0)
-    frequency_data = frequency_data.astype(float)
-    return frequency_data
+    return _numeric_columns(data, ['Grid Input Frequency - L1', 'Grid Input Frequency - L2', 'Grid Input Frequency - L3'])
 
 def get_studer_grid_status(data):
-    grid_status = data[['Studer Grid Status - L1', 'Studer Grid Status - L2', 'Studer Grid Status - L3']]
-    grid_status = grid_status.fillna(0)
-    grid_status = grid_status.astype(float)
-    return grid_status
+    return _numeric_columns(data, ['Studer Grid Status - L1', 'Studer Grid Status - L2', 'Studer Grid Status - L3'])
 
 def get_battery_state_of_charge(data):
-    battery_soc = data['Battery State of Charge']
-    battery_soc = battery_soc.fillna(0)
-    battery_soc = battery_soc.astype(float)
-    return battery_soc
+    return _numeric_columns(data, 'Battery State of Charge')
 
 def get_battery_internal_temperature(data):
-    battery_temp = data['Battery Internal Temperature']
-    battery_temp = battery_temp.fillna(0)
-    battery_temp = battery_temp.astype(float)
-    return battery_temp
+    return _numeric_columns(data, 'Battery Internal Temperature')
 
 def get_studer_grid_net_export_import(data):
-    grid_export_import = data[['Studer Grid Net Export/Import - L1-1', 'Studer Grid Net Export/Import - L2-2', 'Studer Grid Net Export/Import - L3-3']]
-    grid_export_import = grid_export_import.fillna(0)
-    grid_export_import = grid_export_import.astype(float)
-    return grid_export_import
\ No newline at end of file
+    return _numeric_columns(data, ['Studer Grid Net Export/Import - L1-1', 'Studer Grid Net Export/Import - L2-2', 'Studer Grid Net Export/Import - L3-3'])
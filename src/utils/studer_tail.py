@@ -0,0 +1,149 @@
+"""
+Follow the Studer logger's daily CSV file while it is being written.
+
+The logger writes one file per day (``YYYYMMDD.csv``: three header lines, then
+one row per minute) and appends a row every minute. ``StuderTailReader``
+remembers the byte offset up to which it has parsed the active file and on each
+call parses only the complete lines appended since; a trailing line without
+its newline is left for the next call. When a file with a later name appears
+(rotation at midnight) the remainder of the current file is read to its end
+and the reader moves to the new file.
+
+``LiveStuderFeed`` keeps the parsed rows of the last ``live_window`` in memory
+and appends new rows on ``poll``, so a live view never re-reads the day or the
+history.
+"""
+import csv
+import glob
+import io
+import os
+import threading
+import time
+
+import pandas as pd
+
+from src.config.studer_constants import studer_names
+from src.utils.data_reader import filter_studer_data
+
+studer_header_lines = 3
+# Only the first day of rows of a file is read, as in read_filtered_studer_data_directory
+max_rows_per_file = 1440
+
+live_window = pd.Timedelta(days=1)
+min_poll_seconds = 5
+
+
+def studer_log_files(directory):
+    """Daily Studer files of a directory, oldest first (their names sort by date)"""
+    files = glob.glob(os.path.join(directory, '*.csv')) + glob.glob(os.path.join(directory, '*.CSV'))
+    return sorted(files, key=os.path.basename)
+
+
+def parse_studer_lines(lines):
+    """Filtered Studer frame of raw data lines (bytes, without headers)"""
+    if not lines:
+        return filter_studer_data(pd.DataFrame(columns=studer_names))
+
+    text = b"\n".join(lines).decode("utf-8", errors="replace")
+    df = pd.read_csv(io.StringIO(text), index_col=False, header=None, on_bad_lines='skip', quoting=csv.QUOTE_NONE)
+    df_updated = df.drop(columns=df.columns[-2:], axis=1)
+    df_updated.columns = studer_names
+    return filter_studer_data(df_updated)
+
+
+class StuderTailReader:
+    """Incremental reader of the newest Studer file in a directory, by byte offset"""
+
+    def __init__(self, directory, path=None):
+        self.directory = directory
+        self.path = path
+        self.offset = 0
+        self.lines_read = 0
+
+    def _open(self, path):
+        self.path = path
+        self.offset = 0
+        self.lines_read = 0
+
+    def _read_lines(self, final=False):
+        """Data lines appended to the current file; ``final`` also takes an unterminated last line"""
+        try:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < self.offset:
+                    # The file was truncated or replaced: parse it again from the start
+                    self._open(self.path)
+                f.seek(self.offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return []
+
+        end = len(chunk) if final else chunk.rfind(b"\n") + 1
+        self.offset += end
+
+        lines = []
+        for line in chunk[:end].splitlines():
+            line_number = self.lines_read
+            self.lines_read += 1
+            if studer_header_lines <= line_number < studer_header_lines + max_rows_per_file and line.strip():
+                lines.append(line)
+        return lines
+
+    def read_new_rows(self):
+        """
+        Rows appended since the previous call.
+
+        The first call reads the newest file from its start.
+
+        Returns:
+        - frame in the format of ``read_filtered_studer_data_directory``, possibly empty
+        """
+        files = studer_log_files(self.directory)
+        if not files:
+            return parse_studer_lines([])
+        if self.path is None:
+            self._open(files[-1])
+
+        lines = []
+        later_files = [path for path in files if os.path.basename(path) > os.path.basename(self.path)]
+        if later_files:
+            # The logger rotated to a new file, so the current one is complete;
+            # files created and finished between two calls are read whole
+            lines += self._read_lines(final=True)
+            for path in later_files[:-1]:
+                self._open(path)
+                lines += self._read_lines(final=True)
+            self._open(later_files[-1])
+        lines += self._read_lines()
+
+        return parse_studer_lines(lines)
+
+
+class LiveStuderFeed:
+    """Rows of the last ``window`` written by the logger, shared read-only by all live views"""
+
+    def __init__(self, directory, window=live_window, poll_seconds=min_poll_seconds):
+        self.reader = StuderTailReader(directory)
+        self.window = window
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._last_poll = time.monotonic()
+        self.data = self._trim(self.reader.read_new_rows())
+
+    def _trim(self, data):
+        if data.empty:
+            return data
+        return data.loc[data.index.max() - self.window:]
+
+    def poll(self):
+        """Append the rows written since the last poll (at most every ``poll_seconds``) and return all rows"""
+        with self._lock:
+            if time.monotonic() - self._last_poll >= self.poll_seconds:
+                self._last_poll = time.monotonic()
+                new_rows = self.reader.read_new_rows()
+                if not new_rows.empty:
+                    data = new_rows if self.data.empty else pd.concat([self.data, new_rows])
+                    # A rewritten file is parsed again; keep one row per timestamp
+                    data = data[~data.index.duplicated(keep="last")].sort_index()
+                    # A new frame, so views still rendering the previous one are unaffected
+                    self.data = self._trim(data)
+            return self.data
@@ -1,14 +1,31 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import streamlit as st
+
+from src.utils.perf_trace import perf_timed
+
+
+@perf_timed
+def clean_weather_data(data):
+    """
+    Copy of the weather data with gaps in its numeric columns interpolated in time
+
+    Only the columns with gaps are replaced, with a single interpolate call; the
+    input frame is not modified. The weather dashboard builds this frame once per
+    date range and shares it across all sections.
+    """
+    numeric_data = data.select_dtypes(include="number")
+    gap_columns = numeric_data.columns[numeric_data.isna().any()]
+    cleaned = data.copy(deep=False)
+    if len(gap_columns):
+        cleaned[gap_columns] = numeric_data[gap_columns].interpolate(method="time")
+    return cleaned
 
 
 def handle_missing_data(data, column):
-    """Handle missing data in a specific column"""
+    """Frame with the gaps of a specific column interpolated in time; the input is not modified"""
     if data[column].isna().any():
-        # Fill missing values with the mean or interpolate
-        data[column] = data[column].interpolate(method="time")
+        return data.assign(**{column: data[column].interpolate(method="time")})
     return data
 
 
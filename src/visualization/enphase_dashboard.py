@@ -1,7 +1,5 @@
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
-from statsmodels.tsa.seasonal import seasonal_decompose
 from pathlib import Path
 import sys
 import scipy.stats as stats
@@ -10,20 +8,144 @@ import scipy.stats as stats
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.utils.data_reader import read_enphase_15min_data_file
+from src.config.enphase_constants import (
+    enphase_15min_file,
+    enphase_energy_metrics,
+    enphase_seasonality_periods,
+)
+from src.modeling.decomposition_service import (
+    decomposition_cache_version,
+    read_decomposition,
+    read_decomposition_metadata,
+    slice_components,
+)
+from src.utils.background_jobs import get_worker_pool, session_scope, show_job_progress
+from src.utils.data_processing import daily_totals
+from src.utils.enphase_figures import (
+    classical_decomposition_png,
+    daily_totals_png,
+    decomposition_png,
+    energy_balance_png,
+    hourly_patterns_png,
+    metric_time_series_png,
+    metrics_comparison_png,
+)
+from src.utils.streamlit_data_cache import (
+    load_enphase_15min_data,
+    load_precomputed,
+    get_enphase_data_fingerprint,
+)
+
+enphase_data_file = enphase_15min_file
+
+# Energy metrics available
+energy_metrics = enphase_energy_metrics
+
+# Aggregates below are cached per ``range_key`` (start date, end date,
+# data fingerprint) plus the widgets each one depends on; ``_filtered_data`` is
+# not hashed by Streamlit.
+max_cached_renders = 32
+
+
+@st.cache_data(max_entries=max_cached_renders, show_spinner=False)
+def calculate_daily_energy(range_key, _filtered_data):
+    start_date, end_date, data_fingerprint = range_key
+    # Daily totals of the whole history, kept up to date by the precompute daemon
+    precomputed = load_precomputed("enphase_daily_energy", data_fingerprint)
+    if precomputed is not None:
+        return precomputed.loc[start_date:end_date]
+    return daily_totals(_filtered_data)
+
+
+@st.cache_data(max_entries=max_cached_renders, show_spinner=False)
+def calculate_hourly_profile(range_key, _filtered_data):
+    # Calculate hourly averages
+    hourly_avg = _filtered_data.groupby(_filtered_data.index.hour)[energy_metrics].mean()
+    hourly_avg.index.name = "Hour"
+    return hourly_avg
+
+
+@st.cache_data(max_entries=max_cached_renders, show_spinner=False)
+def calculate_energy_statistics(range_key, _filtered_data):
+    # Basic statistics for the filtered period
+    stats_data = _filtered_data[energy_metrics].describe()
+    totals = _filtered_data[energy_metrics].sum()
+    return stats_data, totals
+
+
+@st.cache_data(max_entries=max_cached_renders, show_spinner=False)
+def load_full_range_decomposition(metric_name, period_name, data_fingerprint, cache_version):
+    """Precomputed full-history components, or (None, None) if missing or built from other data"""
+    metadata = read_decomposition_metadata()
+    if (
+        metadata is None
+        or metadata.get("source_file") != enphase_data_file
+        or metadata.get("data_fingerprint") != data_fingerprint
+    ):
+        return None, None, None
+    components, resolution = read_decomposition(metadata, metric_name, period_name)
+    return components, resolution, metadata["method"]
+
+
+def show_figure(job, task_name, label, missing_message=None):
+    """Image rendered by a job's task once it finishes; ``missing_message`` if the task returned None"""
+    if not job.task_done(task_name):
+        st.caption(f"Rendering the {label}...")
+        return
+    if job.task_cancelled(task_name):
+        st.warning(f"Rendering the {label} was cancelled; rerun the page to render it.")
+        return
+    try:
+        png = job.task_result(task_name)
+    except Exception as e:
+        st.error(f"Could not render the {label}: {e}")
+        return
+    if png is None:
+        st.warning(missing_message)
+        return
+    st.image(png)
+
+
+def submit_decomposition(range_key, ts_metric_name, period_name, filtered_data):
+    """Job rendering the decomposition figure, and its info message; (None, None) if the range is too short"""
+    start_date, end_date, data_fingerprint = range_key
+    cache_version = decomposition_cache_version()
+    components, resolution, method = load_full_range_decomposition(
+        ts_metric_name, period_name, data_fingerprint, cache_version
+    )
+
+    if components is not None:
+        # Slice the full-history decomposition for the selected dates
+        components = slice_components(components, start_date, end_date)
+        if len(components) < 2:
+            return None, None
+        task = (decomposition_png, (components,))
+        info_message = (
+            f"Components from the precomputed {method.upper()} decomposition of the full "
+            f"history at {resolution} resolution"
+        )
+    else:
+        # No precomputed components: classical decomposition of the whole selected range
+        task = (
+            classical_decomposition_png,
+            (filtered_data[ts_metric_name], enphase_seasonality_periods[period_name]),
+        )
+        info_message = (
+            "Classical decomposition of the selected range. Run "
+            "`python -m src.modeling.decomposition_service` to precompute full-history STL components."
+        )
+
+    job = get_worker_pool().submit(
+        session_scope("enphase_decomposition"),
+        ("enphase_decomposition", ts_metric_name, period_name, cache_version) + range_key,
+        [("decomposition", *task)],
+    )
+    return job, info_message
 
 
 def enphase_dashboard():
     # Load the data
-    data = read_enphase_15min_data_file("enphase_15m_Jan23_Sep24_total.csv")
-
-    # Energy metrics available
-    energy_metrics = [
-        "Energy Produced (Wh)",
-        "Energy Consumed (Wh)",
-        "Exported to Grid (Wh)",
-        "Imported from Grid (Wh)",
-    ]
+    data = load_enphase_15min_data(enphase_data_file)
 
     # Streamlit app
     st.title("Enphase 15-Minute Energy Data Analysis")
@@ -37,218 +159,91 @@ def enphase_dashboard():
 
     # Filter data for selected date range
     filtered_data = data.loc[start_date:end_date]
+    range_key = (str(start_date), str(end_date), get_enphase_data_fingerprint(enphase_data_file))
+
+    # Figures are rendered by the background worker pool and shown as their
+    # tasks finish; finished jobs are shared by key, so reruns and other
+    # sessions reuse them. A new range or metric releases the previous job.
+    pool = get_worker_pool()
+    metric_job = pool.submit(
+        session_scope("enphase_metric"),
+        ("enphase_metric", metric_name) + range_key,
+        [("time_series", metric_time_series_png, (filtered_data[metric_name], metric_name))],
+    )
+    daily_data = calculate_daily_energy(range_key, filtered_data)
+    range_job = pool.submit(
+        session_scope("enphase_figures"),
+        ("enphase_figures",) + range_key,
+        [
+            ("comparison", metrics_comparison_png, (filtered_data[energy_metrics],)),
+            ("daily_totals", daily_totals_png, (daily_data,)),
+            ("hourly_patterns", hourly_patterns_png, (calculate_hourly_profile(range_key, filtered_data),)),
+            ("energy_balance", energy_balance_png, (daily_data,)),
+        ],
+    )
+
+    # Progress first: the page reruns when a task finishes after this point
+    for job, label in [(metric_job, "Time series"), (range_job, "Energy figures")]:
+        if not job.done():
+            show_job_progress(job, label)
 
     # Single metric plot
     st.subheader(f"Time Series: {metric_name}")
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.plot(filtered_data.index, filtered_data[metric_name], linewidth=1, alpha=0.7)
-    ax.set_title(f"{metric_name} Over Time")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Wh")
-    ax.grid(True, alpha=0.3)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    st.pyplot(fig)
+    show_figure(metric_job, "time_series", f"{metric_name} time series")
 
     # All metrics comparison plot
     st.subheader("All Energy Metrics Comparison")
-    fig, ax = plt.subplots(figsize=(14, 8))
-    colors = ["green", "blue", "orange", "red"]
-    for i, metric in enumerate(energy_metrics):
-        ax.plot(
-            filtered_data.index,
-            filtered_data[metric],
-            label=metric.replace(" (Wh)", ""),
-            color=colors[i],
-            alpha=0.8,
-            linewidth=1.5,
-        )
-    ax.set_title("Energy Metrics Comparison")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Energy (Wh)")
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    ax.grid(True, alpha=0.3)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    st.pyplot(fig)
+    show_figure(range_job, "comparison", "metrics comparison")
 
     # Daily aggregation and analysis
     st.subheader("Daily Energy Analysis")
-
-    # Simple daily aggregation using groupby
-    daily_data = filtered_data.groupby(filtered_data.index.date).sum()
-    daily_data.index = pd.to_datetime(daily_data.index)
-
-    # Daily totals plot
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-    axes = axes.flatten()
-
-    for i, metric in enumerate(energy_metrics):
-        axes[i].bar(
-            daily_data.index, daily_data[metric], color=colors[i], alpha=0.7, width=0.8
-        )
-        axes[i].set_title(f'Daily {metric.replace(" (Wh)", "")}')
-        axes[i].set_xlabel("Date")
-        axes[i].set_ylabel("Wh")
-        axes[i].grid(True, alpha=0.3)
-        axes[i].tick_params(axis="x", rotation=45)
-
-    plt.tight_layout()
-    st.pyplot(fig)
+    show_figure(range_job, "daily_totals", "daily totals")
 
     # Hourly patterns
     st.subheader("Average Hourly Patterns")
-
-    # Add hour column for analysis
-    filtered_data_hourly = filtered_data.copy()
-    filtered_data_hourly["Hour"] = filtered_data_hourly.index.hour
-
-    # Calculate hourly averages
-    hourly_avg = filtered_data_hourly.groupby("Hour")[energy_metrics].mean()
-
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-    axes = axes.flatten()
-
-    for i, metric in enumerate(energy_metrics):
-        axes[i].plot(
-            hourly_avg.index,
-            hourly_avg[metric],
-            marker="o",
-            color=colors[i],
-            linewidth=2,
-            markersize=4,
-        )
-        axes[i].set_title(f'Average Hourly {metric.replace(" (Wh)", "")}')
-        axes[i].set_xlabel("Hour of Day")
-        axes[i].set_ylabel("Wh")
-        axes[i].grid(True, alpha=0.3)
-        axes[i].set_xlim(0, 23)
-
-    plt.tight_layout()
-    st.pyplot(fig)
+    show_figure(range_job, "hourly_patterns", "hourly patterns")
 
     # Energy Balance Analysis
     st.subheader("Energy Balance Analysis")
-
-    # Calculate energy balance metrics
-    daily_data_balance = daily_data.copy()
-    daily_data_balance["Net_Energy"] = (
-        daily_data_balance["Energy Produced (Wh)"]
-        - daily_data_balance["Energy Consumed (Wh)"]
-    )
-    daily_data_balance["Grid_Balance"] = (
-        daily_data_balance["Exported to Grid (Wh)"]
-        - daily_data_balance["Imported from Grid (Wh)"]
-    )
-    daily_data_balance["Self_Consumption"] = (
-        daily_data_balance["Energy Produced (Wh)"]
-        - daily_data_balance["Exported to Grid (Wh)"]
-    )
-
-    # Energy balance plots
-    fig, axes = plt.subplots(3, 1, figsize=(14, 12))
-
-    # Net Energy (Production - Consumption)
-    colors_balance = [
-        "green" if x >= 0 else "red" for x in daily_data_balance["Net_Energy"]
-    ]
-    axes[0].bar(
-        daily_data_balance.index,
-        daily_data_balance["Net_Energy"],
-        color=colors_balance,
-        alpha=0.7,
-    )
-    axes[0].set_title("Daily Net Energy Balance (Production - Consumption)")
-    axes[0].set_ylabel("Net Energy (Wh)")
-    axes[0].axhline(y=0, color="black", linestyle="--", alpha=0.5)
-    axes[0].grid(True, alpha=0.3)
-
-    # Grid Balance (Export - Import)
-    colors_grid = [
-        "orange" if x >= 0 else "blue" for x in daily_data_balance["Grid_Balance"]
-    ]
-    axes[1].bar(
-        daily_data_balance.index,
-        daily_data_balance["Grid_Balance"],
-        color=colors_grid,
-        alpha=0.7,
-    )
-    axes[1].set_title("Daily Grid Balance (Export - Import)")
-    axes[1].set_ylabel("Grid Balance (Wh)")
-    axes[1].axhline(y=0, color="black", linestyle="--", alpha=0.5)
-    axes[1].grid(True, alpha=0.3)
-
-    # Self Consumption
-    axes[2].bar(
-        daily_data_balance.index,
-        daily_data_balance["Self_Consumption"],
-        color="purple",
-        alpha=0.7,
-    )
-    axes[2].set_title("Daily Self Consumption")
-    axes[2].set_ylabel("Self Consumption (Wh)")
-    axes[2].set_xlabel("Date")
-    axes[2].grid(True, alpha=0.3)
-
-    for ax in axes:
-        ax.tick_params(axis="x", rotation=45)
-
-    plt.tight_layout()
-    st.pyplot(fig)
+    show_figure(range_job, "energy_balance", "energy balance")
 
     # Time Series Decomposition (only for one metric to avoid complexity)
     st.subheader("Time Series Decomposition")
     ts_metric_name = st.selectbox(
         "Select Metric for Time Series Analysis", energy_metrics, key="ts_metric"
     )
-    ts_filtered_data = filtered_data[ts_metric_name]
 
     # Select period dynamically - adjusted for 15-minute data
-    seasonality_option = st.selectbox(
+    period_name = st.selectbox(
         "Select Seasonality Period",
-        options=["Daily (96 intervals)", "Weekly (672 intervals)"],
+        options=list(enphase_seasonality_periods),
+        format_func=lambda name: f"{name} ({enphase_seasonality_periods[name]} intervals)",
+    )
+    period = enphase_seasonality_periods[period_name]
+    too_short_message = (
+        f"Not enough data points for time series decomposition with period = {period}. Try selecting a longer date range."
     )
 
-    if "Daily" in seasonality_option:
-        period = 96  # 24 hours * 4 intervals per hour
-    else:
-        period = 672  # 7 days * 96 intervals per day
-
-    data_length = len(ts_filtered_data)
-    if data_length >= 2 * period:
-        # Use only a subset if data is too large
-        if data_length > 5000:
-            ts_sample = ts_filtered_data.iloc[-5000:]  # Use last 5000 points
-            st.info("Using last 5000 data points for decomposition analysis")
-        else:
-            ts_sample = ts_filtered_data
-
-        decomposition = seasonal_decompose(ts_sample, model="additive", period=period)
-
-        fig, axes = plt.subplots(4, 1, figsize=(14, 12), sharex=True)
-        decomposition.observed.plot(ax=axes[0], title="Observed")
-        decomposition.trend.plot(ax=axes[1], title="Trend")
-        decomposition.seasonal.plot(ax=axes[2], title="Seasonal")
-        decomposition.resid.plot(ax=axes[3], title="Residual")
-        plt.xlabel("Date")
-        plt.tight_layout()
-        st.pyplot(fig)
+    decomposition_job, info_message = submit_decomposition(
+        range_key, ts_metric_name, period_name, filtered_data
+    )
+    if decomposition_job is None:
+        st.warning(too_short_message)
     else:
-        st.warning(
-            f"Not enough data points for time series decomposition with period = {period}. Try selecting a longer date range."
-        )
+        if not decomposition_job.done():
+            show_job_progress(decomposition_job, "Decomposition")
+        st.info(info_message)
+        show_figure(decomposition_job, "decomposition", "decomposition", too_short_message)
 
     # Statistics
     st.subheader("Energy Statistics Summary")
 
-    # Basic statistics for the filtered period
-    stats_data = filtered_data[energy_metrics].describe()
+    stats_data, totals = calculate_energy_statistics(range_key, filtered_data)
     st.write("**Descriptive Statistics for Selected Period:**")
     st.dataframe(stats_data.round(2))
 
     # Total energy summary
     st.write("**Total Energy Summary:**")
-    totals = filtered_data[energy_metrics].sum()
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
@@ -292,4 +287,4 @@ def enphase_dashboard():
 
 
 if __name__ == "__main__":
-    enphase_15min_dashboard_simple()
+    enphase_dashboard()
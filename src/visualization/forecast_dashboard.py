@@ -0,0 +1,132 @@
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.config.modeling_constants import forecast_targets
+from src.modeling.forecast_cache import (
+    default_cache_dir,
+    metadata_file,
+    read_forecast_cache,
+    is_forecast_cache_stale,
+    is_refresh_running,
+    start_background_refresh,
+)
+
+forecast_tab_names = {
+    "Energy Produced (Wh)": "Production",
+    "Energy Consumed (Wh)": "Consumption",
+    "net_export_import_grid": "Net Grid Exchange",
+}
+
+
+@st.cache_data(show_spinner=False)
+def load_forecast_cache(cache_mtime):
+    """Read the forecast cache once per version of the file (keyed by its mtime)"""
+    return read_forecast_cache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_refresh_process():
+    """Refresh subprocess started from the app, shared by all sessions"""
+    return {"process": None}
+
+
+def refresh_in_progress():
+    """Whether a refresh started from the app, or by any other caller, is still running"""
+    process = get_refresh_process()["process"]
+    return (process is not None and process.poll() is None) or is_refresh_running()
+
+
+def forecast_target_section(forecasts, target, horizon):
+    target_forecast = forecasts[forecasts["Target"] == target]
+    if target_forecast.empty:
+        st.info(f"No cached forecast for {target}.")
+        return
+
+    # Caches written before backtests were labelled have no Kind column, and
+    # older ones call them "backcast"
+    kind = target_forecast["Kind"].iloc[0] if "Kind" in target_forecast else "backtest"
+    label = "Forecast" if kind == "forecast" else "Backtest"
+    first, last = target_forecast["Timestamp"].min(), target_forecast["Timestamp"].max()
+    hours = len(target_forecast)
+
+    st.write(f"### {target} {label}")
+    st.write(f"Model: {target_forecast['Model'].iloc[0]}")
+    if kind == "forecast":
+        st.write(f"Forecast of the next {hours} hours, {first:%Y-%m-%d %H:%M} to {last:%Y-%m-%d %H:%M}")
+        if hours < horizon:
+            st.caption(f"This model's shortest lag feature limits it to {hours} of the {horizon} hours requested.")
+    else:
+        st.write(
+            f"Backtest of the last {hours} hours of data, {first:%Y-%m-%d %H:%M} to "
+            f"{last:%Y-%m-%d %H:%M}, not a forecast: this model uses features that are only "
+            "observed once the hour has passed. Train it on calendar and lag features to forecast."
+        )
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=target_forecast["Timestamp"],
+            y=target_forecast["Forecast"],
+            name=label,
+            mode="lines",
+        )
+    )
+    fig.update_layout(
+        title=f"{target} {label}",
+        yaxis_title=target,
+        xaxis_title="Timestamp",
+        width=900,
+        height=570,
+    )
+    st.write(fig)
+
+    st.dataframe(
+        target_forecast[["Timestamp", "Forecast"]]
+        .rename(columns={"Forecast": label})
+        .set_index("Timestamp")
+        .round(2)
+    )
+
+
+def forecast_dashboard():
+    st.title("Forecast Dashboard")
+
+    metadata_path = os.path.join(default_cache_dir, metadata_file)
+    cache_mtime = os.path.getmtime(metadata_path) if os.path.exists(metadata_path) else None
+    forecasts, metadata = load_forecast_cache(cache_mtime)
+
+    stale = is_forecast_cache_stale(metadata)
+    if metadata is None:
+        st.warning("No forecasts have been generated yet.")
+    else:
+        generated_at = pd.Timestamp(metadata["generated_at"])
+        st.write(f"Forecasts generated at {generated_at:%Y-%m-%d %H:%M}")
+        if stale:
+            st.warning("New data or models have arrived since these forecasts were generated.")
+
+    if stale:
+        # The refresh runs in a separate process; this rerun only reads the cache.
+        # One refresh at a time: the button is disabled while one is running.
+        running = refresh_in_progress()
+        if st.button("Refresh forecasts in the background", disabled=running):
+            get_refresh_process()["process"] = start_background_refresh()
+            running = True
+        if running:
+            st.info("Forecast refresh in progress. Reload the page once it has finished.")
+
+    if forecasts is None:
+        return
+
+    tabs = st.tabs([forecast_tab_names.get(target, target) for target in forecast_targets])
+    for tab, target in zip(tabs, forecast_targets):
+        with tab:
+            forecast_target_section(forecasts, target, metadata["horizon"])
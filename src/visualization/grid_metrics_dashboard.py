@@ -11,25 +11,75 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 # Import necessary functions
-from src.utils.data_reader import read_filtered_studer_data_directory
+from src.utils.streamlit_data_cache import (
+    load_studer_data,
+    load_precomputed,
+    get_live_studer_feed,
+    get_studer_data_fingerprint,
+)
+from src.utils.streamlit_section_cache import select_section
+from src.utils.background_jobs import get_worker_pool, session_scope, show_job_progress
+from src.utils.streamlit_data_viewer import paginated_data_viewer
 from src.utils.grid_metrics_helpers import calculate_total_import_export_grid
 from src.utils.studer_data_helpers import get_studer_grid_net_export_import
 from src.utils.streamlit_visualization_helpers import create_interactive_chart
+from src.utils.grid_section_metrics import grid_section_metrics
 from src.visualization.studer.voltage_visualization import voltage_section
 from src.visualization.studer.frequency_visualization import frequency_section
-from src.visualization.studer.grid_connection_visualization import (
-    grid_connection_section,
-)
+from src.visualization.studer.grid_connection_visualization import grid_connection_section
 from src.visualization.studer.battery_soc_visualization import battery_soc_section
 from src.visualization.studer.grid_impex_visualization import grid_impex_section
 
+section_renderers = {
+    "Voltage": voltage_section,
+    "Frequency": frequency_section,
+    "Grid Connection": grid_connection_section,
+    "Battery State": battery_soc_section,
+    "Grid Import/Export": grid_impex_section,
+}
+
+# Section name -> (metrics computation, renderer)
+grid_metric_sections = {
+    section_name: (calculate_section, section_renderers[section_name])
+    for section_name, calculate_section in grid_section_metrics.items()
+}
+
+live_refresh_seconds = 60
+
+def live_grid_metrics(studer_data_dir, section_name):
+    """Section metrics of the rows the logger wrote in the last day, refreshed every minute"""
+
+    @st.fragment(run_every=live_refresh_seconds)
+    def live_view():
+        # Only the lines appended since the last poll are parsed
+        live_data = get_live_studer_feed(studer_data_dir).poll()
+        if live_data.empty:
+            st.info("Waiting for the logger to write data...")
+            return
+
+        st.caption(
+            f"Live: {len(live_data)} rows from {live_data.index.min()} to {live_data.index.max()}, "
+            f"refreshed every {live_refresh_seconds} s"
+        )
+        calculate_section, render_section = grid_metric_sections[section_name]
+        render_section(live_data, calculate_section(live_data))
+
+    live_view()
+
 
 def grid_metric_dashboard():
     st.title("Grid Metrics Dashboard!")
 
-    # Read data
     studer_data_dir = os.path.join(project_root, "data", "sample", "studer")
-    studer_data = read_filtered_studer_data_directory(studer_data_dir)
+
+    # Live mode follows the file being written and never loads the history
+    if st.toggle("Live mode", key="grid_live_mode"):
+        section_name = select_section(list(grid_metric_sections), key="grid_metric_section")
+        live_grid_metrics(studer_data_dir, section_name)
+        return
+
+    # Read data
+    studer_data = load_studer_data(studer_data_dir)
 
     # Overview
     st.write("## Studer Data")
@@ -47,37 +97,47 @@ def grid_metric_dashboard():
     mask = (studer_data.index >= start_date) & (studer_data.index <= end_date)
     filtered_studer_data = studer_data.loc[mask]
 
-    # Show data sample
+    data_fingerprint = get_studer_data_fingerprint(studer_data_dir)
+
+    # Show data sample, one page at a time
     with st.expander("View Data Sample"):
-        st.write(filtered_studer_data)
-
-    # Add tabs for different sections
-    tabs = st.tabs(
-        [
-            "Voltage",
-            "Frequency",
-            "Grid Connection",
-            "Battery State",
-            "Grid Import/Export",
-        ]
+        paginated_data_viewer(
+            filtered_studer_data,
+            key="studer_data_sample",
+            cache_key=(str(start_date), str(end_date), data_fingerprint),
+        )
+
+    # The selected section's metrics are computed by the background worker
+    # pool; a new section or date range releases this session's pending job
+    section_name = select_section(list(grid_metric_sections), key="grid_metric_section")
+    _, render_section = grid_metric_sections[section_name]
+
+    # The full range is precomputed by the precompute daemon
+    if start_date <= studer_data.index.min() and end_date >= studer_data.index.max():
+        grid_kpis = load_precomputed("grid_kpis", data_fingerprint)
+        if grid_kpis is not None:
+            render_section(filtered_studer_data, grid_kpis[section_name])
+            return
+
+    # Finished jobs are shared by key, so sections already computed for this
+    # range, by this or another session, render without resubmitting. The task
+    # is the section's metrics function, so workers never import Streamlit.
+    job = get_worker_pool().submit(
+        session_scope("grid_metrics"),
+        ("grid_metrics", section_name, str(start_date), str(end_date), data_fingerprint),
+        [(section_name, grid_section_metrics[section_name], (filtered_studer_data,))],
     )
 
-    # Voltage Section
-    with tabs[0]:
-        voltage_section(filtered_studer_data)
-
-    # Frequency Section
-    with tabs[1]:
-        frequency_section(filtered_studer_data)
-
-    # Grid Connection Section
-    with tabs[2]:
-        grid_connection_section(filtered_studer_data)
-
-    # Battery State Section
-    with tabs[3]:
-        battery_soc_section(filtered_studer_data)
-
-    # Grid Import/Export Section
-    with tabs[4]:
-        grid_impex_section(filtered_studer_data)
+    if not job.done():
+        show_job_progress(job, f"Computing the {section_name} metrics")
+        return
+    if job.task_cancelled(section_name):
+        st.warning(f"The {section_name} metrics computation was cancelled; rerun the page to compute them.")
+        return
+
+    try:
+        metrics = job.task_result(section_name)
+    except Exception as e:
+        st.error(f"Could not compute the {section_name} metrics: {e}")
+        return
+    render_section(filtered_studer_data, metrics)
@@ -1,3 +1,4 @@
+import importlib
 import streamlit as st
 import sys
 from pathlib import Path
@@ -6,11 +7,23 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.visualization.grid_metrics_dashboard import grid_metric_dashboard
-from src.visualization.weather_dashboard_open_weather import (
-    weather_dashboard_open_weather,
-)
-from src.visualization.enphase_dashboard import enphase_dashboard
+from src.utils.streamlit_perf_panel import perf_panel
+
+# Dashboard pages as (module, function). A dashboard module, and with it
+# statsmodels, scipy, matplotlib or plotly, is only imported once its page is
+# selected, so the home page starts without them.
+dashboard_pages = {
+    "Enphase Dashboard": ("src.visualization.enphase_dashboard", "enphase_dashboard"),
+    "Grid Metric Dashboard": (
+        "src.visualization.grid_metrics_dashboard",
+        "grid_metric_dashboard",
+    ),
+    "Weather Dashboard - Open Weather": (
+        "src.visualization.weather_dashboard_open_weather",
+        "weather_dashboard_open_weather",
+    ),
+    "Forecast Dashboard": ("src.visualization.forecast_dashboard", "forecast_dashboard"),
+}
 
 
 def home():
@@ -38,17 +51,27 @@ def home():
         - Analyze temperature, visibility, and other weather parameters
         - Monitor weather patterns and trends
 
+        ### Forecast Dashboard
+        - Precomputed forecasts for energy production, consumption and net grid exchange
+        - Forecasts are refreshed by a background job, never inside the dashboard
+
         Choose a dashboard from the sidebar to explore detailed analytics and insights.
         """
     )
 
 
-page_names_to_funcs = {
-    "Home": home,
-    "Enphase Dashboard": enphase_dashboard,
-    "Grid Metric Dashboard": grid_metric_dashboard,
-    "Weather Dashboard - Open Weather": weather_dashboard_open_weather,
-}
+def load_page(page_name):
+    """Page function for ``page_name``, importing its dashboard module on first use"""
+    if page_name == "Home":
+        return home
+    # Imported here, not at the top, as it imports pandas
+    from src.utils.pandas_options import enable_copy_on_write
+
+    enable_copy_on_write()
+    module_name, function_name = dashboard_pages[page_name]
+    return getattr(importlib.import_module(module_name), function_name)
+
 
-demo_name = st.sidebar.selectbox("Choose a Dashboard", page_names_to_funcs.keys())
-page_names_to_funcs[demo_name]()
+demo_name = st.sidebar.selectbox("Choose a Dashboard", ["Home", *dashboard_pages])
+with perf_panel(demo_name):
+    load_page(demo_name)()
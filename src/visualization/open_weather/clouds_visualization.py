@@ -4,41 +4,36 @@ import pandas as pd
 import numpy as np
 from src.utils.weather_helpers import (
     calculate_clouds_stats,
-    handle_missing_data,
+    clean_weather_data,
     create_time_series_chart,
 )
+from src.utils.streamlit_section_cache import figure_to_png
+from src.utils.perf_trace import perf_timed
 
 
-def clouds_section(weather_data):
+@perf_timed
+def calculate_clouds_section_results(weather_data):
     """
-    Display clouds section in the weather dashboard
+    Compute the statistics and figures of the clouds section
 
     Parameters:
-    weather_data (pd.DataFrame): DataFrame containing weather data
+    weather_data (pd.DataFrame): Weather data cleaned by clean_weather_data
     """
-    st.write("### Cloud Cover Analysis")
-
-    # Handle missing data
-    weather_data = handle_missing_data(weather_data, "clouds_all")
+    results = {}
 
     # Cloud cover statistics
-    st.write("#### Cloud Cover Statistics")
-    clouds_stats = calculate_clouds_stats(weather_data, "clouds_all")
-    st.write(clouds_stats)
+    results["clouds_stats"] = calculate_clouds_stats(weather_data, "clouds_all")
 
     # Cloud cover time series
-    st.write("#### Cloud Cover Over Time")
-    clouds_fig = create_time_series_chart(
-        weather_data,
-        "clouds_all",
-        "Cloud Cover Over Time",
-        "Cloud Cover (%)",
-        color="darkblue",
+    results["clouds_fig"] = figure_to_png(
+        create_time_series_chart(
+            weather_data,
+            "clouds_all",
+            "Cloud Cover Over Time",
+            "Cloud Cover (%)",
+            color="darkblue",
+        )
     )
-    st.pyplot(clouds_fig)
-
-    # Cloud cover categories
-    st.write("#### Cloud Cover Categories")
 
     # Define cloud cover categories
     cloud_categories = {
@@ -60,7 +55,6 @@ def clouds_section(weather_data):
     }
 
     # Create pie chart for cloud cover categories
-    fig, ax = plt.subplots(figsize=(10, 6))
     labels = list(cloud_categories.keys())
     sizes = list(cloud_categories.values())
 
@@ -69,7 +63,9 @@ def clouds_section(weather_data):
     labels = [labels[i] for i in non_zero_indices]
     sizes = [sizes[i] for i in non_zero_indices]
 
+    results["categories_fig"] = None
     if len(sizes) > 0:
+        fig, ax = plt.subplots(figsize=(10, 6))
         ax.pie(
             sizes,
             labels=labels,
@@ -79,16 +75,45 @@ def clouds_section(weather_data):
         )
         ax.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle
         ax.set_title("Distribution of Cloud Cover Categories")
-        st.pyplot(fig)
-    else:
-        st.write("No cloud cover data available for categorization.")
+        results["categories_fig"] = figure_to_png(fig)
 
     # Cloud cover distribution
-    st.write("#### Cloud Cover Distribution")
     fig, ax = plt.subplots(figsize=(10, 6))
     weather_data["clouds_all"].hist(bins=20, ax=ax, color="steelblue", alpha=0.7)
     ax.set_title("Cloud Cover Distribution")
     ax.set_xlabel("Cloud Cover (%)")
     ax.set_ylabel("Frequency")
     ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
+    results["distribution_fig"] = figure_to_png(fig)
+
+    return results
+
+
+@perf_timed
+def clouds_section(weather_data, results=None):
+    """
+    Display clouds section in the weather dashboard
+
+    Parameters:
+    weather_data (pd.DataFrame): DataFrame containing weather data
+    results (dict): Precomputed output of calculate_clouds_section_results
+    """
+    if results is None:
+        results = calculate_clouds_section_results(clean_weather_data(weather_data))
+
+    st.write("### Cloud Cover Analysis")
+
+    st.write("#### Cloud Cover Statistics")
+    st.write(results["clouds_stats"])
+
+    st.write("#### Cloud Cover Over Time")
+    st.image(results["clouds_fig"])
+
+    st.write("#### Cloud Cover Categories")
+    if results["categories_fig"] is not None:
+        st.image(results["categories_fig"])
+    else:
+        st.write("No cloud cover data available for categorization.")
+
+    st.write("#### Cloud Cover Distribution")
+    st.image(results["distribution_fig"])
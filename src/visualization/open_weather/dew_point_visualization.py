@@ -4,43 +4,40 @@ import pandas as pd
 import numpy as np
 from src.utils.weather_helpers import (
     calculate_dew_point_stats,
-    handle_missing_data,
+    clean_weather_data,
     create_time_series_chart,
 )
+from src.utils.streamlit_section_cache import figure_to_png
+from src.utils.perf_trace import perf_timed
 
 
-def dew_point_section(weather_data):
+@perf_timed
+def calculate_dew_point_section_results(weather_data):
     """
-    Display dew point section in the weather dashboard
+    Compute the statistics and figures of the dew point section
 
     Parameters:
-    weather_data (pd.DataFrame): DataFrame containing weather data
+    weather_data (pd.DataFrame): Weather data cleaned by clean_weather_data
     """
-    st.write("### Dew Point Analysis")
-
-    # Handle missing data
-    weather_data = handle_missing_data(weather_data, "dew_point")
-    weather_data = handle_missing_data(weather_data, "humidity")
+    results = {}
 
     # Dew point statistics
-    st.write("#### Dew Point Statistics")
-    dew_stats = calculate_dew_point_stats(weather_data, "dew_point")
-    st.write(dew_stats)
+    results["dew_stats"] = calculate_dew_point_stats(weather_data, "dew_point")
 
     # Dew point time series
-    st.write("#### Dew Point Over Time")
-    dew_fig = create_time_series_chart(
-        weather_data,
-        "dew_point",
-        "Dew Point Over Time",
-        "Dew Point (°C)",
-        color="green",
+    results["dew_fig"] = figure_to_png(
+        create_time_series_chart(
+            weather_data,
+            "dew_point",
+            "Dew Point Over Time",
+            "Dew Point (°C)",
+            color="green",
+        )
     )
-    st.pyplot(dew_fig)
 
     # Dew point vs Temperature
+    results["temperature_fig"] = None
     if "temp" in weather_data.columns:
-        st.write("#### Dew Point vs. Temperature")
         fig, ax = plt.subplots(figsize=(12, 6))
         weather_data["dew_point"].plot(
             ax=ax, label="Dew Point", color="green", alpha=0.7
@@ -51,11 +48,12 @@ def dew_point_section(weather_data):
         ax.set_ylabel("Temperature (°C)")
         ax.legend()
         ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
+        results["temperature_fig"] = figure_to_png(fig)
 
     # Dew point vs Humidity scatter plot
+    results["humidity_fig"] = None
+    results["trend_line_failed"] = False
     if "humidity" in weather_data.columns:
-        st.write("#### Dew Point vs. Humidity")
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.scatter(
             weather_data["humidity"],
@@ -72,28 +70,24 @@ def dew_point_section(weather_data):
         try:
             z = np.polyfit(weather_data["humidity"], weather_data["dew_point"], 1)
             p = np.poly1d(z)
-            ax.plot(
-                weather_data["humidity"], p(weather_data["humidity"]), "r--", alpha=0.8
+            # A straight line only needs its end points
+            humidity_range = np.array(
+                [weather_data["humidity"].min(), weather_data["humidity"].max()]
             )
+            ax.plot(humidity_range, p(humidity_range), "r--", alpha=0.8)
         except:
-            st.write(
-                "Could not calculate trend line due to insufficient or invalid data."
-            )
+            results["trend_line_failed"] = True
 
-        st.pyplot(fig)
+        results["humidity_fig"] = figure_to_png(fig)
 
     # Dew point distribution
-    st.write("#### Dew Point Distribution")
     fig, ax = plt.subplots(figsize=(10, 6))
     weather_data["dew_point"].hist(bins=20, ax=ax, color="green", alpha=0.7)
     ax.set_title("Dew Point Distribution")
     ax.set_xlabel("Dew Point (°C)")
     ax.set_ylabel("Frequency")
     ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
-
-    # Dew point comfort levels
-    st.write("#### Dew Point Comfort Levels")
+    results["distribution_fig"] = figure_to_png(fig)
 
     # Define dew point comfort categories
     comfort_categories = {
@@ -117,5 +111,45 @@ def dew_point_section(weather_data):
         list(comfort_categories.items()), columns=["Comfort Level", "Days"]
     )
     comfort_df["Percentage"] = comfort_df["Days"] / comfort_df["Days"].sum() * 100
+    results["comfort_df"] = comfort_df
+
+    return results
+
+
+@perf_timed
+def dew_point_section(weather_data, results=None):
+    """
+    Display dew point section in the weather dashboard
 
-    st.write(comfort_df)
+    Parameters:
+    weather_data (pd.DataFrame): DataFrame containing weather data
+    results (dict): Precomputed output of calculate_dew_point_section_results
+    """
+    if results is None:
+        results = calculate_dew_point_section_results(clean_weather_data(weather_data))
+
+    st.write("### Dew Point Analysis")
+
+    st.write("#### Dew Point Statistics")
+    st.write(results["dew_stats"])
+
+    st.write("#### Dew Point Over Time")
+    st.image(results["dew_fig"])
+
+    if results["temperature_fig"] is not None:
+        st.write("#### Dew Point vs. Temperature")
+        st.image(results["temperature_fig"])
+
+    if results["humidity_fig"] is not None:
+        st.write("#### Dew Point vs. Humidity")
+        if results["trend_line_failed"]:
+            st.write(
+                "Could not calculate trend line due to insufficient or invalid data."
+            )
+        st.image(results["humidity_fig"])
+
+    st.write("#### Dew Point Distribution")
+    st.image(results["distribution_fig"])
+
+    st.write("#### Dew Point Comfort Levels")
+    st.write(results["comfort_df"])
@@ -4,41 +4,36 @@ import pandas as pd
 import numpy as np
 from src.utils.weather_helpers import (
     calculate_temperature_stats,
-    handle_missing_data,
+    clean_weather_data,
     create_time_series_chart,
 )
+from src.utils.streamlit_section_cache import figure_to_png
+from src.utils.perf_trace import perf_timed
 
 
-def temperature_section(weather_data):
+@perf_timed
+def calculate_temperature_section_results(weather_data):
     """
-    Display temperature section in the weather dashboard
+    Compute the statistics and figures of the temperature section
 
     Parameters:
-    weather_data (pd.DataFrame): DataFrame containing weather data
+    weather_data (pd.DataFrame): Weather data cleaned by clean_weather_data
     """
-    st.write("### Temperature Analysis")
-
-    # Handle missing data
-    weather_data = handle_missing_data(weather_data, "temp")
-    weather_data = handle_missing_data(weather_data, "feels_like")
-    weather_data = handle_missing_data(weather_data, "temp_min")
-    weather_data = handle_missing_data(weather_data, "temp_max")
+    results = {}
 
     # Temperature statistics
-    st.write("#### Temperature Statistics")
-    temp_stats = calculate_temperature_stats(weather_data, "temp")
-    st.write(temp_stats)
+    results["temp_stats"] = calculate_temperature_stats(weather_data, "temp")
 
     # Temperature time series
-    st.write("#### Temperature Over Time")
-    temp_fig = create_time_series_chart(
-        weather_data, "temp", "Temperature Over Time", "Temperature (°K)", color="red"
+    results["temp_fig"] = figure_to_png(
+        create_time_series_chart(
+            weather_data, "temp", "Temperature Over Time", "Temperature (°K)", color="red"
+        )
     )
-    st.pyplot(temp_fig)
 
     # Temperature vs Feels Like
+    results["feels_like_fig"] = None
     if "feels_like" in weather_data.columns:
-        st.write("#### Temperature vs. Feels Like")
         fig, ax = plt.subplots(figsize=(12, 6))
         weather_data["temp"].plot(
             ax=ax, label="Actual Temperature", color="red", alpha=0.7
@@ -51,11 +46,11 @@ def temperature_section(weather_data):
         ax.set_ylabel("Temperature (°K)")
         ax.legend()
         ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
+        results["feels_like_fig"] = figure_to_png(fig)
 
     # Min-Max Temperature Range
+    results["range_fig"] = None
     if "temp_min" in weather_data.columns and "temp_max" in weather_data.columns:
-        st.write("#### Daily Temperature Range")
         fig, ax = plt.subplots(figsize=(12, 6))
 
         # Create a sample of data points to avoid overcrowding the chart
@@ -69,15 +64,14 @@ def temperature_section(weather_data):
         # Sort by date for better visualization
         sampled_data = sampled_data.sort_index()
 
-        # Plot temperature range
-        for idx, row in sampled_data.iterrows():
-            ax.vlines(
-                x=idx,
-                ymin=row["temp_min"],
-                ymax=row["temp_max"],
-                color="blue",
-                alpha=0.5,
-            )
+        # Plot temperature range, all samples in one call
+        ax.vlines(
+            x=sampled_data.index,
+            ymin=sampled_data["temp_min"],
+            ymax=sampled_data["temp_max"],
+            color="blue",
+            alpha=0.5,
+        )
 
         sampled_data["temp"].plot(
             ax=ax, color="red", marker="o", linestyle="", alpha=0.7, label="Actual Temp"
@@ -88,14 +82,47 @@ def temperature_section(weather_data):
         ax.set_ylabel("Temperature (°K)")
         ax.legend()
         ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
+        results["range_fig"] = figure_to_png(fig)
 
     # Temperature distribution
-    st.write("#### Temperature Distribution")
     fig, ax = plt.subplots(figsize=(10, 6))
     weather_data["temp"].hist(bins=20, ax=ax, color="red", alpha=0.7)
     ax.set_title("Temperature Distribution")
     ax.set_xlabel("Temperature (°K)")
     ax.set_ylabel("Frequency")
     ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
+    results["distribution_fig"] = figure_to_png(fig)
+
+    return results
+
+
+@perf_timed
+def temperature_section(weather_data, results=None):
+    """
+    Display temperature section in the weather dashboard
+
+    Parameters:
+    weather_data (pd.DataFrame): DataFrame containing weather data
+    results (dict): Precomputed output of calculate_temperature_section_results
+    """
+    if results is None:
+        results = calculate_temperature_section_results(clean_weather_data(weather_data))
+
+    st.write("### Temperature Analysis")
+
+    st.write("#### Temperature Statistics")
+    st.write(results["temp_stats"])
+
+    st.write("#### Temperature Over Time")
+    st.image(results["temp_fig"])
+
+    if results["feels_like_fig"] is not None:
+        st.write("#### Temperature vs. Feels Like")
+        st.image(results["feels_like_fig"])
+
+    if results["range_fig"] is not None:
+        st.write("#### Daily Temperature Range")
+        st.image(results["range_fig"])
+
+    st.write("#### Temperature Distribution")
+    st.image(results["distribution_fig"])
@@ -4,41 +4,36 @@ import pandas as pd
 import numpy as np
 from src.utils.weather_helpers import (
     calculate_visibility_stats,
-    handle_missing_data,
+    clean_weather_data,
     create_time_series_chart,
 )
+from src.utils.streamlit_section_cache import figure_to_png
+from src.utils.perf_trace import perf_timed
 
 
-def visibility_section(weather_data):
+@perf_timed
+def calculate_visibility_section_results(weather_data):
     """
-    Display visibility section in the weather dashboard
+    Compute the statistics and figures of the visibility section
 
     Parameters:
-    weather_data (pd.DataFrame): DataFrame containing weather data
+    weather_data (pd.DataFrame): Weather data cleaned by clean_weather_data
     """
-    st.write("### Visibility Analysis")
-
-    # Handle missing data
-    weather_data = handle_missing_data(weather_data, "visibility")
+    results = {}
 
     # Visibility statistics
-    st.write("#### Visibility Statistics")
-    visibility_stats = calculate_visibility_stats(weather_data, "visibility")
-    st.write(visibility_stats)
+    results["visibility_stats"] = calculate_visibility_stats(weather_data, "visibility")
 
     # Visibility time series
-    st.write("#### Visibility Over Time")
-    visibility_fig = create_time_series_chart(
-        weather_data,
-        "visibility",
-        "Visibility Over Time",
-        "Visibility (m)",
-        color="skyblue",
+    results["visibility_fig"] = figure_to_png(
+        create_time_series_chart(
+            weather_data,
+            "visibility",
+            "Visibility Over Time",
+            "Visibility (m)",
+            color="skyblue",
+        )
     )
-    st.pyplot(visibility_fig)
-
-    # Visibility categories
-    st.write("#### Visibility Categories")
 
     # Define visibility categories
     visibility_categories = {
@@ -56,7 +51,6 @@ def visibility_section(weather_data):
     }
 
     # Create pie chart for visibility categories
-    fig, ax = plt.subplots(figsize=(10, 6))
     labels = list(visibility_categories.keys())
     sizes = list(visibility_categories.values())
 
@@ -65,7 +59,9 @@ def visibility_section(weather_data):
     labels = [labels[i] for i in non_zero_indices]
     sizes = [sizes[i] for i in non_zero_indices]
 
+    results["categories_fig"] = None
     if len(sizes) > 0:
+        fig, ax = plt.subplots(figsize=(10, 6))
         ax.pie(
             sizes,
             labels=labels,
@@ -75,16 +71,45 @@ def visibility_section(weather_data):
         )
         ax.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle
         ax.set_title("Distribution of Visibility Categories")
-        st.pyplot(fig)
-    else:
-        st.write("No visibility data available for categorization.")
+        results["categories_fig"] = figure_to_png(fig)
 
     # Visibility distribution
-    st.write("#### Visibility Distribution")
     fig, ax = plt.subplots(figsize=(10, 6))
     weather_data["visibility"].hist(bins=20, ax=ax, color="skyblue", alpha=0.7)
     ax.set_title("Visibility Distribution")
     ax.set_xlabel("Visibility (m)")
     ax.set_ylabel("Frequency")
     ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
+    results["distribution_fig"] = figure_to_png(fig)
+
+    return results
+
+
+@perf_timed
+def visibility_section(weather_data, results=None):
+    """
+    Display visibility section in the weather dashboard
+
+    Parameters:
+    weather_data (pd.DataFrame): DataFrame containing weather data
+    results (dict): Precomputed output of calculate_visibility_section_results
+    """
+    if results is None:
+        results = calculate_visibility_section_results(clean_weather_data(weather_data))
+
+    st.write("### Visibility Analysis")
+
+    st.write("#### Visibility Statistics")
+    st.write(results["visibility_stats"])
+
+    st.write("#### Visibility Over Time")
+    st.image(results["visibility_fig"])
+
+    st.write("#### Visibility Categories")
+    if results["categories_fig"] is not None:
+        st.image(results["categories_fig"])
+    else:
+        st.write("No visibility data available for categorization.")
+
+    st.write("#### Visibility Distribution")
+    st.image(results["distribution_fig"])
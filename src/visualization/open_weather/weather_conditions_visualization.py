@@ -2,25 +2,64 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-from src.utils.weather_helpers import get_weather_summary, handle_missing_data
+from src.utils.weather_helpers import get_weather_summary, clean_weather_data
+from src.utils.streamlit_section_cache import figure_to_png
+from src.utils.perf_trace import perf_timed
 
 
-def weather_conditions_section(weather_data):
+def plot_daily_weather_conditions(weather_data):
     """
-    Display weather conditions section in the weather dashboard
+    Stacked daily weather condition counts, as PNG bytes (None without data)
 
-    Parameters:
-    weather_data (pd.DataFrame): DataFrame containing weather data
+    Each condition is one filled step polygon spanning its days, instead of a
+    labelled bar patch per day and condition.
     """
-    st.write("### Weather Conditions Analysis")
+    # Resample to daily frequency to avoid overcrowding
+    daily_counts = (
+        weather_data.groupby([weather_data.index.normalize(), "weather_main"])
+        .size()
+        .unstack(fill_value=0)
+    )
+    if daily_counts.empty:
+        return None
+
+    fig, ax = plt.subplots(figsize=(14, 7))
+    condition_colors = plt.get_cmap("viridis")(np.linspace(0, 1, len(daily_counts.columns)))
+    # Each day's step spans [day, next day); the last value is repeated to close the last step
+    day_edges = daily_counts.index.append(daily_counts.index[-1:] + pd.Timedelta(days=1))
+    bottom = np.zeros(len(daily_counts) + 1)
+    for condition, color in zip(daily_counts.columns, condition_colors):
+        counts = daily_counts[condition].to_numpy()
+        top = bottom + np.append(counts, counts[-1])
+        ax.fill_between(day_edges, bottom, top, step="post", color=color, label=condition)
+        bottom = top
+    ax.set_title("Daily Weather Conditions")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Count")
+    ax.legend(title="Weather Condition", loc="upper right")
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    return figure_to_png(fig)
+
+
+@perf_timed
+def calculate_weather_conditions_section_results(weather_data):
+    """
+    Compute the tables and figures of the weather conditions section
 
-    # Handle missing data
-    for col in ["weather_main", "weather_description", "weather_id"]:
-        if col in weather_data.columns:
-            weather_data = handle_missing_data(weather_data, col)
+    Parameters:
+    weather_data (pd.DataFrame): Weather data cleaned by clean_weather_data
+    """
+    results = {
+        "summary_df": None,
+        "summary_fig": None,
+        "daily_fig": None,
+        "desc_df": None,
+        "cat_df": None,
+        "category_fig": None,
+    }
 
     # Weather conditions summary
-    st.write("#### Weather Conditions Summary")
     if "weather_main" in weather_data.columns:
         weather_summary = get_weather_summary(weather_data, "weather_main")
 
@@ -30,7 +69,7 @@ def weather_conditions_section(weather_data):
         summary_df["Percentage"] = (
             summary_df["Count"] / summary_df["Count"].sum() * 100
         ).round(2)
-        st.write(summary_df)
+        results["summary_df"] = summary_df
 
         # Display as pie chart
         fig, ax = plt.subplots(figsize=(10, 6))
@@ -42,39 +81,12 @@ def weather_conditions_section(weather_data):
         )
         ax.axis("equal")
         ax.set_title("Distribution of Weather Conditions")
-        st.pyplot(fig)
-    else:
-        st.write("No weather condition data available.")
-
-    # Weather conditions over time
-    st.write("#### Weather Conditions Over Time")
-    if "weather_main" in weather_data.columns:
-        # Create a pivot table for weather conditions over time
-        # Resample to daily frequency to avoid overcrowding
-        daily_weather = weather_data.reset_index()
-        daily_weather["date"] = daily_weather["dt"].dt.date
-        daily_counts = (
-            daily_weather.groupby(["date", "weather_main"]).size().unstack(fill_value=0)
-        )
+        results["summary_fig"] = figure_to_png(fig)
 
-        # Plot stacked bar chart for weather conditions over time
-        if not daily_counts.empty:
-            fig, ax = plt.subplots(figsize=(14, 7))
-            daily_counts.plot(kind="bar", stacked=True, ax=ax, colormap="viridis")
-            ax.set_title("Daily Weather Conditions")
-            ax.set_xlabel("Date")
-            ax.set_ylabel("Count")
-            ax.legend(title="Weather Condition")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            st.pyplot(fig)
-        else:
-            st.write("Insufficient data for daily weather conditions chart.")
-    else:
-        st.write("No weather condition data available for time series analysis.")
+        # Stacked daily counts of weather conditions over time
+        results["daily_fig"] = plot_daily_weather_conditions(weather_data)
 
     # Weather descriptions
-    st.write("#### Detailed Weather Descriptions")
     if "weather_description" in weather_data.columns:
         # Get unique descriptions and their counts
         desc_counts = weather_data["weather_description"].value_counts()
@@ -83,18 +95,13 @@ def weather_conditions_section(weather_data):
         desc_df["Percentage"] = (desc_df["Count"] / desc_df["Count"].sum() * 100).round(
             2
         )
-
-        # Display top 10 descriptions
-        st.write("Top 10 Weather Descriptions:")
-        st.write(desc_df.head(10))
-    else:
-        st.write("No detailed weather description data available.")
+        results["desc_df"] = desc_df
 
     # Weather IDs analysis
-    st.write("#### Weather ID Analysis")
     if "weather_id" in weather_data.columns:
         # Group weather IDs by their first digit (weather category)
-        weather_data["weather_category"] = weather_data["weather_id"].astype(str).str[0]
+        # (local series: the cleaned frame is shared with the other sections)
+        weather_category = weather_data["weather_id"].astype(str).str[0]
         category_map = {
             "2": "Thunderstorm",
             "3": "Drizzle",
@@ -104,19 +111,14 @@ def weather_conditions_section(weather_data):
             "8": "Clear/Clouds",
             "9": "Extreme",
         }
-        weather_data["weather_category_name"] = (
-            weather_data["weather_category"].map(category_map).fillna("Other")
-        )
+        weather_category_name = weather_category.map(category_map).fillna("Other")
 
         # Count by category
-        category_counts = weather_data["weather_category_name"].value_counts()
+        category_counts = weather_category_name.value_counts()
         cat_df = pd.DataFrame(category_counts).reset_index()
         cat_df.columns = ["Category", "Count"]
         cat_df["Percentage"] = (cat_df["Count"] / cat_df["Count"].sum() * 100).round(2)
-
-        # Display as table
-        st.write("Weather Categories:")
-        st.write(cat_df)
+        results["cat_df"] = cat_df
 
         # Display as bar chart
         fig, ax = plt.subplots(figsize=(10, 6))
@@ -126,6 +128,56 @@ def weather_conditions_section(weather_data):
         ax.set_ylabel("Count")
         plt.xticks(rotation=45)
         plt.tight_layout()
-        st.pyplot(fig)
+        results["category_fig"] = figure_to_png(fig)
+
+    return results
+
+
+@perf_timed
+def weather_conditions_section(weather_data, results=None):
+    """
+    Display weather conditions section in the weather dashboard
+
+    Parameters:
+    weather_data (pd.DataFrame): DataFrame containing weather data
+    results (dict): Precomputed output of calculate_weather_conditions_section_results
+    """
+    if results is None:
+        results = calculate_weather_conditions_section_results(clean_weather_data(weather_data))
+
+    st.write("### Weather Conditions Analysis")
+
+    # Weather conditions summary
+    st.write("#### Weather Conditions Summary")
+    if results["summary_df"] is not None:
+        st.write(results["summary_df"])
+        st.image(results["summary_fig"])
+    else:
+        st.write("No weather condition data available.")
+
+    # Weather conditions over time
+    st.write("#### Weather Conditions Over Time")
+    if results["summary_df"] is None:
+        st.write("No weather condition data available for time series analysis.")
+    elif results["daily_fig"] is not None:
+        st.image(results["daily_fig"])
+    else:
+        st.write("Insufficient data for daily weather conditions chart.")
+
+    # Weather descriptions
+    st.write("#### Detailed Weather Descriptions")
+    if results["desc_df"] is not None:
+        # Display top 10 descriptions
+        st.write("Top 10 Weather Descriptions:")
+        st.write(results["desc_df"].head(10))
+    else:
+        st.write("No detailed weather description data available.")
+
+    # Weather IDs analysis
+    st.write("#### Weather ID Analysis")
+    if results["cat_df"] is not None:
+        st.write("Weather Categories:")
+        st.write(results["cat_df"])
+        st.image(results["category_fig"])
     else:
         st.write("No weather ID data available.")
@@ -8,23 +8,63 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.utils.data_reader import read_filtered_weather_open_weather_data_file
-from src.visualization.open_weather.temperature_visualization import temperature_section
-from src.visualization.open_weather.visibility_visualization import visibility_section
-from src.visualization.open_weather.dew_point_visualization import dew_point_section
+from src.config.openweather_weather_constants import openweather_data_file
+from src.utils.streamlit_data_cache import (
+    load_weather_open_weather_data,
+    get_weather_data_fingerprint,
+)
+from src.utils.streamlit_section_cache import select_section, cached_section_results
+from src.utils.streamlit_data_viewer import paginated_data_viewer
+from src.utils.weather_helpers import clean_weather_data
+from src.visualization.open_weather.temperature_visualization import (
+    temperature_section,
+    calculate_temperature_section_results,
+)
+from src.visualization.open_weather.visibility_visualization import (
+    visibility_section,
+    calculate_visibility_section_results,
+)
+from src.visualization.open_weather.dew_point_visualization import (
+    dew_point_section,
+    calculate_dew_point_section_results,
+)
 from src.visualization.open_weather.weather_conditions_visualization import (
     weather_conditions_section,
+    calculate_weather_conditions_section_results,
+)
+from src.visualization.open_weather.clouds_visualization import (
+    clouds_section,
+    calculate_clouds_section_results,
 )
-from src.visualization.open_weather.clouds_visualization import clouds_section
+
+weather_data_file = openweather_data_file
+
+# Section name -> (results computation, renderer)
+weather_sections = {
+    "Temperature": (calculate_temperature_section_results, temperature_section),
+    "Visibility": (calculate_visibility_section_results, visibility_section),
+    "Dew Point": (calculate_dew_point_section_results, dew_point_section),
+    "Weather Conditions": (
+        calculate_weather_conditions_section_results,
+        weather_conditions_section,
+    ),
+    "Clouds": (calculate_clouds_section_results, clouds_section),
+}
+
+max_cleaned_ranges = 8
+
+
+@st.cache_resource(max_entries=max_cleaned_ranges, show_spinner=False)
+def get_cleaned_weather_data(start_date, end_date, data_fingerprint, _filtered_data):
+    """Gap-filled weather data of one date range, built once and shared read-only by all sections"""
+    return clean_weather_data(_filtered_data)
 
 
 def weather_dashboard_open_weather():
     st.title("Weather Dashboard - Open Weather")
 
     # Read data
-    weather_data = read_filtered_weather_open_weather_data_file(
-        "FormulaHouse-Jan2023-Sep2024.csv"
-    )
+    weather_data = load_weather_open_weather_data(weather_data_file)
 
     # Overview
     st.write("## Weather Data")
@@ -39,31 +79,30 @@ def weather_dashboard_open_weather():
     # Filter data
     filtered_data = weather_data.loc[start_date:end_date]
 
-    # Show data sample
+    data_fingerprint = get_weather_data_fingerprint(weather_data_file)
+
+    # Show data sample, one page at a time
     with st.expander("View Data Sample"):
-        st.write(filtered_data)
+        paginated_data_viewer(
+            filtered_data,
+            key="weather_data_sample",
+            cache_key=(str(start_date), str(end_date), data_fingerprint),
+        )
 
-    # Add tabs for different sections
-    tabs = st.tabs(
-        ["Temperature", "Visibility", "Dew Point", "Weather Conditions", "Clouds"]
+    # Missing values are interpolated once per date range for all sections
+    cleaned_data = get_cleaned_weather_data(
+        str(start_date), str(end_date), data_fingerprint, filtered_data
     )
 
-    # Temperature Section
-    with tabs[0]:
-        temperature_section(filtered_data)
-
-    # Visibility Section
-    with tabs[1]:
-        visibility_section(filtered_data)
-
-    # Dew Point Section
-    with tabs[2]:
-        dew_point_section(filtered_data)
-
-    # Weather Conditions Section
-    with tabs[3]:
-        weather_conditions_section(filtered_data)
-
-    # Clouds Section
-    with tabs[4]:
-        clouds_section(filtered_data)
+    # Only the selected section is computed; its results are cached per date range
+    section_name = select_section(list(weather_sections), key="weather_section")
+    calculate_section, render_section = weather_sections[section_name]
+    results = cached_section_results(
+        section_name,
+        start_date,
+        end_date,
+        data_fingerprint,
+        calculate_section,
+        cleaned_data,
+    )
+    render_section(cleaned_data, results)
@@ -0,0 +1,77 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the project as the dashboards do, from the repository root
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(project_root)
+
+# Span of the synthetic site the data fixtures read
+synthetic_start = "2024-01-01"
+synthetic_end = "2024-01-06"
+
+
+@pytest.fixture(scope="session")
+def synthetic_site(tmp_path_factory):
+    """Directory of one synthetic site written by ``benchmarks.synthetic_data``"""
+    from benchmarks.synthetic_data import generate_site
+
+    site_directory = str(tmp_path_factory.mktemp("site"))
+    generate_site(site_directory, synthetic_start, synthetic_end)
+    return site_directory
+
+
+@pytest.fixture(scope="session")
+def studer_data_dir(synthetic_site):
+    return os.path.join(synthetic_site, "studer")
+
+
+@pytest.fixture(scope="session")
+def enphase_file(synthetic_site):
+    from src.config.enphase_constants import enphase_15min_file
+
+    # The readers join file names onto data/sample; absolute paths are kept as they are
+    return os.path.join(synthetic_site, "enphase", enphase_15min_file)
+
+
+@pytest.fixture(scope="session")
+def weather_file(synthetic_site):
+    from src.config.openweather_weather_constants import openweather_data_file
+
+    return os.path.join(synthetic_site, "weather", openweather_data_file)
+
+
+@pytest.fixture(scope="session")
+def raw_studer_data(studer_data_dir):
+    from src.utils.data_reader import read_raw_studer_data_directory
+
+    return read_raw_studer_data_directory(studer_data_dir)
+
+
+@pytest.fixture(scope="session")
+def studer_data(raw_studer_data):
+    from src.utils.data_reader import filter_studer_data
+
+    return filter_studer_data(raw_studer_data)
+
+
+@pytest.fixture(scope="session")
+def enphase_data(enphase_file):
+    from src.utils.data_reader import read_enphase_15min_data_file
+
+    return read_enphase_15min_data_file(enphase_file)
+
+
+@pytest.fixture(scope="session")
+def weather_data(weather_file):
+    from src.utils.data_reader import read_filtered_weather_open_weather_data_file
+
+    return read_filtered_weather_open_weather_data_file(weather_file)
+
+
+@pytest.fixture(scope="session")
+def hourly_data(studer_data_dir, enphase_file, weather_file):
+    from src.modeling.feature_pipeline import build_merged_hourly_data
+
+    return build_merged_hourly_data(studer_data_dir, enphase_file, weather_file)
@@ -0,0 +1,37 @@
+"""The home page starts without the dashboards' heavy dependencies."""
+import os
+import subprocess
+import sys
+
+from benchmarks.startup_import_report import heavy_packages
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+home_script = os.path.join(project_root, "src", "visualization", "home.py")
+
+
+def imported_modules(*args):
+    """Modules a fresh interpreter imports when run with ``args``, from ``-X importtime``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "[us]" not in line
+    }
+
+
+def test_home_page_skips_heavy_packages():
+    modules = imported_modules(home_script)
+    heavy = sorted({name.split(".")[0] for name in modules} & set(heavy_packages))
+    assert not heavy, f"home page imports {', '.join(heavy)}"
+
+    # Streamlit itself imports plotly to register its chart theme; the home
+    # page must not import any part of it beyond that
+    streamlit_modules = imported_modules("-c", "import streamlit")
+    plotly_modules = sorted(name for name in modules - streamlit_modules if name.split(".")[0] == "plotly")
+    assert not plotly_modules, f"home page imports {', '.join(plotly_modules)}"
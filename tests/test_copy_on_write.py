@@ -0,0 +1,203 @@
+"""
+The analytics functions leave their input frames unchanged, with and without
+Copy-on-Write, and rendering the grid dashboard peaks lower than it did with
+the copying implementations they replaced.
+"""
+import gc
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.modeling_constants import feature_lag_columns, hourly_lags, hourly_windows
+from src.config.pq_parameter_constants import maximum_voltage_allowed, minimum_voltage_allowed
+from src.utils import data_processing, feature_engineering, grid_metrics_helpers, studer_data_helpers
+from src.utils.data_reader import filter_studer_data
+from src.utils.grid_section_metrics import grid_section_metrics
+from src.utils.pq_metrics_helpers import calculate_long_duration_voltage_variation, calculate_power_frequency_variation
+from src.utils.weather_helpers import clean_weather_data, handle_missing_data
+
+
+def _timed_hourly(frames):
+    return feature_engineering.add_time_features(frames["hourly"].reset_index(), "timestamp").set_index("timestamp")
+
+
+# (name, function, builder of its arguments from the sample frames)
+input_checks = [
+    ("filter_studer_data", filter_studer_data, lambda frames: (frames["raw_studer"],)),
+    (
+        "calculate_long_duration_voltage_variation",
+        calculate_long_duration_voltage_variation,
+        lambda frames: (frames["studer"], "Grid Input Voltage - L1"),
+    ),
+    (
+        "calculate_power_frequency_variation",
+        calculate_power_frequency_variation,
+        lambda frames: (frames["studer"], "Grid Input Frequency - L1"),
+    ),
+    ("handle_missing_data", handle_missing_data, lambda frames: (frames["weather"], "temp")),
+    ("clean_weather_data", clean_weather_data, lambda frames: (frames["weather"],)),
+    ("resample_numeric_data", data_processing.resample_numeric_data, lambda frames: (frames["enphase"],)),
+    (
+        "resample_numeric_categorical_data",
+        data_processing.resample_numeric_categorical_data,
+        lambda frames: (frames["weather"],),
+    ),
+    ("daily_totals", data_processing.daily_totals, lambda frames: (frames["enphase"],)),
+    ("daily_summary", data_processing.daily_summary, lambda frames: (frames["weather"],)),
+    (
+        "create_lag_and_rolling_features_for_columns",
+        feature_engineering.create_lag_and_rolling_features_for_columns,
+        lambda frames: (frames["hourly"], feature_lag_columns, hourly_lags, hourly_windows),
+    ),
+    (
+        "create_cyclical_features",
+        feature_engineering.create_cyclical_features,
+        lambda frames: (_timed_hourly(frames), "hour", 24),
+    ),
+    (
+        "add_time_features",
+        feature_engineering.add_time_features,
+        lambda frames: (frames["hourly"].reset_index(), "timestamp"),
+    ),
+    (
+        "add_time_of_day_features",
+        feature_engineering.add_time_of_day_features,
+        lambda frames: (_timed_hourly(frames), "hour"),
+    ),
+    (
+        "add_weather_severity_feature",
+        feature_engineering.add_weather_severity_feature,
+        lambda frames: (frames["hourly"], "weather_main"),
+    ),
+    (
+        "add_weather_intensity_feature",
+        feature_engineering.add_weather_intensity_feature,
+        lambda frames: (frames["hourly"], "weather_description"),
+    ),
+    (
+        "add_net_export_import_grid_feature",
+        feature_engineering.add_net_export_import_grid_feature,
+        lambda frames: (frames["hourly"],),
+    ),
+] + [
+    (name, getattr(module, name), lambda frames: (frames["studer"],))
+    for module in [studer_data_helpers, grid_metrics_helpers]
+    for name in sorted(dir(module))
+    if name.startswith("get_") and name != "get_start_end_date"
+    or name.startswith("calculate_") and name != "calculate_stats"
+]
+
+
+@pytest.fixture(scope="module")
+def sample_frames(raw_studer_data, studer_data, enphase_data, weather_data, hourly_data):
+    return {
+        "raw_studer": raw_studer_data,
+        "studer": studer_data,
+        "enphase": enphase_data,
+        "weather": weather_data,
+        "hourly": hourly_data,
+    }
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True], ids=["default", "copy_on_write"])
+@pytest.mark.parametrize(
+    "function, arguments",
+    [(function, arguments) for _, function, arguments in input_checks],
+    ids=[name for name, _, _ in input_checks],
+)
+def test_input_unchanged(function, arguments, copy_on_write, sample_frames):
+    # Every call gets its own copies, so a function that mutates its input
+    # cannot affect the other cases
+    args = [arg.copy(deep=True) if isinstance(arg, pd.DataFrame) else arg for arg in arguments(sample_frames)]
+    snapshots = [arg.copy(deep=True) if isinstance(arg, pd.DataFrame) else arg for arg in args]
+
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        function(*args)
+
+    for arg, snapshot in zip(args, snapshots):
+        if isinstance(arg, pd.DataFrame):
+            pd.testing.assert_frame_equal(arg, snapshot)
+
+
+def _legacy_long_duration_voltage_variation(data, voltage_column):
+    # Converted and filled the caller's column in place, so callers copied first
+    data[voltage_column] = pd.to_numeric(data[voltage_column], errors="coerce")
+    mean_value = data[voltage_column].mean()
+    data.fillna({voltage_column: mean_value}, inplace=True)
+    means = data.groupby(np.arange(len(data)) // 10)[voltage_column].mean()
+    return means[(means <= minimum_voltage_allowed) | (means >= maximum_voltage_allowed)].count()
+
+
+def _legacy_getter(columns):
+    # Selection, fillna and astype each returned a full copy
+    def get_columns(data):
+        selected = data[columns]
+        selected = selected.fillna(0)
+        selected = selected.astype(float)
+        return selected
+
+    return get_columns
+
+
+# Implementations the grid sections used before the functions stopped copying
+legacy_implementations = {
+    calculate_long_duration_voltage_variation: _legacy_long_duration_voltage_variation,
+    studer_data_helpers.get_grid_input_voltages: _legacy_getter(
+        ["Grid Input Voltage - L1", "Grid Input Voltage - L2", "Grid Input Voltage - L3"]
+    ),
+    studer_data_helpers.get_grid_input_frequencies: _legacy_getter(
+        ["Grid Input Frequency - L1", "Grid Input Frequency - L2", "Grid Input Frequency - L3"]
+    ),
+    studer_data_helpers.get_studer_grid_status: _legacy_getter(
+        ["Studer Grid Status - L1", "Studer Grid Status - L2", "Studer Grid Status - L3"]
+    ),
+    studer_data_helpers.get_battery_state_of_charge: _legacy_getter("Battery State of Charge"),
+    studer_data_helpers.get_battery_internal_temperature: _legacy_getter("Battery Internal Temperature"),
+    studer_data_helpers.get_studer_grid_net_export_import: _legacy_getter(
+        [
+            "Studer Grid Net Export/Import - L1-1",
+            "Studer Grid Net Export/Import - L2-2",
+            "Studer Grid Net Export/Import - L3-3",
+        ]
+    ),
+}
+
+
+def use_legacy_implementations(monkeypatch):
+    """Replace every reference to the current functions in the project's modules"""
+    for module in list(sys.modules.values()):
+        if not getattr(module, "__name__", "").startswith("src."):
+            continue
+        for name, value in list(vars(module).items()):
+            if callable(value) and value in legacy_implementations:
+                monkeypatch.setattr(module, name, legacy_implementations[value])
+
+
+def grid_render_peak(studer_data, copy_on_write):
+    """tracemalloc peak bytes of computing every grid dashboard section from the loaded frame"""
+    # Garbage left by earlier tests or passes would otherwise be freed, or not,
+    # in the middle of the measurement
+    gc.collect()
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        tracemalloc.start()
+        filtered_studer_data = studer_data.loc[studer_data.index.min():studer_data.index.max()]
+        for compute in grid_section_metrics.values():
+            compute(filtered_studer_data)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak
+
+
+def test_grid_render_peak_memory_drops(studer_data, monkeypatch):
+    # The first pass warms up pandas' lazy imports and caches
+    grid_render_peak(studer_data.copy(), True)
+    peak_new = grid_render_peak(studer_data.copy(), True)
+
+    # The old code ran without Copy-on-Write, on a frame its voltage helper modified
+    use_legacy_implementations(monkeypatch)
+    peak_old = grid_render_peak(studer_data.copy(), False)
+
+    assert peak_new < peak_old, f"grid render peak {peak_new / 1e6:.2f} MB vs {peak_old / 1e6:.2f} MB before"
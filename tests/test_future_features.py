@@ -0,0 +1,34 @@
+"""Future feature rows match the rows the feature pipeline builds once the hours have passed."""
+import pandas as pd
+import pytest
+
+from src.modeling.feature_pipeline import build_hourly_features
+from src.modeling.future_features import (
+    build_future_features,
+    forecast_feature_columns,
+    forecastable_steps,
+)
+from src.modeling.training_runner import split_features_targets
+
+horizon = 24
+
+
+@pytest.fixture(scope="module")
+def hourly_features(hourly_data):
+    return build_hourly_features(hourly_data)
+
+
+def test_future_rows_match_pipeline_rows(hourly_features):
+    X, _ = split_features_targets(hourly_features)
+    columns = forecast_feature_columns(X.columns, horizon)
+    assert forecastable_steps(columns, horizon) == horizon
+
+    future = build_future_features(hourly_features.iloc[:-horizon], columns, horizon)
+    expected = hourly_features[columns].iloc[-horizon:]
+    pd.testing.assert_frame_equal(future, expected, check_dtype=False, check_freq=False)
+
+
+def test_observed_features_cannot_forecast(hourly_features):
+    X, _ = split_features_targets(hourly_features)
+    assert forecastable_steps(list(X.columns), horizon) == 0
+    assert forecastable_steps(["hour", "Energy Produced (Wh)_lag6"], horizon) == 6